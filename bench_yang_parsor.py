@@ -0,0 +1,1173 @@
+#!/usr/bin/env python3
+"""
+yang_parsor 성능 비교 스크립트
+
+사용법:
+    python3 bench_yang_parsor.py [YANG 디렉터리]
+    python3 bench_yang_parsor.py --synth [--sizes 1000,10000,100000] [--json result.json]
+                                 [--baseline baseline.json] [--tolerance 0.25] [--repeat 3]
+    python3 bench_yang_parsor.py --download [--download-mb 256]
+"""
+
+import argparse
+import collections
+import contextlib
+import hashlib
+import http.server
+import io
+import json
+import os
+import pty
+import random
+import re
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import yang_parsor
+import yang_synth
+import yang_validate
+
+
+def run_quiet(func, *args, **kwargs):
+    """stdout 출력을 버리고 함수 실행 시간(초)을 반환"""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def load_and_validate(directory, batch):
+    """파싱/검증 단계만 수행하고 소요 시간(초)을 반환"""
+    from pyang import context, repository
+
+    ctx = context.Context(repository.FileRepository(directory))
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        if batch:
+            yang_parsor.load_yang_files(ctx, directory)
+            ctx.validate()
+        else:
+            for filename in os.listdir(directory):
+                if filename.endswith('.yang'):
+                    with open(os.path.join(directory, filename), 'r', encoding='utf-8') as f:
+                        ctx.add_module(filename, f.read())
+                    ctx.validate()
+    return time.perf_counter() - start
+
+
+def bench_batch_vs_per_file(directory):
+    """파일마다 검증하는 방식과 한 번만 검증하는 batch 방식 비교"""
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, batch in (('per-file', False), ('batch', True)):
+            outputs = [os.path.join(tmp, f"{label}_{name}.txt")
+                       for name in ('node', 'rpc', 'notif')]
+            results[label] = (load_and_validate(directory, batch),
+                              run_quiet(yang_parsor.process_yang_directory,
+                                        directory, *outputs, batch=batch))
+
+    # batch 모드는 뒤에 로드된 모듈의 augment 까지 추출하므로 전체 시간은 참고용
+    print("[batch vs per-file validate]")
+    print(f"  {'mode':10s} {'validate':>9s} {'total':>9s}")
+    for label, (validate, total) in results.items():
+        print(f"  {label:10s} {validate:8.3f}s {total:8.3f}s")
+    print(f"  validate speedup {results['per-file'][0] / results['batch'][0]:.2f}x")
+    return results
+
+
+def bench_workers(directory, worker_counts=(1, 2, 4, 8)):
+    """workers 수에 따른 병렬 추출 시간 비교"""
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        outputs = [os.path.join(tmp, f"{name}.txt") for name in ('node', 'rpc', 'notif')]
+        results['serial'] = run_quiet(yang_parsor.process_yang_directory, directory, *outputs)
+        for workers in worker_counts:
+            results[workers] = run_quiet(yang_parsor.process_yang_directory,
+                                         directory, *outputs, workers=workers)
+
+    print(f"[process pool workers] (cpu {os.cpu_count()})")
+    for label, elapsed in results.items():
+        print(f"  {str(label):10s} {elapsed:8.3f}s  x{results['serial'] / elapsed:.2f}")
+    return results
+
+
+def legacy_extract_node_info(stmt, path="", module_name="", filename=""):
+    """재귀 + 자식마다 print 하던 이전 구현 (비교용)"""
+    current_path = f"{path}/{stmt.arg}" if path else stmt.arg
+    entries = []
+    entry = yang_parsor.format_node_entry(stmt, current_path, module_name, filename)
+    if entry is not None:
+        entries.append(entry)
+    for child in getattr(stmt, 'i_children', []):
+        print(f"child:{child.keyword}/{child.arg}")
+        entries.extend(legacy_extract_node_info(child, current_path, module_name, filename))
+    return entries
+
+
+@contextlib.contextmanager
+def attached_stdout(kind):
+    """sys.stdout 을 터미널(pty) 또는 파이프에 연결하고 반대편은 스레드로 비움"""
+    if kind == 'tty':
+        read_fd, write_fd = pty.openpty()
+    else:
+        read_fd, write_fd = os.pipe()
+
+    def drain():
+        try:
+            while os.read(read_fd, 65536):
+                pass
+        except OSError:
+            pass
+
+    reader = threading.Thread(target=drain, daemon=True)
+    reader.start()
+    # 터미널은 줄 단위, 파이프는 블록 단위 버퍼링 (파이썬 기본 동작과 동일)
+    stream = io.TextIOWrapper(os.fdopen(write_fd, 'wb'), encoding='utf-8',
+                              line_buffering=(kind == 'tty'))
+    saved = sys.stdout
+    sys.stdout = stream
+    try:
+        yield
+    finally:
+        sys.stdout = saved
+        stream.close()
+        reader.join(timeout=5)
+        os.close(read_fd)
+
+
+def bench_tree_walk(directory):
+    """재귀+print 구현과 반복 순회 구현을 tty / pipe stdout 에서 비교"""
+    from pyang import context, repository
+
+    ctx = context.Context(repository.FileRepository(directory))
+    with contextlib.redirect_stdout(io.StringIO()):
+        modules = yang_parsor.load_yang_files(ctx, directory)
+    ctx.validate()
+
+    def walk(extract):
+        start = time.perf_counter()
+        count = 0
+        for filename, module in modules:
+            for _ in extract(module, module_name=module.arg, filename=filename):
+                count += 1
+        return time.perf_counter() - start, count
+
+    print("[tree walk: recursive+print vs iterative]")
+    results = {}
+    for kind in ('tty', 'pipe'):
+        with attached_stdout(kind):
+            legacy, legacy_count = walk(legacy_extract_node_info)
+            iterative, count = walk(yang_parsor.extract_node_info)
+        assert legacy_count == count
+        results[kind] = (legacy, iterative)
+        print(f"  {kind:5s} recursive {legacy:8.3f}s  iterative {iterative:8.3f}s"
+              f"  x{legacy / iterative:.2f} ({count} nodes)")
+    return results
+
+
+def legacy_extra_node_info(leaf):
+    """search_one 을 반복 호출하던 이전 extra_node_info 와 같은 조회 패턴 (비교용)"""
+    info = {}
+    type_stmt = leaf.search_one('type')
+    if type_stmt:
+        info['type'] = type_stmt.arg
+        if type_stmt.arg == 'enumeration':
+            info['enum'] = [(e.arg,
+                             e.search_one('value').arg if e.search_one('value') else '',
+                             e.search_one('description').arg if e.search_one('description') else '')
+                            for e in type_stmt.search('enum')]
+        range_stmt = type_stmt.search_one('range') or type_stmt.search_one('length')
+        if range_stmt:
+            info['range/length'] = range_stmt.arg
+        frac_stmt = type_stmt.search_one('fraction-digits')
+        if frac_stmt:
+            info['fraction-digits'] = frac_stmt.arg
+    for keyword in ('when', 'units', 'mandatory', 'config', 'status',
+                    'default', 'description', 'if-feature'):
+        stmt = leaf.search_one(keyword)
+        if stmt:
+            info[keyword] = stmt.arg
+    return info
+
+
+def bench_substmt_index(directory, module_name=None, repeat=20):
+    """leaf 마다 search_one 반복 vs 한 번 만든 하위 문장 인덱스 조회 비교
+
+    module_name 이 없으면 leaf 가 가장 많은 모듈 (예: o-ran-uplane-conf) 을 고른다.
+    """
+    from pyang import context, repository
+
+    ctx = context.Context(repository.FileRepository(directory))
+    with contextlib.redirect_stdout(io.StringIO()):
+        modules = yang_parsor.load_yang_files(ctx, directory)
+    ctx.validate()
+
+    def leaves_of(module):
+        found = []
+        stack = [module]
+        while stack:
+            stmt = stack.pop()
+            if stmt.keyword == 'leaf':
+                found.append(stmt)
+            stack.extend(getattr(stmt, 'i_children', []))
+        return found
+
+    by_module = {module.arg: leaves_of(module) for _, module in modules}
+    if module_name is None:
+        module_name = max(by_module, key=lambda name: len(by_module[name]))
+    leaves = by_module[module_name]
+
+    def timed(func, reset):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            if reset:
+                for leaf in leaves:
+                    leaf.__dict__.pop('_substmt_index', None)
+                    for sub in leaf.substmts:
+                        sub.__dict__.pop('_substmt_index', None)
+            for leaf in leaves:
+                func(leaf)
+        return (time.perf_counter() - start) / (repeat * len(leaves)) * 1e6
+
+    legacy = timed(legacy_extra_node_info, reset=False)
+    cold = timed(yang_parsor.extra_node_info, reset=True)
+    warm = timed(yang_parsor.extra_node_info, reset=False)
+
+    print(f"[substatement index] {module_name} ({len(leaves)} leaves, us/leaf)")
+    print(f"  search_one   {legacy:8.2f}")
+    print(f"  index cold   {cold:8.2f}")
+    print(f"  index warm   {warm:8.2f}")
+    return legacy, cold, warm
+
+
+def legacy_get_source_code(filepath, line):
+    """호출마다 파일 전체를 readlines 하던 이전 구현 (비교용)"""
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+            return lines[line-1].strip() if 0 < line <= len(lines) else "N/A"
+    except Exception:
+        return "N/A"
+
+
+def bench_source_lookup(directory, module_name=None):
+    """노드마다 소스 줄 붙이기: readlines 반복 vs 줄 오프셋 인덱스 (가장 큰 모듈 기준)"""
+    from pyang import context, repository
+
+    ctx = context.Context(repository.FileRepository(directory))
+    with contextlib.redirect_stdout(io.StringIO()):
+        modules = yang_parsor.load_yang_files(ctx, directory)
+    ctx.validate()
+
+    def locations_of(module):
+        found = []
+        stack = [module]
+        while stack:
+            stmt = stack.pop()
+            if stmt.keyword in yang_parsor.NODE_KINDS and stmt.pos.ref:
+                found.append((os.path.join(directory, os.path.basename(stmt.pos.ref)), stmt.pos.line))
+            stack.extend(getattr(stmt, 'i_children', []))
+        return found
+
+    by_module = {module.arg: locations_of(module) for _, module in modules}
+    if module_name is None:
+        module_name = max(by_module, key=lambda name: len(by_module[name]))
+    locations = by_module[module_name]
+
+    start = time.perf_counter()
+    legacy = [legacy_get_source_code(filepath, line) for filepath, line in locations]
+    legacy_time = time.perf_counter() - start
+
+    yang_parsor.clear_source_cache()
+    start = time.perf_counter()
+    indexed = yang_parsor.get_source_lines(locations)
+    indexed_time = time.perf_counter() - start
+    assert legacy == indexed
+
+    print(f"[source lookup] {module_name} ({len(locations)} nodes)")
+    print(f"  readlines    {legacy_time:8.3f}s")
+    print(f"  line index   {indexed_time:8.3f}s  x{legacy_time / indexed_time:.1f}")
+    return legacy_time, indexed_time
+
+
+TEXT_FIELD_RE = re.compile(r'^(\d+)\.([^:]+): ?(.*)$')
+TEXT_ENUM_RE = re.compile(r'([^\s,]+)(?: \((?:value=(-?\d+))?(?:, )?(?:description=([^)]*))?\))?')
+
+
+def parse_text_entries(filepath):
+    """'---' 로 구분된 텍스트 출력을 정규식으로 다시 파싱하는 기존 소비자 방식 (비교용)"""
+    records = []
+    with open(filepath, 'r', encoding='utf-8') as f:
+        for chunk in f.read().split('\n---\n'):
+            if not chunk:
+                continue
+            record = {}
+            field = None
+            for line in chunk.split('\n'):
+                match = TEXT_FIELD_RE.match(line)
+                if match:
+                    field = match.group(2)
+                    record[field] = match.group(3)
+                elif field is not None:
+                    record[field] += '\n' + line
+            # 소비자가 필요로 하는 타입으로 변환
+            for field in ('Config', 'Mandatory'):
+                if field in record:
+                    record[field] = record[field] == 'true'
+            if 'Enum' in record:
+                record['Enum'] = [{'name': name, 'value': int(value) if value else None,
+                                   'description': desc}
+                                  for name, value, desc in TEXT_ENUM_RE.findall(record['Enum'])]
+            records.append(record)
+    return records
+
+
+def bench_jsonl_load(directory):
+    """텍스트 출력 재파싱 vs JSONL 로더 비교"""
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {}
+        for output_format in ('text', 'jsonl'):
+            outputs = [os.path.join(tmp, f"{name}.{output_format}") for name in ('node', 'rpc', 'notif')]
+            run_quiet(yang_parsor.process_yang_directory, directory, *outputs,
+                      output_format=output_format)
+            paths[output_format] = outputs
+
+        def best_of(func, repeat=5):
+            times = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                count = func()
+                times.append(time.perf_counter() - start)
+            return min(times), count
+
+        text_time, text_count = best_of(
+            lambda: sum(len(parse_text_entries(path)) for path in paths['text']))
+        jsonl_time, jsonl_count = best_of(
+            lambda: sum(1 for path in paths['jsonl'] for _ in yang_parsor.load_jsonl(path)))
+
+    print(f"[load dump] ({jsonl_count} records)")
+    print(f"  text regex   {text_time:8.3f}s ({text_count} entries)")
+    print(f"  jsonl        {jsonl_time:8.3f}s  x{text_time / jsonl_time:.1f}")
+    return text_time, jsonl_time
+
+
+def bench_type_resolver(directory):
+    """leaf 마다 typedef 체인을 새로 푸는 경우와 typedef/identity 캐시를 쓰는 경우 비교"""
+    from pyang import context, repository
+
+    ctx = context.Context(repository.FileRepository(directory))
+    with contextlib.redirect_stdout(io.StringIO()):
+        modules = yang_parsor.load_yang_files(ctx, directory)
+    ctx.validate()
+
+    type_stmts = []
+    for _, module in modules:
+        stack = [module]
+        while stack:
+            stmt = stack.pop()
+            if stmt.keyword == 'leaf':
+                type_stmt = stmt.search_one('type')
+                if type_stmt is not None:
+                    type_stmts.append(type_stmt)
+            stack.extend(getattr(stmt, 'i_children', []))
+
+    def timed(memo):
+        start = time.perf_counter()
+        resolved = [yang_parsor.resolve_type(type_stmt, memo) for type_stmt in type_stmts]
+        return time.perf_counter() - start, resolved
+
+    naive, naive_resolved = timed(memo=False)
+    for key in yang_parsor.TYPE_CACHE_STATS:
+        yang_parsor.TYPE_CACHE_STATS[key] = 0
+    memoized, memo_resolved = timed(memo=True)
+    assert naive_resolved == memo_resolved
+    stats = yang_parsor.type_cache_stats()
+
+    print(f"[type resolver] ({len(type_stmts)} leaves)")
+    print(f"  per-leaf     {naive:8.3f}s")
+    print(f"  memoized     {memoized:8.3f}s  x{naive / memoized:.1f}")
+    print(f"  typedef  hit {stats['hits']} / miss {stats['misses']} ({stats['hit_rate']:.1%})")
+    print(f"  identity hit {stats['identity_hits']} / miss {stats['identity_misses']}"
+          f" ({stats['identity_hit_rate']:.1%})")
+    return naive, memoized, stats
+
+
+def _format_walk_size(stmt):
+    """format_stmt_children 가 방문하는 문장 수"""
+    return sum(1 + (_format_walk_size(child) if child.keyword in ('container', 'list', 'leaf-list') else 0)
+               for child in getattr(stmt, 'i_children', []))
+
+
+def bench_single_pass(directory, repeat=5):
+    """세 추출기를 따로 돌리던 방식 vs walk_module 한 번 순회 (시간, 문장 방문 수)
+
+    한 번 순회의 방문 수가 i_children 트리 크기와 같은지 확인한다. 이전 방식의 방문 수는
+    노드 순회 + 최상위 rpc/notification 두 번 스캔 + format_stmt_children 재순회로 센다.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        modules = yang_parsor.load_validated_modules(directory)
+
+    tree_size = legacy_visits = 0
+    for _, module in modules:
+        stack = [module]
+        while stack:
+            stmt = stack.pop()
+            tree_size += 1
+            stack.extend(getattr(stmt, 'i_children', []))
+        legacy_visits += 2 * len(module.i_children)
+        for stmt in module.i_children:
+            if stmt.keyword == 'notification':
+                legacy_visits += _format_walk_size(stmt)
+            elif stmt.keyword == 'rpc':
+                index = yang_parsor.substmt_index(stmt)
+                legacy_visits += sum(_format_walk_size(index[part]) for part in ('input', 'output')
+                                     if index.get(part))
+    legacy_visits += tree_size
+
+    def separate():
+        for filename, module in modules:
+            collections.deque(yang_parsor.extract_node_info(module, module_name=module.arg,
+                                                            filename=filename), maxlen=0)
+            collections.deque(yang_parsor.extract_rpc_info(module, filename), maxlen=0)
+            collections.deque(yang_parsor.extract_notification_info(module, filename), maxlen=0)
+
+    def single():
+        for filename, module in modules:
+            for kind_entries in yang_parsor.module_entries(module, filename):
+                collections.deque(kind_entries, maxlen=0)
+
+    results = {}
+    for label, func in (('separate', separate), ('single', single)):
+        func()
+        results[label] = min(run_quiet(func) for _ in range(repeat))
+
+    before = yang_parsor.walk_stats()['visits']
+    single()
+    visits = yang_parsor.walk_stats()['visits'] - before
+    assert visits == tree_size, (visits, tree_size)
+
+    print(f"[single pass] (best of {repeat})")
+    print(f"  separate     {results['separate']:8.3f}s  visits {legacy_visits}")
+    print(f"  walk_module  {results['single']:8.3f}s  visits {visits} (= tree size)"
+          f"  x{results['separate'] / results['single']:.2f}")
+    return results
+
+
+def bench_instrumentation(directory, repeat=3):
+    """계측을 끈 경우와 켠 경우의 batch 처리 시간 비교 (best of repeat)"""
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        outputs = [os.path.join(tmp, f"{name}.txt") for name in ('node', 'rpc', 'notif')]
+        report = os.path.join(tmp, 'report.json')
+        for label, kwargs in (('off', {}), ('report', {'report': report})):
+            results[label] = min(run_quiet(yang_parsor.process_yang_directory,
+                                           directory, *outputs, **kwargs)
+                                 for _ in range(repeat))
+
+    print(f"[instrumentation overhead] (best of {repeat})")
+    for label, elapsed in results.items():
+        print(f"  {label:10s} {elapsed:8.3f}s  {elapsed / results['off'] - 1:+.1%}")
+    return results
+
+
+def bench_root_scope(directory, root=None, repeat=3):
+    """전체 추출 vs 루트 모듈 하나의 closure 만 로드하는 추출 (best of repeat)
+
+    root 가 없으면 가장 큰 .yang 파일의 모듈을 고른다.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        headers = yang_parsor.scan_yang_directory(directory)
+    if root is None:
+        largest = max(headers, key=lambda filename: os.path.getsize(os.path.join(directory, filename)))
+        root = headers[largest]['name']
+    closure = yang_parsor.scoped_files(headers, roots=[root])[1]
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        outputs = [os.path.join(tmp, f"{name}.txt") for name in ('node', 'rpc', 'notif')]
+        for label, kwargs in (('full', {}), ('root', {'roots': [root]})):
+            results[label] = min(run_quiet(yang_parsor.process_yang_directory,
+                                           directory, *outputs, **kwargs)
+                                 for _ in range(repeat))
+
+    print(f"[root scope] {root} (closure {len(closure)}/{len(headers)} files)")
+    print(f"  full         {results['full']:8.3f}s")
+    print(f"  root only    {results['root']:8.3f}s  {results['root'] / results['full']:.0%}")
+    return results
+
+
+def record_memory_child(directory, mode):
+    """(자식 프로세스용) 엔트리를 mode 방식으로 메모리에 모은 뒤 기록하고 peak RSS 를 출력
+
+    strings 는 기존처럼 엔트리 문자열 목록, model 은 extract_model 의 압축 표이다.
+    ru_maxrss 는 Linux 에서 KiB 단위이다.
+    """
+    def peak():
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        modules = yang_parsor.load_validated_modules(directory)
+    # substmt/type 캐시는 두 방식이 같이 만들므로 먼저 채워 두고 기준 peak 에 포함
+    for filename, module in modules:
+        for kind_entries in yang_parsor.module_entries(module, filename, 'jsonl'):
+            collections.deque(kind_entries, maxlen=0)
+    result = {'loaded': peak()}
+
+    start = time.perf_counter()
+    if mode == 'strings':
+        entries = [[], [], []]
+        for filename, module in modules:
+            for kind_entries, extracted in zip(entries, yang_parsor.module_entries(module, filename)):
+                kind_entries.extend(extracted)
+        result['nodes'] = len(entries[0])
+    else:
+        model = yang_parsor.extract_model(modules)
+        entries = model.entries()
+        result['nodes'] = len(model.nodes)
+    result['extract'] = time.perf_counter() - start
+    result['extracted'] = peak()
+
+    start = time.perf_counter()
+    with open(os.devnull, 'w', encoding='utf-8') as f:
+        for kind_entries in entries:
+            for entry in kind_entries:
+                f.write(entry + '\n---\n')
+    result['write'] = time.perf_counter() - start
+    result['written'] = peak()
+    print(json.dumps(result))
+
+
+def bench_record_memory(nodes=100000):
+    """엔트리 문자열 목록 vs 압축 표 (extract_model) 의 peak RSS (합성 코퍼스)
+
+    방식마다 새 프로세스에서 로드/검증 후 추출하고, 로드 직후 대비 늘어난 peak RSS 를 비교한다.
+    model 의 증가분에는 기록할 때 잠깐 만드는 엔트리 문자열도 포함된다.
+    """
+    params = dict(SYNTH_PARAMS)
+    modules = max(1, round(nodes / yang_synth.estimate_nodes(modules=1, **params)))
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        yang_synth.write_corpus(tmp, modules=modules, **params)
+        for mode in ('strings', 'model'):
+            code = f"import bench_yang_parsor; bench_yang_parsor.record_memory_child({tmp!r}, {mode!r})"
+            output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                                    cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout
+            results[mode] = json.loads(output.splitlines()[-1])
+
+    print(f"[record memory] {results['model']['nodes']} nodes, peak RSS (로드 후 증가분)")
+    for mode, label in (('strings', 'entry strings'), ('model', 'NodeTable')):
+        result = results[mode]
+        print(f"  {label:14s} extract {result['extract']:7.3f}s  write {result['write']:7.3f}s"
+              f"  peak {result['written'] / 1024:8.1f} MiB"
+              f"  (+{(result['written'] - result['loaded']) / 1024:.1f} MiB)")
+    return results
+
+
+def bench_snapshot(directory, repeat=3):
+    """스냅샷 없는 시작 (cold) vs 스냅샷 로드 (warm) 의 프로세스 시작~모델 준비 시간
+
+    매번 새 인터프리터에서 import 와 load_model 까지 재며, import 만 한 시간도 함께 출력한다.
+    """
+    cwd = os.path.dirname(os.path.abspath(__file__))
+
+    def startup(code):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], cwd=cwd, check=True, stdout=subprocess.DEVNULL)
+        return time.perf_counter() - start
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot = os.path.join(tmp, 'model.snapshot')
+        load = f"import yang_parsor; yang_parsor.load_model({directory!r}, {snapshot!r})"
+        results['import'] = min(startup("import yang_parsor") for _ in range(repeat))
+        cold = []
+        for _ in range(repeat):
+            if os.path.exists(snapshot):
+                os.remove(snapshot)
+            cold.append(startup(load))
+        results['cold'] = min(cold)
+        results['warm'] = min(startup(load) for _ in range(repeat))
+        results['load'] = min(run_quiet(yang_parsor.load_model, directory, snapshot)
+                              for _ in range(repeat))
+        size = os.path.getsize(snapshot)
+
+    print(f"[snapshot] 스냅샷 {size / 1024:.0f} KiB (best of {repeat}, 프로세스 시작 포함)")
+    print(f"  import only  {results['import']:8.3f}s")
+    print(f"  cold         {results['cold']:8.3f}s")
+    print(f"  warm         {results['warm']:8.3f}s  x{results['cold'] / results['warm']:.1f}")
+    print(f"  load_model   {results['load']:8.3f}s  (import 후 스냅샷 로드만)")
+    return results
+
+
+def percentiles(samples, points=(50, 90, 99)):
+    ordered = sorted(samples)
+    return {point: ordered[min(len(ordered) - 1, int(len(ordered) * point / 100))] for point in points}
+
+
+def bench_query_server(directory, clients=4, requests=4000, batch_size=32, seed=0):
+    """조회 데몬 (yang_server) 의 요청 지연 백분위와 처리량
+
+    서버를 Unix 소켓으로 띄우고 clients 개 스레드가 각자 연결 하나로 요청을 보낸다.
+    keypath 단건, keypath batch (batch_size 개씩), prefix (limit 20) 조회를 따로 잰다.
+    """
+    import yang_server
+
+    rng = random.Random(seed)
+    cwd = os.path.dirname(os.path.abspath(__file__))
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot = os.path.join(tmp, 'model.snapshot')
+        socket_path = os.path.join(tmp, 'yang.sock')
+        with contextlib.redirect_stdout(io.StringIO()):
+            model = yang_parsor.load_model(directory, snapshot)
+        keypaths = [model.nodes.keypath(row) for row in range(len(model.nodes))]
+        prefixes = [keypath.rsplit('/', 1)[0] for keypath in keypaths if keypath.count('/') > 1]
+
+        server = subprocess.Popen([sys.executable, 'yang_server.py', 'serve', directory,
+                                   '--snapshot', snapshot, '--socket', socket_path],
+                                  cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            yang_server.wait_for_server(socket_path)
+            workloads = (
+                ('keypath', 1, lambda: {'op': 'keypath', 'keypath': rng.choice(keypaths)}),
+                (f"keypath x{batch_size}", batch_size,
+                 lambda: {'op': 'keypath', 'keypath': rng.choice(keypaths)}),
+                ('prefix', 1, lambda: {'op': 'prefix', 'prefix': rng.choice(prefixes), 'limit': 20}),
+            )
+            results = {}
+            print(f"[query server] {len(keypaths)} nodes, {clients} clients, Unix socket")
+            for label, size, make in workloads:
+                calls = [[[make() for _ in range(size)] for _ in range(requests // size // clients)]
+                         for _ in range(clients)]
+                latencies = [[] for _ in range(clients)]
+
+                def run(client_id):
+                    client = yang_server.QueryClient(socket_path)
+                    try:
+                        for call in calls[client_id]:
+                            start = time.perf_counter()
+                            if size == 1:
+                                response = client.request(call[0])
+                            else:
+                                response = {'results': client.batch(call)}
+                            latencies[client_id].append(time.perf_counter() - start)
+                            if 'error' in response:
+                                raise RuntimeError(response['error'])
+                    finally:
+                        client.close()
+
+                threads = [threading.Thread(target=run, args=(client_id,)) for client_id in range(clients)]
+                start = time.perf_counter()
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                elapsed = time.perf_counter() - start
+
+                samples = [latency for client_latencies in latencies for latency in client_latencies]
+                lookups = len(samples) * size
+                points = percentiles(samples)
+                results[label] = {'lookups': lookups, 'elapsed': elapsed,
+                                  'throughput': lookups / elapsed,
+                                  'latency': {f"p{point}": value for point, value in points.items()}}
+                print(f"  {label:14s} p50 {points[50] * 1000:7.3f}ms  p90 {points[90] * 1000:7.3f}ms"
+                      f"  p99 {points[99] * 1000:7.3f}ms  {lookups / elapsed:9.0f} lookups/s")
+        finally:
+            server.terminate()
+            server.wait()
+    return results
+
+
+def sample_value(check, index=0):
+    """LeafCheck 를 통과하는 값 (index 로 list key 값을 서로 다르게)"""
+    if check is None:
+        return f"v{index}"
+    if check.base == 'union':
+        return sample_value(check.members[0], index)
+    if check.base == 'enumeration':
+        enums = sorted(check.enums)
+        return enums[index % len(enums)]
+    if check.base == 'identityref':
+        return sorted(check.identities)[0]
+    if check.base == 'boolean':
+        return 'true'
+    if check.base == 'decimal64':
+        return str(check.ranges[0][0] + index if check.ranges else index)
+    if check.base == 'string':
+        low = int(check.ranges[0][0]) if check.ranges else 0
+        return f"v{index}".ljust(low, 'x')
+    low = check.ranges[0][0] if check.ranges else max(0, yang_validate.INTEGER_BOUNDS[check.base][0])
+    return str(low + index)
+
+
+def sample_tree(spec, max_depth, depth=0, index=0):
+    """spec 아래 유효한 인스턴스 트리 [(이름, kind, 값 또는 자식 목록)]
+
+    leaf 는 모두 넣고, container/list 는 max_depth 까지만, list 는 항목 두 개씩 만든다.
+    """
+    children = []
+    for name, child in spec.children.items():
+        if child.kind in ('leaf', 'leaf-list'):
+            key_index = index if name in spec.keys else 0
+            children.append((name, child.kind, sample_value(child.check, key_index)))
+        elif depth < max_depth:
+            entries = range(2) if child.kind == 'list' else range(1)
+            children.append((name, child.kind,
+                             [sample_tree(child, max_depth, depth + 1, entry) for entry in entries]))
+    return children
+
+
+def sample_xml(tree, parts):
+    for name, kind, value in tree:
+        if kind in ('leaf', 'leaf-list'):
+            parts.append(f"<{name}>{value}</{name}>")
+            continue
+        for entry in value:
+            parts.append(f"<{name}>")
+            sample_xml(entry, parts)
+            parts.append(f"</{name}>")
+    return parts
+
+
+def sample_json(tree):
+    document = {}
+    for name, kind, value in tree:
+        if kind == 'leaf':
+            document[name] = value
+        elif kind == 'leaf-list':
+            document[name] = [value]
+        elif kind == 'container':
+            document[name] = sample_json(value[0])
+        else:
+            document[name] = [sample_json(entry) for entry in value]
+    return document
+
+
+def bench_validator(documents=2000, max_depth=2, workers=2, large_entries=20000):
+    """컴파일된 검증기로 합성 코퍼스 인스턴스 문서 검사 처리량 (docs/s)
+
+    모듈마다 최상위 container 의 유효한 XML/JSON 문서를 만들어 오류가 없는지 확인하고,
+    enum 값 하나를 바꾼 문서는 오류 한 건이 나오는지 확인한다. large 는 list 항목이
+    large_entries 개인 XML 문서 하나를 iterparse 로 스트리밍한 시간이다.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = os.path.join(tmp, 'yang')
+        yang_synth.write_corpus(corpus, modules=2, **SYNTH_PARAMS)
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            validator = yang_validate.SchemaValidator.from_directory(corpus)
+        compile_time = time.perf_counter() - start
+        prefixes = {module: namespace for namespace, module in validator.namespaces.items()}
+
+        xml_docs, json_docs = [], []
+        for module, root in validator.roots.items():
+            for name, spec in root.children.items():
+                tree = sample_tree(spec, max_depth)
+                xml_docs.append(f'<{name} xmlns="{prefixes[module]}">'
+                                + ''.join(sample_xml(tree, [])) + f"</{name}>")
+                json_docs.append({f"{module}:{name}": sample_json(tree)})
+        for document in xml_docs:
+            assert validator.validate_xml(io.BytesIO(document.encode('utf-8'))) == []
+        for document in json_docs:
+            assert validator.validate_json(document) == [], validator.validate_json(document)
+
+        enum_value = next(sample_value(spec.check) for spec in validator.nodes.values()
+                          if spec.check is not None and spec.check.base == 'enumeration')
+        invalid = xml_docs[0].replace(f">{enum_value}<", ">not-an-enum<", 1)
+        assert len(validator.validate_xml(io.BytesIO(invalid.encode('utf-8')))) == 1
+
+        paths = []
+        for i in range(documents):
+            path = os.path.join(tmp, f"doc-{i}.xml")
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(xml_docs[i % len(xml_docs)])
+            paths.append(path)
+        elements = xml_docs[0].count('</')
+
+        results = {}
+        start = time.perf_counter()
+        for i in range(documents):
+            validator.validate_json(json_docs[i % len(json_docs)])
+        results['json'] = time.perf_counter() - start
+        start = time.perf_counter()
+        assert not any(errors for _, errors in yang_validate.validate_files(validator, paths))
+        results['xml'] = time.perf_counter() - start
+        start = time.perf_counter()
+        assert not any(errors for _, errors in yang_validate.validate_files(validator, paths, workers))
+        results[f"xml x{workers}"] = time.perf_counter() - start
+
+        # list 항목이 많은 큰 문서 (container 로만 이어진 첫 list 의 항목을 key 만 다르게 복제)
+        for module, root in validator.roots.items():
+            containers = [(root, [])]
+            found = None
+            while containers and found is None:
+                spec, names = containers.pop(0)
+                for child_name, child in spec.children.items():
+                    if child.kind == 'list':
+                        found = (names + [child_name], child)
+                        break
+                    if child.kind == 'container':
+                        containers.append((child, names + [child_name]))
+            if found is not None:
+                break
+        names, list_spec = found
+        large = os.path.join(tmp, 'large.xml')
+        with open(large, 'w', encoding='utf-8') as f:
+            f.write(f'<{names[0]} xmlns="{prefixes[module]}">' + ''.join(f"<{name}>" for name in names[1:-1]))
+            for entry in range(large_entries):
+                f.write(''.join(sample_xml([(names[-1], 'list', [sample_tree(list_spec, 0, 0, entry)])], [])))
+            f.write(''.join(f"</{name}>" for name in reversed(names[:-1])))
+        start = time.perf_counter()
+        assert validator.validate_file(large) == []
+        large_time = time.perf_counter() - start
+        large_size = os.path.getsize(large)
+
+    print(f"[validator] 제약 {len(validator.nodes)}개 컴파일 {compile_time:.3f}s (로드/검증 포함), "
+          f"문서당 요소 약 {elements}개, {documents} docs, cpu {os.cpu_count()}")
+    for label, elapsed in results.items():
+        print(f"  {label:10s} {elapsed:8.3f}s  {documents / elapsed:9.0f} docs/s"
+              f"  {documents * elements / elapsed:10.0f} elements/s")
+    print(f"  large xml  {large_time:8.3f}s  ({large_size / 1024 / 1024:.1f} MiB, "
+          f"{large_entries} list entries, {large_entries / large_time:.0f} entries/s)")
+    return results
+
+
+class RangeRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """Range 요청 (bytes=N- / bytes=N-M) 을 지원하는 로컬 http.server 핸들러 (다운로더 검증용)
+
+    If-Range 가 파일의 Last-Modified 와 다르면 Range 를 무시하고 전체를 200 으로 보낸다.
+    """
+
+    def send_head(self):
+        self.range_length = None
+        match = re.match(r'bytes=(\d+)-(\d*)$', self.headers.get('Range', ''))
+        if_range = self.headers.get('If-Range')
+        if match and if_range is not None:
+            try:
+                modified = self.date_time_string(int(os.path.getmtime(self.translate_path(self.path))))
+            except OSError:
+                modified = None
+            if if_range != modified:
+                match = None
+        if not match:
+            return super().send_head()
+
+        path = self.translate_path(self.path)
+        try:
+            f = open(path, 'rb')
+        except OSError:
+            self.send_error(404, "File not found")
+            return None
+        size = os.fstat(f.fileno()).st_size
+        start = int(match.group(1))
+        end = min(int(match.group(2)) if match.group(2) else size - 1, size - 1)
+        if start >= size:
+            f.close()
+            self.send_response(416)
+            self.send_header('Content-Range', f'bytes */{size}')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return None
+
+        self.send_response(206)
+        self.send_header('Content-Type', self.guess_type(path))
+        self.send_header('Content-Range', f'bytes {start}-{end}/{size}')
+        self.send_header('Content-Length', str(end - start + 1))
+        self.end_headers()
+        f.seek(start)
+        self.range_length = end - start + 1
+        return f
+
+    def copyfile(self, source, outputfile):
+        if self.range_length is None:
+            return super().copyfile(source, outputfile)
+        remaining = self.range_length
+        while remaining:
+            block = source.read(min(remaining, 1024 * 1024))
+            if not block:
+                break
+            outputfile.write(block)
+            remaining -= len(block)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@contextlib.contextmanager
+def local_http_server(directory):
+    """directory 를 제공하는 로컬 서버를 띄우고 base URL 을 넘김"""
+    handler = lambda *args, **kwargs: RangeRequestHandler(*args, directory=directory, **kwargs)
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def legacy_download_file(url, output_path):
+    """세션 없이 8 KiB 청크로 처음부터 받던 이전 download_file (비교용)"""
+    import requests
+
+    response = requests.get(url, stream=True, timeout=60)
+    response.raise_for_status()
+    with open(output_path, 'wb') as f:
+        for chunk in response.iter_content(chunk_size=8192):
+            if chunk:
+                f.write(chunk)
+
+
+def bench_download(total_mb=256, files=4, workers=4):
+    """로컬 Range 지원 서버로 순차 다운로드 / 동시 다운로드 / 이어받기 / 체크섬 skip 비교"""
+    import download_oran_specs as downloader
+
+    with tempfile.TemporaryDirectory() as tmp:
+        served = os.path.join(tmp, 'served')
+        os.makedirs(served)
+        block = os.urandom(1024 * 1024)
+        items = []
+        for index in range(files):
+            filename = f"spec-{index}.zip"
+            hasher = hashlib.sha256()
+            with open(os.path.join(served, filename), 'wb') as f:
+                for _ in range(total_mb // files):
+                    data = bytes([index]) + block[1:]
+                    f.write(data)
+                    hasher.update(data)
+            items.append({'filename': filename, 'sha256': hasher.hexdigest()})
+
+        with local_http_server(served) as base_url:
+            for item in items:
+                item['url'] = f"{base_url}/{item['filename']}"
+
+            legacy_dir = os.path.join(tmp, 'legacy')
+            os.makedirs(legacy_dir)
+            start = time.perf_counter()
+            for item in items:
+                legacy_download_file(item['url'], os.path.join(legacy_dir, item['filename']))
+            legacy = time.perf_counter() - start
+
+            target = os.path.join(tmp, 'pooled')
+            os.makedirs(target)
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                results = downloader.download_files(items, target, workers=workers)
+                pooled = time.perf_counter() - start
+                assert all(results.values())
+
+                # 절반만 받은 상태에서 이어받기
+                first = os.path.join(target, items[0]['filename'])
+                with open(first, 'rb') as f:
+                    half = f.read(os.path.getsize(first) // 2)
+                os.remove(first)
+                with open(first + '.part', 'wb') as f:
+                    f.write(half)
+                start = time.perf_counter()
+                assert downloader.download_file(items[0]['url'], first,
+                                                sha256=items[0]['sha256'], progress=False)
+                resumed = time.perf_counter() - start
+
+                start = time.perf_counter()
+                assert all(downloader.download_files(items, target, workers=workers).values())
+                skipped = time.perf_counter() - start
+
+    print(f"[download] ({files} files, {total_mb} MB, local http.server)")
+    print(f"  sequential   {legacy:8.3f}s")
+    print(f"  pooled x{workers}    {pooled:8.3f}s  x{legacy / pooled:.2f}")
+    print(f"  resume half  {resumed:8.3f}s  (1 file, {total_mb // files // 2} MB left)")
+    print(f"  checksum hit {skipped:8.3f}s")
+    return legacy, pooled, resumed, skipped
+
+
+PHASES = ('parse', 'validate', 'extract_node_info', 'extract_rpc_info',
+          'extract_notification_info', 'write')
+
+# 합성 코퍼스 모듈 하나의 형태 (크기는 모듈 수로 조절)
+SYNTH_PARAMS = dict(depth=3, fanout=4, leaves=5, grouping_leaves=4, grouping_uses=True,
+                    enum_size=16, typedef_chain=4, rpcs=2, notifications=2)
+
+# 기준 JSON 저장/비교에 쓰는 최소 반복 수 (한 번 측정한 값은 잡음이 커서 게이트로 쓰지 않음)
+GATE_REPEAT = 3
+
+
+def time_phases(directory, output_dir):
+    """파싱/검증/세 추출기/쓰기 단계별 시간(초)과 건수를 반환"""
+    from pyang import context, repository
+
+    phases = {}
+    ctx = context.Context(repository.FileRepository(directory))
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        modules = yang_parsor.load_yang_files(ctx, directory)
+    phases['parse'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ctx.validate()
+    phases['validate'] = time.perf_counter() - start
+
+    entries = {}
+    extractors = (
+        ('extract_node_info',
+         lambda module, filename: yang_parsor.extract_node_info(module, module_name=module.arg,
+                                                                filename=filename)),
+        ('extract_rpc_info', yang_parsor.extract_rpc_info),
+        ('extract_notification_info', yang_parsor.extract_notification_info),
+    )
+    for phase, extract in extractors:
+        start = time.perf_counter()
+        entries[phase] = [entry for filename, module in modules
+                          for entry in extract(module, filename)]
+        phases[phase] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for phase, label in zip(PHASES[2:5], ('노드 정보', 'RPC', 'Notification')):
+            writer = yang_parsor.EntryWriter(os.path.join(output_dir, f"{phase}.txt"), label)
+            try:
+                writer.write(entries[phase])
+            finally:
+                writer.close()
+    phases['write'] = time.perf_counter() - start
+
+    counts = {'modules': len(modules),
+              'nodes': len(entries['extract_node_info']),
+              'rpcs': len(entries['extract_rpc_info']),
+              'notifications': len(entries['extract_notification_info'])}
+    return phases, counts
+
+
+def bench_synthetic(sizes=(1000, 10000, 50000, 100000), repeat=GATE_REPEAT, params=None):
+    """합성 코퍼스 노드 수별 단계 시간 (스케일링 곡선)
+
+    크기마다 SYNTH_PARAMS 모양의 모듈 수를 늘려 목표 노드 수에 맞추고,
+    repeat 번 중 단계별 최소 시간을 기록한다.
+    """
+    params = dict(SYNTH_PARAMS, **(params or {}))
+    per_module = yang_synth.estimate_nodes(modules=1, **params)
+    cases = {}
+
+    print(f"[synthetic phases] (모듈당 노드 약 {per_module}개, best of {repeat})")
+    print(f"  {'nodes':>7s} " + ' '.join(f"{phase[:12]:>12s}" for phase in PHASES) + f" {'total':>8s}")
+    for size in sizes:
+        modules = max(1, round(size / per_module))
+        with tempfile.TemporaryDirectory() as tmp:
+            corpus = os.path.join(tmp, 'yang')
+            yang_synth.write_corpus(corpus, modules=modules, **params)
+            best = None
+            for _ in range(repeat):
+                phases, counts = time_phases(corpus, tmp)
+                best = phases if best is None else {phase: min(best[phase], phases[phase])
+                                                    for phase in PHASES}
+
+        cases[str(size)] = {'params': dict(params, modules=modules), 'counts': counts,
+                            'phases': best}
+        print(f"  {counts['nodes']:7d} " + ' '.join(f"{best[phase]:11.3f}s" for phase in PHASES)
+              + f" {sum(best.values()):7.3f}s")
+    return cases
+
+
+def compare_baseline(cases, baseline, tolerance=0.25, min_seconds=0.05):
+    """기준 결과보다 tolerance 비율 이상 (그리고 min_seconds 이상) 느려진 단계 목록
+
+    작은 단계의 측정 잡음으로 실패하지 않도록 절대 차이도 함께 본다.
+    """
+    if baseline.get('repeat', 1) < GATE_REPEAT:
+        print(f"  경고: 기준이 best of {baseline.get('repeat', 1)} 로 측정됨, "
+              f"best of {GATE_REPEAT} 이상으로 다시 저장 권장")
+    regressions = []
+    for size, case in cases.items():
+        base = baseline.get('cases', {}).get(size)
+        if base is None:
+            continue
+        if base.get('counts') != case['counts']:
+            print(f"  경고: {size} 케이스의 건수가 기준과 다름 {base.get('counts')} -> {case['counts']}")
+        for phase, elapsed in case['phases'].items():
+            before = base['phases'].get(phase)
+            if before is None:
+                continue
+            if elapsed > before * (1 + tolerance) and elapsed - before > min_seconds:
+                regressions.append((size, phase, before, elapsed))
+    return regressions
+
+
+def run_synthetic(args):
+    sizes = [int(size) for size in args.sizes.split(',')]
+    repeat = args.repeat
+    if (args.json or args.baseline) and repeat < GATE_REPEAT:
+        print(f"기준 저장/비교는 best of {GATE_REPEAT} 이상으로 측정 (--repeat {repeat} -> {GATE_REPEAT})")
+        repeat = GATE_REPEAT
+    cases = bench_synthetic(sizes, repeat=repeat)
+    result = {'python': sys.version.split()[0], 'cpu': os.cpu_count(), 'repeat': repeat,
+              'cases': cases}
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.json}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_baseline(cases, baseline, args.tolerance)
+        if regressions:
+            print(f"성능 저하 {len(regressions)}건 (허용 +{args.tolerance:.0%}):")
+            for size, phase, before, elapsed in regressions:
+                print(f"  REGRESSION {size:>7s} {phase:26s} {before:8.3f}s -> {elapsed:8.3f}s"
+                      f"  x{elapsed / before:.2f}")
+            sys.exit(1)
+        print(f"기준 대비 성능 저하 없음: {args.baseline}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='yang_parsor 성능 비교')
+    parser.add_argument('directory', nargs='?', default='./oru')
+    parser.add_argument('--synth', action='store_true',
+                        help='합성 코퍼스로 단계별 시간과 스케일링 곡선 측정')
+    parser.add_argument('--sizes', default='1000,10000,50000,100000',
+                        help='합성 코퍼스 목표 노드 수 (쉼표 구분)')
+    parser.add_argument('--repeat', type=int, default=GATE_REPEAT,
+                        help=f'단계별 최소 시간을 고를 반복 수 (--json/--baseline 이면 최소 {GATE_REPEAT})')
+    parser.add_argument('--json', help='측정 결과를 JSON 으로 저장 (다음 --baseline 으로 사용)')
+    parser.add_argument('--baseline', help='비교할 기준 JSON, 느려진 단계가 있으면 종료 코드 1')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='허용하는 느려짐 비율 (기본 0.25)')
+    parser.add_argument('--download', action='store_true',
+                        help='로컬 http.server 로 다운로더 측정')
+    parser.add_argument('--download-mb', type=int, default=256)
+    args = parser.parse_args()
+
+    if args.download:
+        bench_download(args.download_mb)
+        return
+
+    if args.synth:
+        run_synthetic(args)
+        return
+
+    directory = args.directory
+    yang_count = len([f for f in os.listdir(directory) if f.endswith('.yang')])
+    print(f"디렉터리: {directory} (.yang {yang_count}개)")
+
+    bench_batch_vs_per_file(directory)
+    bench_workers(directory)
+    bench_tree_walk(directory)
+    bench_substmt_index(directory)
+    bench_source_lookup(directory)
+    bench_jsonl_load(directory)
+    bench_instrumentation(directory)
+    bench_type_resolver(directory)
+    bench_root_scope(directory)
+    bench_record_memory()
+    bench_snapshot(directory)
+    bench_query_server(directory)
+    bench_single_pass(directory)
+    bench_validator()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,12 +4,27 @@ O-RAN 15.0.0 Specification Downloader
 
 This script attempts to download O-RAN 15.0.0 specifications from
 the O-RAN specifications portal.
+
+Downloads share one pooled Session, run concurrently, resume interrupted
+transfers with HTTP Range requests and skip files whose checksum already
+matches. A manifest of files can be fetched with:
+
+    python3 download_oran_specs.py --manifest specs.json --workers 4
+
+where specs.json is a list of {"url": ..., "filename": ..., "sha256": ...}
+("filename" and "sha256" are optional).
 """
 
+import argparse
+import hashlib
 import requests
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
 import json
 
@@ -17,16 +32,34 @@ import json
 SPEC_PORTAL = "https://specifications.o-ran.org"
 ORAN_MAIN = "https://www.o-ran.org"
 
+# Concurrent fetches and read sizes (grown/shrunk per read)
+DEFAULT_WORKERS = 4
+MIN_CHUNK_SIZE = 64 * 1024
+MAX_CHUNK_SIZE = 8 * 1024 * 1024
+
 def create_download_directory():
     """Create directory for downloaded specifications"""
     download_dir = Path("oran_specs_15.0.0")
     download_dir.mkdir(exist_ok=True)
     return download_dir
 
-def get_portal_content():
+def create_session(pool_size=DEFAULT_WORKERS * 2, retries=3):
+    """Create a Session whose connection pool is shared by all requests"""
+    session = requests.Session()
+    retry = Retry(total=retries, backoff_factor=0.5,
+                  status_forcelist=(500, 502, 503, 504),
+                  allowed_methods=('HEAD', 'GET'))
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                          max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+def get_portal_content(session=None):
     """Fetch content from specifications portal"""
+    session = session or create_session()
     try:
-        response = requests.get(SPEC_PORTAL, timeout=30)
+        response = session.get(SPEC_PORTAL, timeout=30)
         response.raise_for_status()
         return response.text
     except Exception as e:
@@ -61,8 +94,8 @@ def find_download_links(content, version="15.0.0"):
     
     return list(set(links))
 
-def try_direct_download_patterns(version="15.0.0"):
-    """Try common download URL patterns"""
+def try_direct_download_patterns(version="15.0.0", session=None, workers=DEFAULT_WORKERS):
+    """Try common download URL patterns (probed concurrently over one pool)"""
     base_patterns = [
         f"{SPEC_PORTAL}/download/{version}",
         f"{SPEC_PORTAL}/api/specifications/{version}",
@@ -70,59 +103,231 @@ def try_direct_download_patterns(version="15.0.0"):
         f"{SPEC_PORTAL}/v{version}",
         f"{SPEC_PORTAL}/oran-{version}",
     ]
-    
-    results = []
-    for url in base_patterns:
+    session = session or create_session()
+
+    def probe(url):
         try:
-            response = requests.head(url, timeout=10, allow_redirects=True)
-            if response.status_code == 200:
-                results.append((url, response.status_code))
-                print(f"✓ Found accessible URL: {url}")
-        except:
-            pass
-    
+            response = session.head(url, timeout=10, allow_redirects=True)
+            return url, response.status_code
+        except requests.RequestException:
+            return url, None
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        probes = list(pool.map(probe, base_patterns))
+
+    results = []
+    for url, status_code in probes:
+        if status_code == 200:
+            results.append((url, status_code))
+            print(f"✓ Found accessible URL: {url}")
+
     return results
 
-def download_file(url, output_path):
-    """Download a file from URL"""
+def file_sha256(path, hasher=None):
+    """SHA-256 of a file (or feed it into an existing hasher)"""
+    hasher = hasher or hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(MAX_CHUNK_SIZE), b''):
+            hasher.update(block)
+    return hasher
+
+def next_chunk_size(chunk_size, elapsed):
+    """Grow reads while the link keeps up, shrink them when a read stalls"""
+    if elapsed < 0.05 and chunk_size < MAX_CHUNK_SIZE:
+        return chunk_size * 2
+    if elapsed > 0.5 and chunk_size > MIN_CHUNK_SIZE:
+        return chunk_size // 2
+    return chunk_size
+
+def parse_content_range(value):
+    """'bytes 100-199/1000' -> (100, 1000), 'bytes */1000' -> (None, 1000)
+
+    Parts that are missing or '*' come back as None.
+    """
+    match = re.match(r'bytes\s+(?:(\d+)-\d+|\*)/(\d+|\*)', value or '')
+    if not match:
+        return None, None
+    start, total = match.groups()
+    return (int(start) if start else None, int(total) if total != '*' else None)
+
+def resume_validator(response):
+    """If-Range value that ties a later resume to this response's version
+
+    Only a strong ETag may be used with If-Range, so fall back to Last-Modified.
+    """
+    etag = response.headers.get('ETag')
+    if etag and not etag.startswith('W/'):
+        return etag
+    return response.headers.get('Last-Modified')
+
+def read_part_validator(meta_path, url):
+    """Validator saved next to a partial download (None if missing or for another URL)"""
     try:
-        print(f"Downloading: {url}")
-        response = requests.get(url, stream=True, timeout=60)
-        response.raise_for_status()
-        
-        total_size = int(response.headers.get('content-length', 0))
-        
-        with open(output_path, 'wb') as f:
-            downloaded = 0
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    if total_size > 0:
-                        percent = (downloaded / total_size) * 100
-                        print(f"\rProgress: {percent:.1f}%", end='', flush=True)
-        
-        print(f"\n✓ Downloaded: {output_path}")
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return meta.get('validator') if meta.get('url') == url else None
+
+def download_file(url, output_path, session=None, sha256=None, progress=True):
+    """Download a file from URL
+
+    The body is written to '<output_path>.part' and renamed when complete, so an
+    interrupted download resumes from the partial file with a Range request.
+    The ETag/Last-Modified of the first response is kept in '<output_path>.part.json'
+    and sent as If-Range, so a file that changed on the server is fetched again
+    from the start instead of being spliced onto old bytes. A partial file with
+    neither a validator nor a sha256 to verify it is not resumed.
+    If sha256 is given, an existing file with that checksum is skipped and the
+    downloaded body is verified before the rename.
+    """
+    output_path = Path(output_path)
+    part_path = output_path.with_name(output_path.name + '.part')
+    meta_path = output_path.with_name(output_path.name + '.part.json')
+    expected = sha256.lower() if sha256 else None
+
+    try:
+        if expected and output_path.exists() and file_sha256(output_path).hexdigest() == expected:
+            print(f"✓ Up to date (checksum match): {output_path}")
+            return True
+
+        session = session or create_session()
+        offset = part_path.stat().st_size if part_path.exists() else 0
+        validator = read_part_validator(meta_path, url) if offset else None
+        if offset and validator is None and not expected:
+            # Nothing can tell whether the partial body is from the current version
+            offset = 0
+        # Range offsets must refer to the raw bytes, not a compressed stream
+        headers = {'Accept-Encoding': 'identity'}
+        if offset:
+            headers['Range'] = f'bytes={offset}-'
+            if validator:
+                headers['If-Range'] = validator
+            print(f"Resuming: {url} (from {offset} bytes)")
+        else:
+            print(f"Downloading: {url}")
+
+        hasher = hashlib.sha256() if expected else None
+        restart = False
+        with session.get(url, stream=True, timeout=60, headers=headers) as response:
+            if offset and response.status_code == 416:
+                # Only complete if the remote size is exactly what we already have
+                _, total = parse_content_range(response.headers.get('Content-Range'))
+                restart = total != offset
+            else:
+                response.raise_for_status()
+                if offset and (response.status_code != 206 or
+                               parse_content_range(response.headers.get('Content-Range'))[0] != offset):
+                    # Range ignored or If-Range failed (file changed): start over
+                    offset = 0
+                if not offset:
+                    with open(meta_path, 'w', encoding='utf-8') as f:
+                        json.dump({'url': url, 'validator': resume_validator(response)}, f)
+                if hasher is not None and offset:
+                    file_sha256(part_path, hasher)
+
+                content_length = int(response.headers.get('content-length', 0))
+                total_size = offset + content_length if content_length else 0
+
+                with open(part_path, 'ab' if offset else 'wb') as f:
+                    downloaded = offset
+                    chunk_size = MIN_CHUNK_SIZE
+                    while True:
+                        start = time.perf_counter()
+                        chunk = response.raw.read(chunk_size, decode_content=True)
+                        if not chunk:
+                            break
+                        f.write(chunk)
+                        if hasher is not None:
+                            hasher.update(chunk)
+                        downloaded += len(chunk)
+                        chunk_size = next_chunk_size(chunk_size, time.perf_counter() - start)
+                        if progress and total_size > 0:
+                            percent = (downloaded / total_size) * 100
+                            print(f"\rProgress: {percent:.1f}%", end='', flush=True)
+
+                if total_size and downloaded < total_size:
+                    raise IOError(f"connection closed at {downloaded}/{total_size} bytes")
+
+        if restart:
+            # The remote file shrank or changed: the partial body is not a prefix of it
+            print(f"Remote file changed, restarting: {url}")
+            part_path.unlink()
+            meta_path.unlink(missing_ok=True)
+            return download_file(url, output_path, session, sha256, progress)
+
+        if expected:
+            if hasher is None or response.status_code == 416:
+                hasher = file_sha256(part_path)
+            actual = hasher.hexdigest()
+            if actual != expected:
+                part_path.unlink()
+                meta_path.unlink(missing_ok=True)
+                raise ValueError(f"checksum mismatch (expected {expected}, got {actual})")
+
+        os.replace(part_path, output_path)
+        meta_path.unlink(missing_ok=True)
+        print(f"\n✓ Downloaded: {output_path}" if progress else f"✓ Downloaded: {output_path}")
         return True
     except Exception as e:
         print(f"\n✗ Error downloading {url}: {e}")
         return False
 
+def download_files(items, download_dir, workers=DEFAULT_WORKERS, session=None):
+    """Download manifest items concurrently over one pooled session
+
+    Each item is a dict with "url" and optional "filename" / "sha256".
+    Returns {filename: success}.
+    """
+    session = session or create_session(pool_size=workers * 2)
+    download_dir = Path(download_dir)
+
+    def fetch(item):
+        filename = item.get('filename') or Path(item['url'].split('?', 1)[0]).name
+        ok = download_file(item['url'], download_dir / filename, session=session,
+                           sha256=item.get('sha256'), progress=False)
+        return filename, ok
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return dict(pool.map(fetch, items))
+
+def load_manifest(path):
+    """Load a JSON list of {"url", "filename", "sha256"} download items"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
 def main():
+    parser = argparse.ArgumentParser(description='O-RAN 15.0.0 Specification Downloader')
+    parser.add_argument('--manifest', help='JSON list of files to download')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help='concurrent downloads')
+    args = parser.parse_args()
+
     print("O-RAN 15.0.0 Specification Downloader")
     print("=" * 50)
     
     # Create download directory
     download_dir = create_download_directory()
     print(f"Download directory: {download_dir.absolute()}")
+    session = create_session(pool_size=args.workers * 2)
+
+    if args.manifest:
+        items = load_manifest(args.manifest)
+        print(f"\nDownloading {len(items)} files ({args.workers} workers)...")
+        results = download_files(items, download_dir, workers=args.workers, session=session)
+        failed = [filename for filename, ok in results.items() if not ok]
+        print(f"\n{len(results) - len(failed)}/{len(results)} files downloaded")
+        if failed:
+            sys.exit(1)
+        return
     
     # Try direct download patterns first
     print("\n1. Trying direct download patterns...")
-    direct_urls = try_direct_download_patterns("15.0.0")
+    direct_urls = try_direct_download_patterns("15.0.0", session=session, workers=args.workers)
     
     # Get portal content
     print("\n2. Accessing specifications portal...")
-    content = get_portal_content()
+    content = get_portal_content(session)
     
     if content:
         print(f"   Portal accessible (content length: {len(content)} bytes)")
@@ -0,0 +1,54 @@
+"""yang_diff 스키마 diff 테스트"""
+
+import pytest
+
+import yang_diff
+
+BASE = """module base {
+  namespace "urn:test:base";
+  prefix b;
+  container sys {
+    leaf name { type string; }
+  }
+}
+"""
+
+AUGMENT = """module {name} {{
+  namespace "urn:test:{name}";
+  prefix x;
+  import base {{ prefix b; }}
+  augment "/b:sys" {{
+    leaf enabled {{ type {type}; }}
+  }}
+}}
+"""
+
+
+def write_version(directory, a_type='boolean', b_type='boolean'):
+    directory.mkdir()
+    (directory / 'base.yang').write_text(BASE)
+    (directory / 'aug-a.yang').write_text(AUGMENT.format(name='aug-a', type=a_type))
+    (directory / 'aug-b.yang').write_text(AUGMENT.format(name='aug-b', type=b_type))
+    return yang_diff.build_tree(str(directory))
+
+
+@pytest.mark.parametrize('changed', ['aug-a', 'aug-b'])
+def test_same_name_augments_are_compared_separately(tmp_path, changed):
+    old = write_version(tmp_path / 'old')
+    types = {'a_type': 'uint8'} if changed == 'aug-a' else {'b_type': 'uint8'}
+    new = write_version(tmp_path / 'new', **types)
+
+    changes = [change for change in yang_diff.diff_trees(old, new)
+               if change['keypath'].startswith('base/')]
+    assert [(change['keypath'], change['fields']['type']) for change in changes] == [
+        (f'base/sys/{changed}:enabled', {'old': 'boolean', 'new': 'uint8'})]
+
+
+def test_saved_tree_keeps_modules(tmp_path):
+    old = write_version(tmp_path / 'old')
+    saved = tmp_path / 'old.tree.json'
+    yang_diff.save_tree(old, str(saved))
+
+    loaded = yang_diff.load_tree(str(saved))
+    assert loaded.digest == old.digest
+    assert yang_diff.diff_trees(loaded, old) == []
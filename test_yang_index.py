@@ -0,0 +1,74 @@
+"""yang_index keypath 인덱스 테스트 (메모리 인덱스와 SQLite 조회 결과 비교)"""
+
+import pytest
+
+from yang_index import KeypathIndex, query_sqlite
+
+MODULES = {
+    'base.yang': """module base {
+  namespace "urn:test:base";
+  prefix b;
+  container sys {
+    leaf name { type string; }
+    container state {
+      config false;
+      leaf uptime { type uint32; }
+    }
+  }
+}
+""",
+    'other.yang': """module other {
+  namespace "urn:test:other";
+  prefix o;
+  leaf counter { type uint32; }
+}
+""",
+}
+
+
+@pytest.fixture(scope='module')
+def index(tmp_path_factory):
+    tmp = tmp_path_factory.mktemp('index')
+    corpus = tmp / 'corpus'
+    corpus.mkdir()
+    for filename, text in MODULES.items():
+        (corpus / filename).write_text(text)
+    index = KeypathIndex.from_directory(str(corpus))
+    db_path = str(tmp / 'index.sqlite')
+    index.save(db_path)
+    return index, db_path
+
+
+def keypaths(records):
+    return [record['keypath'] for record in records]
+
+
+@pytest.mark.parametrize('prefix, filters', [
+    ('/', {}),
+    ('//', {}),
+    ('/', {'type': 'uint32'}),
+    ('/sys', {}),
+    ('/sys/', {'config': 'false'}),
+    ('base/sys/state', {}),
+    ('other', {}),
+    (None, {'base_type': 'uint32', 'config': 'false'}),
+])
+def test_sqlite_matches_memory_index(index, prefix, filters):
+    index, db_path = index
+    expected = keypaths(index.query(prefix, **filters))
+    assert expected
+    assert keypaths(query_sqlite(db_path, prefix, **filters)) == expected
+
+
+def test_prefix_root_returns_everything(index):
+    index, db_path = index
+    assert len(query_sqlite(db_path, '/')) == len(index.records)
+
+
+@pytest.mark.parametrize('name', ['record', 'keypath', "type = 'x' OR 1"])
+def test_unknown_filter_is_rejected(index, name):
+    index, db_path = index
+    with pytest.raises(ValueError):
+        query_sqlite(db_path, **{name: 'x'})
+    with pytest.raises(ValueError):
+        index.query(**{name: 'x'})
@@ -0,0 +1,83 @@
+"""yang_parsor 모델 스냅샷 테스트"""
+
+import pickle
+
+import pytest
+
+import yang_parsor
+
+MODULE = """module base {
+  namespace "urn:test:base";
+  prefix b;
+  container sys {
+    leaf name { type string; }
+  }
+}
+"""
+
+
+def fail_on_load(*args):
+    raise RuntimeError('스냅샷을 풀면 안 됨')
+
+
+class Unloadable:
+    """풀 때 예외가 나는 객체 (클래스 정의가 바뀐 예전 모델 흉내)"""
+
+    def __reduce__(self):
+        return fail_on_load, ()
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    corpus = tmp_path / 'corpus'
+    corpus.mkdir()
+    (corpus / 'base.yang').write_text(MODULE)
+    return str(corpus)
+
+
+def node_keypaths(model):
+    return [model.nodes.record(row)['keypath'] for row in range(len(model.nodes))]
+
+
+def write_snapshot(filepath, header, model):
+    with open(filepath, 'wb') as f:
+        pickle.dump(header, f)
+        pickle.dump(model, f)
+
+
+def test_snapshot_is_reused(corpus, tmp_path, monkeypatch):
+    snapshot = str(tmp_path / 'm.snapshot')
+    model = yang_parsor.load_model(corpus, snapshot)
+
+    monkeypatch.setattr(yang_parsor, 'load_validated_modules', fail_on_load)
+    assert node_keypaths(yang_parsor.load_model(corpus, snapshot)) == node_keypaths(model)
+
+
+def test_header_mismatch_skips_model(corpus, tmp_path):
+    snapshot = str(tmp_path / 'm.snapshot')
+    hashes = yang_parsor.source_hashes(corpus)
+    write_snapshot(snapshot, {'version': yang_parsor.SNAPSHOT_VERSION, 'code': 'old',
+                              'hashes': hashes}, Unloadable())
+
+    assert yang_parsor.load_snapshot(snapshot, hashes) is None
+    assert 'base/sys/name' in node_keypaths(yang_parsor.load_model(corpus, snapshot))
+
+
+def test_unloadable_model_is_rebuilt(corpus, tmp_path):
+    snapshot = str(tmp_path / 'm.snapshot')
+    hashes = yang_parsor.source_hashes(corpus)
+    write_snapshot(snapshot, {'version': yang_parsor.SNAPSHOT_VERSION,
+                              'code': yang_parsor._code_hash(), 'hashes': hashes}, Unloadable())
+
+    assert yang_parsor.load_snapshot(snapshot, hashes) is None
+    assert 'base/sys/name' in node_keypaths(yang_parsor.load_model(corpus, snapshot))
+    assert yang_parsor.load_snapshot(snapshot, hashes) is not None
+
+
+def test_old_single_pickle_snapshot_is_rebuilt(corpus, tmp_path):
+    snapshot = str(tmp_path / 'm.snapshot')
+    with open(snapshot, 'wb') as f:
+        pickle.dump({'version': 1, 'code': yang_parsor._code_hash(),
+                     'hashes': yang_parsor.source_hashes(corpus), 'model': Unloadable()}, f)
+
+    assert 'base/sys/name' in node_keypaths(yang_parsor.load_model(corpus, snapshot))
@@ -0,0 +1,64 @@
+"""yang_server 조회 데몬 테스트 (임시 디렉터리 모델을 Unix 소켓으로 제공)"""
+
+import asyncio
+import threading
+
+import pytest
+
+import yang_parsor
+from yang_server import QueryClient, QueryHandler, QueryServer, wait_for_server
+
+MODULE = """module base {
+  namespace "urn:test:base";
+  prefix b;
+  container sys {
+    leaf name { type string; }
+    leaf mtu { type uint16; }
+  }
+  rpc restart;
+}
+"""
+
+
+@pytest.fixture
+def handler(tmp_path):
+    corpus = tmp_path / 'corpus'
+    corpus.mkdir()
+    (corpus / 'base.yang').write_text(MODULE)
+    return QueryHandler(yang_parsor.load_model(str(corpus)))
+
+
+@pytest.fixture
+def client(handler, tmp_path):
+    socket_path = str(tmp_path / 'yang.sock')
+    server = QueryServer(handler, socket_path)
+    thread = threading.Thread(target=asyncio.run, args=(server.serve(),), daemon=True)
+    thread.start()
+    wait_for_server(socket_path, timeout=10)
+    client = QueryClient(socket_path, timeout=10)
+    yield client
+    client.close()
+
+
+@pytest.mark.parametrize('request_', [
+    {'op': 'keypath', 'keypath': 5},
+    {'op': 'prefix', 'prefix': 5},
+    {'op': 'prefix', 'prefix': '/sys', 'limit': -1},
+    {'op': 'prefix', 'prefix': '/sys', 'limit': '2'},
+    {'op': 'rpc', 'name': ['restart']},
+    {'op': 'rpc', 'name': 'restart', 'module': 1},
+])
+def test_wrong_field_type_is_an_error_response(handler, request_):
+    response = handler.handle(dict(request_, id=7))
+    assert response['id'] == 7
+    assert 'error' in response
+
+
+def test_bad_request_keeps_connection(client):
+    bad, good = client.pipeline([
+        {'id': 1, 'op': 'keypath', 'keypath': 5},
+        {'id': 2, 'op': 'prefix', 'prefix': '/sys', 'type': 'uint16'},
+    ])
+    assert bad['id'] == 1 and 'error' in bad
+    assert good['id'] == 2
+    assert [record['keypath'] for record in good['records']] == ['base/sys/mtu']
@@ -0,0 +1,94 @@
+"""yang_validate 인스턴스 문서 검증 테스트"""
+
+import io
+
+import pytest
+
+import yang_validate
+from yang_validate import SchemaValidator
+
+MODULE = """module dev {
+  namespace "urn:test:dev";
+  prefix d;
+  typedef port-id {
+    type string { length "1..4"; pattern "p[0-9]+"; }
+  }
+  container dev {
+    leaf level {
+      type union {
+        type uint8 { range "1..5"; }
+        type enumeration { enum auto; }
+      }
+    }
+    leaf port {
+      type union {
+        type port-id;
+        type decimal64 { fraction-digits 1; range "0..9.5"; }
+      }
+    }
+    leaf count { type int16; }
+    leaf ratio { type decimal64 { fraction-digits 2; } }
+  }
+  list port {
+    key id;
+    leaf id { type uint16; }
+    leaf speed { type uint32; }
+  }
+}
+"""
+
+
+@pytest.fixture(scope='module')
+def validator(tmp_path_factory):
+    corpus = tmp_path_factory.mktemp('corpus')
+    (corpus / 'dev.yang').write_text(MODULE)
+    return SchemaValidator.from_directory(str(corpus))
+
+
+def check(validator, leaf, value):
+    return validator.nodes[f'dev/dev/{leaf}'].check.check(value)
+
+
+@pytest.mark.parametrize('leaf, value', [
+    ('level', '3'), ('level', 'auto'),
+    ('port', 'p12'), ('port', '9.5'),
+    ('count', '-12'), ('count', '+5'),
+    ('ratio', '1.25'),
+])
+def test_valid_values(validator, leaf, value):
+    assert check(validator, leaf, value) is None
+
+
+@pytest.mark.parametrize('leaf, value', [
+    ('level', '9'), ('level', '0'), ('level', 'manual'),
+    ('port', 'p12345'), ('port', 'x1'), ('port', '9.6'), ('port', '1.25'),
+    ('count', '1_000'), ('count', ' 5'), ('count', '5 '), ('count', '40000'),
+    ('ratio', '1e2'), ('ratio', '1_0.5'), ('ratio', ' 1.5'), ('ratio', 'NaN'),
+])
+def test_invalid_values(validator, leaf, value):
+    assert check(validator, leaf, value) is not None
+
+
+def test_restricted_union_member_in_document(validator):
+    errors = validator.validate_json({'dev:dev': {'level': 9, 'port': 'p1'}})
+    assert [keypath for keypath, _ in errors] == ['dev/dev/level']
+
+
+
+def test_wrapper_children_are_released(validator, monkeypatch):
+    wrappers = []
+    iterparse = yang_validate.ET.iterparse
+
+    def recording_iterparse(source, events):
+        for event, elem in iterparse(source, events):
+            if event == 'start' and elem.tag == 'config':
+                wrappers.append(elem)
+            yield event, elem
+
+    monkeypatch.setattr(yang_validate.ET, 'iterparse', recording_iterparse)
+    entries = ''.join(f'<port xmlns="urn:test:dev"><id>{i}</id><speed>10</speed></port>'
+                      for i in range(100))
+    document = f"<config>{entries}</config>".encode('utf-8')
+
+    assert validator.validate_xml(io.BytesIO(document)) == []
+    assert len(wrappers) == 1 and len(wrappers[0]) == 0
@@ -0,0 +1,81 @@
+"""yang_watch.YangWatcher 증분 추출 테스트 (임시 디렉터리에 모듈을 쓰고 update 호출)"""
+
+import pytest
+
+from yang_watch import YangWatcher
+
+BASE = """module base {
+  namespace "urn:test:base";
+  prefix b;
+  container sys {
+    leaf name { type string; }
+  }
+}
+"""
+
+OTHER = """module other {
+  namespace "urn:test:other";
+  prefix o;
+  leaf counter { type uint32; }
+}
+"""
+
+AUG = """module aug {
+  namespace "urn:test:aug";
+  prefix a;
+  import base { prefix b; }
+  augment "/b:sys" {
+    leaf extra { type uint16; }
+  }
+}
+"""
+
+
+@pytest.fixture
+def watcher(tmp_path):
+    corpus = tmp_path / 'corpus'
+    corpus.mkdir()
+    (corpus / 'base.yang').write_text(BASE)
+    (corpus / 'other.yang').write_text(OTHER)
+    watcher = YangWatcher(str(corpus),
+                          str(tmp_path / 'node.txt'),
+                          str(tmp_path / 'rpc.txt'),
+                          str(tmp_path / 'notif.txt'))
+    watcher.build()
+    return watcher
+
+
+def node_output(watcher):
+    with open(watcher.outputs[0], encoding='utf-8') as f:
+        return f.read()
+
+
+def test_build_writes_all_modules(watcher):
+    output = node_output(watcher)
+    assert 'base/sys/name' in output
+    assert 'other/counter' in output
+
+
+def test_edit_module_reextracts_only_that_module(watcher, tmp_path):
+    (tmp_path / 'corpus' / 'other.yang').write_text(OTHER.replace('counter', 'total'))
+
+    assert watcher.update({'other.yang'}) == {'other.yang'}
+    output = node_output(watcher)
+    assert 'other/total' in output
+    assert 'other/counter' not in output
+    assert 'base/sys/name' in output
+
+
+def test_add_and_remove_augmenting_module(watcher, tmp_path):
+    aug_path = tmp_path / 'corpus' / 'aug.yang'
+    aug_path.write_text(AUG)
+
+    assert watcher.update({'aug.yang'}) == {'base.yang', 'aug.yang'}
+    assert 'base/sys/extra' in node_output(watcher)
+
+    aug_path.unlink()
+    assert watcher.update({'aug.yang'}) == {'base.yang'}
+    output = node_output(watcher)
+    assert 'base/sys/extra' not in output
+    assert 'base/sys/name' in output
+    assert 'other/counter' in output
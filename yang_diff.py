@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+두 스펙 버전의 YANG 스키마 diff (Merkle 해시 트리)
+
+extract_node_records 가 순회하는 i_children 트리를 그대로 따라 노드마다
+비교 필드 + 자식 해시로 서브트리 해시를 만들고, 해시가 같은 서브트리는
+내려가지 않고 건너뛴다. 트리는 JSON 으로 저장해 두면 다시 파싱하지 않고 비교할 수 있다.
+
+자식은 (모듈, 이름) 으로 구분하므로 여러 augment 모듈이 같은 이름의 노드를 더해도
+따로 비교하고, 그때는 keypath 에 'module:name' 으로 표시한다.
+
+사용법:
+    python3 yang_diff.py diff ./oru-14 ./oru-15 [--json]
+    python3 yang_diff.py build ./oru-14 --out oru-14.tree.json
+    python3 yang_diff.py diff oru-14.tree.json ./oru-15
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import zipfile
+from collections import Counter
+
+import yang_parsor
+
+# 변경으로 보는 필드 (description 등 설명 문구는 제외)
+DIFF_FIELDS = ('kind', 'type', 'base-type', 'union', 'range/length', 'fraction-digits', 'pattern',
+               'invert-pattern', 'enum', 'identities', 'default', 'when', 'if-feature', 'units',
+               'mandatory', 'config', 'status', 'key')
+
+
+class SchemaNode:
+    """해시 트리 노드 (비교 필드, (모듈, 이름) 별 자식, 서브트리 해시)"""
+
+    __slots__ = ('name', 'module', 'fields', 'children', 'digest')
+
+    def __init__(self, name, fields=None, module=''):
+        self.name = name
+        self.module = module
+        self.fields = fields or {}
+        self.children = {}
+        self.digest = None
+
+    @property
+    def key(self):
+        return (self.module, self.name)
+
+    def add_child(self, node):
+        self.children[node.key] = node
+
+    def compute_digest(self):
+        # 자식은 (모듈, 이름) 순으로 넣어 선언 순서만 바뀐 경우는 같은 해시가 되게 함
+        h = hashlib.sha256()
+        h.update(json.dumps(self.fields, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+        for module, name in sorted(self.children):
+            h.update(b'\0' + f"{module}:{name}".encode('utf-8') + b'\0'
+                     + self.children[(module, name)].digest)
+        self.digest = h.digest()
+
+    def to_dict(self):
+        return {'name': self.name,
+                'module': self.module,
+                'fields': self.fields,
+                'digest': self.digest.hex(),
+                'children': [child.to_dict() for child in self.children.values()]}
+
+
+def diff_fields(stmt):
+    """비교용 필드 (enum 은 설명을 빼고 이름/값만)"""
+    record = yang_parsor.node_record(stmt, stmt.arg)
+    if record is None:
+        # choice/case/rpc/input 등 keypath 에만 나타나는 문장
+        return {'kind': stmt.keyword}
+
+    fields = {field: record[field] for field in DIFF_FIELDS if field in record}
+    if 'enum' in fields:
+        fields['enum'] = [[enum['name'], enum.get('value')] for enum in fields['enum']]
+    return fields
+
+
+def module_name(stmt):
+    """노드를 정의한 모듈 이름 (augment 로 더해진 노드는 augment 한 모듈)"""
+    module = getattr(stmt, 'i_module', None)
+    if module is None:
+        return ''
+    return getattr(module, 'i_modulename', module.arg)
+
+
+def build_module_tree(module):
+    """모듈 하나의 해시 트리 (전위 순회로 만들고 역순으로 해시 계산)"""
+    root = SchemaNode(module.arg, {'kind': module.keyword}, module.arg)
+    order = [root]
+    stack = [(child, root) for child in reversed(getattr(module, 'i_children', []))]
+    while stack:
+        stmt, parent = stack.pop()
+        node = SchemaNode(stmt.arg, diff_fields(stmt), module_name(stmt))
+        parent.add_child(node)
+        order.append(node)
+        stack.extend((child, node) for child in reversed(getattr(stmt, 'i_children', [])))
+
+    for node in reversed(order):
+        node.compute_digest()
+    return root
+
+
+def build_tree(directory):
+    """디렉터리 전체의 해시 트리 (최상위 자식이 모듈)"""
+    root = SchemaNode('')
+    for _, module in yang_parsor.load_validated_modules(directory, quiet=True):
+        root.add_child(build_module_tree(module))
+    root.compute_digest()
+    return root
+
+
+def node_from_dict(data):
+    node = SchemaNode(data['name'], data['fields'], data.get('module', ''))
+    node.digest = bytes.fromhex(data['digest'])
+    for child in data['children']:
+        node.add_child(node_from_dict(child))
+    return node
+
+
+def save_tree(tree, filepath):
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(tree.to_dict(), f, ensure_ascii=False)
+
+
+def load_tree(filepath):
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return node_from_dict(json.load(f))
+
+
+def load_or_build(source):
+    """디렉터리/zip 아카이브면 파싱해서 만들고, 그 외 파일이면 저장된 트리를 읽음"""
+    if os.path.isdir(source) or zipfile.is_zipfile(source):
+        return build_tree(source)
+    return load_tree(source)
+
+
+def _join(path, name):
+    return f"{path}/{name}" if path else name
+
+
+def _child_names(*children):
+    """자식 키 -> keypath 에 쓸 이름 (형제 중 같은 이름이 여러 모듈에 있으면 'module:name')"""
+    keys = set().union(*children)
+    counts = Counter(name for _, name in keys)
+    return {key: f"{key[0]}:{key[1]}" if counts[key[1]] > 1 else key[1] for key in keys}
+
+
+def _subtree_changes(node, path, change):
+    """추가/삭제된 서브트리의 노드 (leaf/list/leaf-list/container) 를 keypath 순으로"""
+    stack = [(node, path)]
+    while stack:
+        node, path = stack.pop()
+        if node.fields.get('kind') in yang_parsor.NODE_KINDS:
+            yield {'change': change, 'keypath': path, 'kind': node.fields['kind']}
+        names = _child_names(node.children)
+        stack.extend((child, _join(path, names[key]))
+                     for key, child in reversed(list(node.children.items())))
+
+
+def field_changes(old, new):
+    """필드별 변경 {field: {'old': ..., 'new': ...}} (enum 은 추가/삭제 이름도 포함)"""
+    changes = {}
+    for field in DIFF_FIELDS:
+        before = old.get(field)
+        after = new.get(field)
+        if before == after:
+            continue
+        change = {'old': before, 'new': after}
+        if field == 'enum':
+            before_names = [name for name, _ in before or []]
+            after_names = [name for name, _ in after or []]
+            change['added'] = [name for name in after_names if name not in before_names]
+            change['removed'] = [name for name in before_names if name not in after_names]
+        changes[field] = change
+    return changes
+
+
+def diff_trees(old, new, stats=None):
+    """두 해시 트리의 변경 목록 (added / removed / changed)
+
+    해시가 같은 서브트리는 한 번의 비교로 건너뛰므로 비용은 바뀐 경로 길이와
+    변경 크기에 비례한다. stats 에는 방문/건너뛴 노드 수를 기록한다.
+    """
+    if stats is None:
+        stats = {}
+    stats.setdefault('visited', 0)
+    stats.setdefault('skipped', 0)
+
+    changes = []
+    stack = [(old, new, '')]
+    while stack:
+        old, new, path = stack.pop()
+        stats['visited'] += 1
+        if old.digest == new.digest:
+            stats['skipped'] += 1
+            continue
+
+        if path:
+            fields = field_changes(old.fields, new.fields)
+            if fields:
+                changes.append({'change': 'changed', 'keypath': path,
+                                'kind': new.fields.get('kind'), 'fields': fields})
+
+        names = _child_names(old.children, new.children)
+        pending = []
+        for key, child in old.children.items():
+            child_path = _join(path, names[key])
+            if key not in new.children:
+                changes.extend(_subtree_changes(child, child_path, 'removed'))
+            else:
+                pending.append((child, new.children[key], child_path))
+        for key, child in new.children.items():
+            if key not in old.children:
+                changes.extend(_subtree_changes(child, _join(path, names[key]), 'added'))
+        stack.extend(reversed(pending))
+    return changes
+
+
+def format_value(value):
+    if isinstance(value, list):
+        # enum 은 [이름, 값] 쌍, pattern/invert-pattern/union/identities 는 문자열 목록
+        return ', '.join(item if isinstance(item, str)
+                         else item[0] if item[1] is None else f"{item[0]}={item[1]}"
+                         for item in value)
+    return 'N/A' if value is None else str(value)
+
+
+def format_change(change):
+    if change['change'] == 'added':
+        return f"+ {change['keypath']} ({change['kind']})"
+    if change['change'] == 'removed':
+        return f"- {change['keypath']} ({change['kind']})"
+
+    lines = [f"~ {change['keypath']} ({change['kind']})"]
+    for field, values in change['fields'].items():
+        if field == 'enum':
+            detail = ' '.join([f"+{name}" for name in values['added']] +
+                              [f"-{name}" for name in values['removed']])
+            lines.append(f"    enum: {detail or format_value(values['new'])}")
+        else:
+            lines.append(f"    {field}: {format_value(values['old'])} -> {format_value(values['new'])}")
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='두 YANG 스펙 버전의 스키마 diff')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    build = sub.add_parser('build', help='해시 트리를 만들어 JSON 으로 저장')
+    build.add_argument('directory')
+    build.add_argument('--out', required=True)
+
+    diff = sub.add_parser('diff', help='두 버전 비교 (디렉터리 또는 저장한 트리)')
+    diff.add_argument('old')
+    diff.add_argument('new')
+    diff.add_argument('--json', action='store_true', help='변경 하나당 JSON 한 줄 출력')
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        save_tree(build_tree(args.directory), args.out)
+        print(f"해시 트리 저장 완료: {args.out}")
+        return
+
+    old = load_or_build(args.old)
+    new = load_or_build(args.new)
+    stats = {}
+    changes = diff_trees(old, new, stats)
+    for change in changes:
+        print(json.dumps(change, ensure_ascii=False) if args.json else format_change(change))
+
+    counts = {kind: sum(1 for change in changes if change['change'] == kind)
+              for kind in ('added', 'removed', 'changed')}
+    print(f"추가 {counts['added']} / 삭제 {counts['removed']} / 변경 {counts['changed']}"
+          f" (비교 노드 {stats['visited']}, 동일 서브트리 건너뜀 {stats['skipped']})",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
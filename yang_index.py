@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+YANG keypath 인덱스
+
+extract_node_records 가 만드는 노드 정보로 keypath prefix trie 와
+type/base-type/module/config/mandatory/if-feature 보조 인덱스를 만들고,
+SQLite 파일로 저장해 이후 조회는 파싱 없이 바로 수행한다.
+
+config 는 record 의 명시적인 문장이 아니라 상위에서 상속된 유효 config 로 찾고,
+base-type 은 typedef 를 풀어낸 built-in 타입 (typedef 가 아니면 type 과 같음) 으로 찾는다.
+
+사용법:
+    python3 yang_index.py build ./oru --db yang_index.sqlite
+    python3 yang_index.py query --db yang_index.sqlite --prefix /user-plane-configuration --type uint16
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+from collections import defaultdict
+
+import yang_parsor
+
+# 보조 인덱스를 만드는 필드 (record 키)
+INDEXED_FIELDS = ('kind', 'type', 'base-type', 'module', 'config', 'mandatory', 'if-feature')
+
+
+def indexed_values(record, config=None):
+    """record 의 보조 인덱스 값 {필드: 값}
+
+    config 는 상속된 유효 config (주어지지 않으면 record 의 명시적 config),
+    base-type 은 풀어낸 타입이 따로 없으면 type 이다.
+    """
+    values = {field: record.get(field) for field in INDEXED_FIELDS}
+    values['base-type'] = record.get('base-type', record.get('type'))
+    if config is not None:
+        values['config'] = config
+    return values
+
+
+def filter_field(name):
+    """조회 인자 이름 (base_type 등) -> INDEXED_FIELDS 필드 (없는 필드면 ValueError)"""
+    field = name.replace('_', '-')
+    if field not in INDEXED_FIELDS:
+        raise ValueError(f"알 수 없는 조회 필드: {name}")
+    return field
+
+
+def split_keypath(keypath):
+    return [segment for segment in keypath.split('/') if segment]
+
+
+class KeypathTrie:
+    """keypath 를 '/' 단위로 나눈 prefix trie (노드마다 해당 경로의 record id 목록)"""
+
+    def __init__(self):
+        self.root = {}
+
+    def insert(self, keypath, record_id):
+        node = self.root
+        for segment in split_keypath(keypath):
+            node = node.setdefault(segment, {})
+        node.setdefault(None, []).append(record_id)
+
+    def _collect(self, node, ids):
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            for segment, child in current.items():
+                if segment is None:
+                    ids.extend(child)
+                else:
+                    stack.append(child)
+
+    def prefix(self, prefix):
+        """prefix 아래 (자신 포함) 의 record id 집합
+
+        '/' 로 시작하면 모듈 이름을 제외한 최상위 경로로 보고 모든 모듈에서 찾는다.
+        """
+        segments = split_keypath(prefix)
+        starts = list(self.root.values()) if prefix.startswith('/') else [self.root]
+
+        ids = []
+        for node in starts:
+            for segment in segments:
+                node = node.get(segment)
+                if node is None:
+                    break
+            else:
+                self._collect(node, ids)
+        return set(ids)
+
+    def exact(self, keypath):
+        """keypath 와 정확히 같은 경로의 record id 목록 ('/' 로 시작하면 모든 모듈)"""
+        segments = split_keypath(keypath)
+        starts = list(self.root.values()) if keypath.startswith('/') else [self.root]
+
+        ids = []
+        for node in starts:
+            for segment in segments:
+                node = node.get(segment)
+                if node is None:
+                    break
+            else:
+                ids.extend(node.get(None, ()))
+        return sorted(ids)
+
+
+class KeypathIndex:
+    """노드 record 목록 위의 keypath trie + 보조 인덱스"""
+
+    def __init__(self, records=()):
+        self.records = []
+        self.configs = []
+        self.trie = KeypathTrie()
+        self.by_field = {field: defaultdict(set) for field in INDEXED_FIELDS}
+        for record in records:
+            self.add(record)
+
+    def add(self, record, config=None):
+        """record 추가 (config 는 상속된 유효 config)"""
+        record_id = len(self.records)
+        values = indexed_values(record, config)
+        self.records.append(record)
+        self.configs.append(values['config'])
+        self.trie.insert(record['keypath'], record_id)
+        for field, value in values.items():
+            if value is not None:
+                self.by_field[field][value].add(record_id)
+
+    @classmethod
+    def from_model(cls, model):
+        """yang_parsor.extract_model / load_model 결과의 노드 표로 인덱싱"""
+        index = cls()
+        nodes = model.nodes
+        for row in range(len(nodes)):
+            index.add(nodes.record(row), nodes.effective_config(row))
+        return index
+
+    def lookup(self, keypath):
+        """keypath 가 정확히 같은 record 목록"""
+        return [self.records[record_id] for record_id in self.trie.exact(keypath)]
+
+    @classmethod
+    def from_directory(cls, directory):
+        """yang_parsor 의 batch 로드/검증으로 디렉터리 전체를 인덱싱"""
+        index = cls()
+        extractor = yang_parsor.NodeExtractor(index.add, config=True)
+        for filename, module in yang_parsor.load_validated_modules(directory, quiet=True):
+            yang_parsor.walk_module(module, (extractor,), filename)
+        return index
+
+    def query(self, prefix=None, **filters):
+        """조건을 모두 만족하는 record 목록 (추출 순서)
+
+        filters 키는 INDEXED_FIELDS 중 하나이며 'base-type', 'if-feature' 는
+        base_type, if_feature 로 쓴다.
+        """
+        candidates = None
+        if prefix:
+            candidates = self.trie.prefix(prefix)
+        for name, value in filters.items():
+            if value is None:
+                continue
+            ids = self.by_field[filter_field(name)].get(value, set())
+            candidates = set(ids) if candidates is None else candidates & ids
+        if candidates is None:
+            candidates = range(len(self.records))
+        return [self.records[record_id] for record_id in sorted(candidates)]
+
+    def save(self, db_path):
+        """SQLite 파일로 저장 (기존 내용은 덮어씀)"""
+        conn = sqlite3.connect(db_path)
+        try:
+            conn.execute("DROP TABLE IF EXISTS nodes")
+            conn.execute("""
+                CREATE TABLE nodes (
+                    id INTEGER PRIMARY KEY,
+                    keypath TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    kind TEXT, type TEXT, base_type TEXT, module TEXT,
+                    config TEXT, mandatory TEXT, if_feature TEXT,
+                    record TEXT NOT NULL
+                )""")
+            conn.executemany(
+                "INSERT INTO nodes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                ((record_id, record['keypath'], _module_relative(record['keypath']),
+                  *indexed_values(record, config).values(),
+                  json.dumps(record, ensure_ascii=False))
+                 for record_id, (record, config) in enumerate(zip(self.records, self.configs))))
+            for column in ('keypath', 'path', 'type', 'base_type', 'module', 'config', 'mandatory',
+                           'if_feature'):
+                conn.execute(f"CREATE INDEX idx_nodes_{column} ON nodes ({column})")
+            conn.commit()
+        finally:
+            conn.close()
+
+
+def _module_relative(keypath):
+    """'module/a/b' -> '/a/b' (모듈 이름을 뺀 경로)"""
+    _, _, rest = keypath.partition('/')
+    return f"/{rest}"
+
+
+def query_sqlite(db_path, prefix=None, **filters):
+    """저장된 SQLite 인덱스를 파싱 없이 바로 조회 (KeypathIndex.query 와 같은 의미)"""
+    clauses = []
+    params = []
+    # '/' 만 주면 KeypathTrie.prefix 처럼 prefix 조건 없이 모든 record
+    prefix = prefix.rstrip('/') if prefix else ''
+    if prefix:
+        column = 'path' if prefix.startswith('/') else 'keypath'
+        # 'a/b' 자신과 'a/b/...' 만 일치하도록 범위 조건 사용 ('0' 은 '/' 다음 문자)
+        clauses.append(f"({column} = ? OR ({column} >= ? AND {column} < ?))")
+        params.extend([prefix, prefix + '/', prefix + '0'])
+    for name, value in filters.items():
+        if value is None:
+            continue
+        # 열 이름은 SQL 에 그대로 들어가므로 인덱스 필드만 허용
+        clauses.append(f"{filter_field(name).replace('-', '_')} = ?")
+        params.append(value)
+
+    sql = "SELECT record FROM nodes"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += " ORDER BY id"
+
+    conn = sqlite3.connect(db_path)
+    try:
+        return [json.loads(row[0]) for row in conn.execute(sql, params)]
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='YANG keypath 인덱스 생성/조회')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    build = sub.add_parser('build', help='YANG 디렉터리를 인덱싱해 SQLite 로 저장')
+    build.add_argument('directory', nargs='?', default='./oru')
+    build.add_argument('--db', default='yang_index.sqlite')
+
+    query = sub.add_parser('query', help='저장된 인덱스 조회')
+    query.add_argument('--db', default='yang_index.sqlite')
+    query.add_argument('--prefix', help="keypath prefix ('/' 로 시작하면 모든 모듈)")
+    query.add_argument('--kind', help='leaf / list / leaf-list / container')
+    query.add_argument('--type', help='leaf 타입 (예: uint16, typedef 이름이면 그대로)')
+    query.add_argument('--base-type', help='typedef 를 풀어낸 built-in 타입 (예: uint64)')
+    query.add_argument('--module')
+    query.add_argument('--config', choices=['true', 'false'])
+    query.add_argument('--mandatory', choices=['true', 'false'])
+    query.add_argument('--if-feature')
+    query.add_argument('--json', action='store_true', help='record 를 JSON 한 줄씩 출력')
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        index = KeypathIndex.from_directory(args.directory)
+        index.save(args.db)
+        print(f"인덱스 {len(index.records)}개 저장 완료: {args.db}")
+        return
+
+    records = query_sqlite(args.db, prefix=args.prefix, kind=args.kind, type=args.type,
+                           base_type=args.base_type, module=args.module, config=args.config,
+                           mandatory=args.mandatory, if_feature=args.if_feature)
+    for record in records:
+        if args.json:
+            print(json.dumps(record, ensure_ascii=False))
+        else:
+            print(f"{record['keypath']} ({record.get('type', record['kind'])})")
+    print(f"{len(records)}개", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
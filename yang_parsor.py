@@ -1,247 +1,615 @@
+import argparse
+import contextlib
+import cProfile
+import hashlib
+import io
+import json
+import logging
+import mmap
 import os
-from pyang import context, repository, statements
+import pickle
+import pstats
+import re
+import sys
+import time
+import zipfile
+from array import array
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pyang import context, repository, statements, syntax
+
+logger = logging.getLogger(__name__)
+
+def substmt_index(stmt):
+    """substmts 를 한 번만 훑어 keyword -> 첫 번째 하위 문장 사전을 만들어 문장에 저장
+
+    search_one(keyword) 와 같은 결과를 상수 시간에 돌려주며 모든 추출기가 공유한다.
+    uses 로 복사된 문장은 substmts 리스트가 달라지므로 다시 만든다.
+    """
+    cached = getattr(stmt, '_substmt_index', None)
+    if cached is not None and cached[0] is stmt.substmts:
+        return cached[1]
+
+    index = {}
+    for ch in stmt.substmts:
+        index.setdefault(ch.keyword, ch)
+    stmt._substmt_index = (stmt.substmts, index)
+    return index
+
+
+def substmt_arg(stmt, keyword, default=None):
+    """search_one(keyword).arg 를 인덱스로 조회 (없으면 default)"""
+    sub = substmt_index(stmt).get(keyword)
+    return sub.arg if sub is not None else default
+
+
+TYPE_CACHE_STATS = {'hits': 0, 'misses': 0, 'identity_hits': 0, 'identity_misses': 0}
+
+
+def _enum_list(type_stmt):
+    enums = []
+    for e in type_stmt.search('enum'):
+        enum = {'name': e.arg}
+        enum_value = substmt_arg(e, 'value', '')
+        enum_desc = substmt_arg(e, 'description', '')
+        if enum_value:
+            enum['value'] = enum_value
+        if enum_desc:
+            enum['description'] = enum_desc
+        enums.append(enum)
+    return enums
+
+
+def _identity_name(identity):
+    module = identity.i_module
+    return f"{getattr(module, 'i_modulename', module.arg)}:{identity.arg}"
+
+
+def identity_index(ctx):
+    """컨텍스트의 identity -> 직접 파생된 identity 목록 (id 기준, 모듈 수가 바뀌면 다시 만듦)"""
+    modules = [module for module in ctx.modules.values() if module is not None]
+    cached = getattr(ctx, '_identity_index', None)
+    if cached is not None and cached[0] == len(modules):
+        return cached
+
+    derived = defaultdict(list)
+    for module in modules:
+        for identity in module.i_identities.values():
+            for base in identity.search('base'):
+                target = getattr(base, 'i_identity', None)
+                if target is not None:
+                    derived[id(target)].append(identity)
+    ctx._identity_index = (len(modules), derived)
+    return ctx._identity_index
+
+
+def derived_identities(identity, memo=True):
+    """identity 에서 (간접적으로) 파생된 identity 이름 목록, identity 문장에 캐시"""
+    ctx = getattr(identity.i_module, 'i_ctx', None)
+    if ctx is None:
+        return []
+    version, derived = identity_index(ctx)
+
+    cached = getattr(identity, '_derived_identities', None) if memo else None
+    if cached is not None and cached[0] == version:
+        TYPE_CACHE_STATS['identity_hits'] += 1
+        return cached[1]
+    TYPE_CACHE_STATS['identity_misses'] += 1
+
+    names = []
+    seen = {id(identity)}
+    stack = list(reversed(derived.get(id(identity), [])))
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        names.append(_identity_name(current))
+        stack.extend(reversed(derived.get(id(current), [])))
+    # 컨텍스트의 모듈 로드 순서와 무관하게 같은 결과가 되도록 정렬
+    names.sort()
+    if memo:
+        identity._derived_identities = (version, names)
+    return names
+
+
+def resolve_typedef(typedef, memo=True):
+    """typedef 를 built-in 타입까지 풀어낸 결과 (typedef 문장에 캐시해 모든 leaf/모듈이 공유)"""
+    cached = getattr(typedef, '_resolved_type', None) if memo else None
+    if cached is not None:
+        TYPE_CACHE_STATS['hits'] += 1
+        return cached
+    TYPE_CACHE_STATS['misses'] += 1
+
+    type_stmt = substmt_index(typedef).get('type')
+    resolved = resolve_type(type_stmt, memo) if type_stmt is not None else {'base-type': 'unknown'}
+    if memo:
+        typedef._resolved_type = resolved
+    return resolved
+
+
+def resolve_type(type_stmt, memo=True):
+    """type 문장을 typedef 체인 (import 한 typedef 포함) 을 따라 built-in 타입까지 풀고
+    range/length/pattern/enum 제한을 합친 dict 를 반환
+
+    바깥 (leaf 쪽) 의 range/length/enum 이 안쪽 것을 대신하고 pattern 은 모두 누적한다.
+    pattern 은 (정규식, invert-match 여부) 쌍의 목록이다.
+    union 은 멤버 타입 목록과 멤버 enum 을 합치고 멤버별 결과를 'members' 에 두며,
+    identityref 는 base 에서 파생된 identity 로 펼친다. 반환값은 캐시와 공유되므로 수정하지 않는다.
+    """
+    typedef = getattr(type_stmt, 'i_typedef', None)
+    if typedef is not None:
+        resolved = dict(resolve_typedef(typedef, memo))
+    else:
+        resolved = {'base-type': type_stmt.arg}
+
+    index = substmt_index(type_stmt)
+    restriction = index.get('range') or index.get('length')
+    if restriction is not None:
+        resolved['range/length'] = restriction.arg
+    frac_stmt = index.get('fraction-digits')
+    if frac_stmt is not None:
+        resolved['fraction-digits'] = frac_stmt.arg
+    if 'pattern' in index:
+        resolved['pattern'] = resolved.get('pattern', []) + [
+            (p.arg, substmt_arg(p, 'modifier') == 'invert-match') for p in type_stmt.search('pattern')]
+    if 'enum' in index:
+        resolved['enum'] = _enum_list(type_stmt)
+
+    if type_stmt.arg == 'union':
+        members = [resolve_type(member, memo) for member in type_stmt.search('type')]
+        union = []
+        for member in members:
+            # 중첩된 union 은 펼치고 같은 built-in 타입은 한 번만
+            for base_type in member.get('union') or [member['base-type']]:
+                if base_type not in union:
+                    union.append(base_type)
+        resolved['union'] = union
+        # 멤버별로 풀어낸 타입과 제한 (중첩된 union 은 펼침)
+        resolved['members'] = [nested for member in members
+                               for nested in member.get('members') or [member]]
+        enums = [enum for member in members for enum in member.get('enum', [])]
+        if enums:
+            resolved['enum'] = enums
+    elif 'base' in index:
+        identities = []
+        for base in type_stmt.search('base'):
+            identity = getattr(base, 'i_identity', None)
+            if identity is not None:
+                identities.extend(derived_identities(identity, memo))
+        resolved['identities'] = identities
+    return resolved
+
+
+def type_cache_stats():
+    """typedef/identity 해석 캐시 통계 (hits, misses, hit_rate)"""
+    stats = dict(TYPE_CACHE_STATS)
+    for prefix in ('', 'identity_'):
+        total = stats[f'{prefix}hits'] + stats[f'{prefix}misses']
+        stats[f'{prefix}hit_rate'] = stats[f'{prefix}hits'] / total if total else 0.0
+    return stats
+
+
 
 def extra_node_info(leaf):
     info = {}
     space = '  '
+    index = substmt_index(leaf)
 
-    type_stmt = leaf.search_one('type')
+    type_stmt = index.get('type')
     if type_stmt:
         info['type'] = type_stmt.arg
 
         # Enumeration values
         if type_stmt.arg == 'enumeration':
-            enums = []
-            for e in type_stmt.search('enum'):
-                enum_name = e.arg
-                enum_value = e.search_one('value').arg if e.search_one('value') else ''
-                enum_desc = e.search_one('description').arg if e.search_one('description') else ''
-                
-                if enum_value:
-                    if enum_desc:
-                        enum_entry = f"{enum_name} (value={enum_value}, description={enum_desc})"
-                    else:
-                        enum_entry = f"{enum_name} (value={enum_value})"
-                else:
-                    if enum_desc:
-                        enum_entry = f"{enum_name} (description={enum_desc})"
-                    else:
-                        enum_entry = f"{enum_name}"
-                enums.append(enum_entry)
+            enums = _enum_list(type_stmt)
             if enums:
                 info['enum'] = enums
 
         # Range or Length
-        range_stmt = type_stmt.search_one('range') or type_stmt.search_one('length')
+        type_index = substmt_index(type_stmt)
+        range_stmt = type_index.get('range') or type_index.get('length')
         if range_stmt:
             info['range/length'] = range_stmt.arg
 
         # Fraction-digits
-        frac_stmt = type_stmt.search_one('fraction-digits')
+        frac_stmt = type_index.get('fraction-digits')
         if frac_stmt:
             info['fraction-digits'] = frac_stmt.arg
 
-
-    when_stmt = leaf.search_one('when')
+        # typedef/union/identityref 는 풀어낸 타입에서 빠진 제한을 채움
+        resolved = resolve_type(type_stmt)
+        if resolved['base-type'] != type_stmt.arg:
+            info['base-type'] = resolved['base-type']
+        for field in ('enum', 'range/length', 'fraction-digits'):
+            if field not in info and resolved.get(field):
+                info[field] = resolved[field]
+        for field in ('union', 'identities'):
+            if resolved.get(field):
+                info[field] = resolved[field]
+        # invert-match pattern 은 일치하면 안 되므로 따로 담음
+        patterns = resolved.get('pattern', ())
+        for field, inverted in (('pattern', False), ('invert-pattern', True)):
+            matched = [pattern for pattern, invert in patterns if invert == inverted]
+            if matched:
+                info[field] = matched
+
+    when_stmt = index.get('when')
     if when_stmt:
         info['when'] = when_stmt.arg
         
     # Units
-    units_stmt = leaf.search_one('units')
+    units_stmt = index.get('units')
     if units_stmt:
         info['units'] = units_stmt.arg
 
     # Mandatory
-    mandatory_stmt = leaf.search_one('mandatory')
+    mandatory_stmt = index.get('mandatory')
     if mandatory_stmt:
         info['mandatory'] = mandatory_stmt.arg
 
     # Config
-    config_stmt = leaf.search_one('config')
+    config_stmt = index.get('config')
     if config_stmt:
         info['config'] = config_stmt.arg
 
     # Status
-    status_stmt = leaf.search_one('status')
+    status_stmt = index.get('status')
     if status_stmt:
         info['status'] = status_stmt.arg
 
     # Default
-    default_stmt = leaf.search_one('default')
+    default_stmt = index.get('default')
     if default_stmt:
         info['default'] = default_stmt.arg
 
     # Description
-    desc_stmt = leaf.search_one('description')
+    desc_stmt = index.get('description')
     if desc_stmt:
         info['description'] = desc_stmt.arg
 
     # if-feature
-    feature_stmt = leaf.search_one('if-feature')
+    feature_stmt = index.get('if-feature')
     if feature_stmt:
         info['if-feature'] = feature_stmt.arg
 
     return info
 
-def extract_node_info(stmt, path="", module_name="", filename=""):
-    current_path = f"{path}/{stmt.arg}" if path else stmt.arg
-    entries = []
-
-    if stmt.keyword == 'leaf':
-        info = extra_node_info(stmt)
-
-        leaf_type = info.get('type', 'unknown')
-        description = info.get('description', 'N/A')
+NODE_KINDS = ('leaf', 'list', 'leaf-list', 'container')
 
-        entry = [
-            f"1.Keypath: {current_path}",
-            f"2.Type: leaf ({leaf_type})",
-            f"3.Module: {module_name}",
-            f"4.File: {filename}",
-            f"5.Description: {description}"
-        ]
+# NodeTable 의 유효 config 열 값 (번호 -> 'true'/'false', 0 은 rpc/notification 아래 등 없음)
+CONFIG_VALUES = (None, 'true', 'false')
 
-        # 각각 따로 출력
-        idx=6
-        if 'if-feature' in info:
-            entry.append(f"{idx}.if-feature: {info['if-feature']}")
-            idx+=1
-        if 'when' in info:
-            entry.append(f"{idx}.when: {info['when']}")
-            idx+=1
-        if 'default' in info:
-            entry.append(f"{idx}.Default: {info['default']}")
-            idx+=1
-        if 'units' in info:
-            entry.append(f"{idx}.Units: {info['units']}")
-            idx+=1
-        if 'range/length' in info:
-            entry.append(f"{idx}.Range/Length: {info['range/length']}")
-            idx+=1
-        if 'fraction-digits' in info:
-            entry.append(f"{idx}.Fraction Digits: {info['fraction-digits']}")
-            idx+=1
-        if 'mandatory' in info:
-            entry.append(f"{idx}.Mandatory: {info['mandatory']}")
-            idx+=1
-        if 'config' in info:
-            entry.append(f"{idx}.Config: {info['config']}")
-            idx+=1
-        if 'status' in info:
-            entry.append(f"{idx}.Status: {info['status']}")
-            idx+=1
-        if 'enum' in info:
-            enum_vals = ', '.join(info['enum'])
-            entry.append(f"{idx}.Enum: {enum_vals}")
-            idx+=1
-
-        entries.append('\n'.join(entry))
-
-    elif stmt.keyword == 'list':
-        description = stmt.search_one('description').arg if stmt.search_one('description') else 'N/A'
-        key = stmt.search_one('key').arg if stmt.search_one('key') else ''
-
-        entry = [
-            f"1.Keypath: {current_path}",
-            f"2.Type: list",
-            f"3.Module: {module_name}",
-            f"4.File: {filename}",
-            f"5.Description: {description}"
-        ]
-        if key:
-            entry.append(f"Key: {key}")
 
-        entries.append('\n'.join(entry))
-
-    elif stmt.keyword == 'leaf-list':
-        description = stmt.search_one('description').arg if stmt.search_one('description') else 'N/A'
-        key = stmt.search_one('key').arg if stmt.search_one('key') else ''
-
-        entry = [
-            f"1.Keypath: {current_path}",
-            f"2.Type: leaf-list",
-            f"3.Module: {module_name}",
-            f"4.File: {filename}",
-            f"5.Description: {description}"
-        ]
-        if key:
-            entry.append(f"Key: {key}")
-
-        entries.append('\n'.join(entry))
+def effective_config(stmt):
+    """상속까지 반영한 config ('true'/'false')
 
+    pyang 이 검증하면서 상위의 config false 를 내려 i_config 에 남기므로 그대로 쓴다.
+    rpc/notification 아래처럼 config 가 없는 노드는 None 이다.
+    """
+    config = getattr(stmt, 'i_config', None)
+    if config is None:
+        return None
+    return 'true' if config else 'false'
+
+# leaf 엔트리에 순서대로 번호를 붙여 출력하는 선택 필드 (info 키, 출력 이름)
+LEAF_FIELDS = [
+    ('if-feature', 'if-feature'),
+    ('when', 'when'),
+    ('default', 'Default'),
+    ('units', 'Units'),
+    ('range/length', 'Range/Length'),
+    ('fraction-digits', 'Fraction Digits'),
+    ('mandatory', 'Mandatory'),
+    ('config', 'Config'),
+    ('status', 'Status'),
+    ('enum', 'Enum'),
+    ('base-type', 'Base Type'),
+    ('union', 'Union'),
+    ('pattern', 'Pattern'),
+    ('invert-pattern', 'Pattern (invert-match)'),
+    ('identities', 'Identities'),
+]
+
+
+def node_record(stmt, current_path, module_name="", filename=""):
+    """노드 하나의 구조화된 정보 (leaf/list/leaf-list/container 가 아니면 None)
+
+    leaf 는 extra_node_info 의 필드를, list/leaf-list 는 key 를 담고
+    keypath, kind, module, file 을 공통으로 가진다.
+    """
+    if stmt.keyword not in NODE_KINDS:
+        return None
 
-    elif stmt.keyword == 'container':
-        description = stmt.search_one('description').arg if stmt.search_one('description') else 'N/A'
-        entry = [
-            f"1.Keypath: {current_path}",
-            f"2.Type: container",
-            f"3.Module: {module_name}",
-            f"4.File: {filename}",
-            f"5.Description: {description}"
-        ]
-        entries.append('\n'.join(entry))
+    if stmt.keyword == 'leaf':
+        record = extra_node_info(stmt)
+    else:
+        record = {}
+        index = substmt_index(stmt)
+        desc_stmt = index.get('description')
+        if desc_stmt:
+            record['description'] = desc_stmt.arg
+        if stmt.keyword != 'container':
+            key = substmt_arg(stmt, 'key', '')
+            if key:
+                record['key'] = key
+
+    record['keypath'] = current_path
+    record['kind'] = stmt.keyword
+    record['module'] = module_name
+    record['file'] = filename
+    return record
+
+
+def format_enum(enum):
+    """enum 하나를 'name (value=..., description=...)' 형식으로 포맷"""
+    if 'value' in enum:
+        if 'description' in enum:
+            return f"{enum['name']} (value={enum['value']}, description={enum['description']})"
+        return f"{enum['name']} (value={enum['value']})"
+    if 'description' in enum:
+        return f"{enum['name']} (description={enum['description']})"
+    return f"{enum['name']}"
+
+
+def format_node_record(record):
+    """node_record 를 yang_output.txt 의 엔트리 문자열로 포맷"""
+    kind = record['kind']
+    type_label = f"leaf ({record.get('type', 'unknown')})" if kind == 'leaf' else kind
+    entry = [
+        f"1.Keypath: {record['keypath']}",
+        f"2.Type: {type_label}",
+        f"3.Module: {record['module']}",
+        f"4.File: {record['file']}",
+        f"5.Description: {record.get('description', 'N/A')}"
+    ]
+
+    if kind == 'leaf':
+        # 각각 따로 출력
+        idx = 6
+        for field, label in LEAF_FIELDS:
+            if field in record:
+                value = record[field]
+                if field == 'enum':
+                    value = ', '.join(format_enum(enum) for enum in value)
+                elif isinstance(value, list):
+                    value = ', '.join(value)
+                entry.append(f"{idx}.{label}: {value}")
+                idx += 1
+    elif record.get('key'):
+        entry.append(f"Key: {record['key']}")
+
+    return '\n'.join(entry)
+
+
+def format_node_entry(stmt, current_path, module_name="", filename=""):
+    """노드 하나의 엔트리 문자열 (leaf/list/leaf-list/container 가 아니면 None)"""
+    record = node_record(stmt, current_path, module_name, filename)
+    return format_node_record(record) if record is not None else None
+
+
+def keypath_filter(prefixes):
+    """keypath prefix 목록으로 path -> (keep, descend) 판정 함수를 만듦 (없으면 None)
+
+    keep 은 경로가 prefix 와 같거나 그 아래일 때, descend 는 keep 이거나 경로가
+    prefix 의 조상이라 더 내려가야 할 때 참이다. '/' 로 시작하는 prefix 는
+    모듈 이름을 뺀 경로로 보고 모든 모듈에 적용한다.
+    """
+    if not prefixes:
+        return None
+    qualified = [prefix.rstrip('/') for prefix in prefixes if not prefix.startswith('/')]
+    relative = [prefix.rstrip('/') for prefix in prefixes if prefix.startswith('/')]
+
+    def match(path):
+        descend = False
+        candidates = [(prefix, path) for prefix in qualified]
+        if relative:
+            _, sep, rest = path.partition('/')
+            candidates += [(prefix, f"/{rest}" if sep else '') for prefix in relative]
+        for prefix, value in candidates:
+            if value == prefix or value.startswith(prefix + '/'):
+                return True, True
+            if prefix.startswith(value + '/'):
+                descend = True
+        return False, descend
+
+    return match
+
+
+def prefix_modules(prefixes):
+    """모듈 이름으로 시작하는 prefix 의 모듈 이름 집합 ('/' prefix 가 있으면 None = 전체)"""
+    if any(prefix.startswith('/') for prefix in prefixes):
+        return None
+    return {prefix.split('/', 1)[0] for prefix in prefixes}
+
+
+def extract_node_records(stmt, path="", module_name="", filename="", prefixes=None):
+    """스키마 트리를 명시적 스택으로 전위 순회하며 node_record 를 생성
+
+    재귀 버전과 같은 keypath 를 같은 순서로 내보내며, 깊은 augment 체인에서도
+    재귀 한도에 걸리지 않는다. 자식별 진단 출력은 DEBUG 레벨 로그로만 남긴다.
+    prefixes 가 주어지면 그 keypath 아래의 노드만 내보내고 다른 서브트리는 내려가지 않는다.
+    """
+    debug = logger.isEnabledFor(logging.DEBUG)
+    match = keypath_filter(prefixes)
+    stack = [(stmt, path, False)]
+    while stack:
+        stmt, path, is_child = stack.pop()
+        if debug and is_child:
+            logger.debug("child:%s/%s", stmt.keyword, stmt.arg)
+
+        current_path = f"{path}/{stmt.arg}" if path else stmt.arg
+        keep = True
+        if match is not None:
+            keep, descend = match(current_path)
+            if not descend:
+                continue
+        record = node_record(stmt, current_path, module_name, filename) if keep else None
+        if record is not None:
+            yield record
+
+        children = getattr(stmt, 'i_children', [])
+        stack.extend((child, current_path, True) for child in reversed(children))
+
+
+def extract_node_info(stmt, path="", module_name="", filename="", prefixes=None):
+    """extract_node_records 결과를 엔트리 문자열로 생성"""
+    for record in extract_node_records(stmt, path, module_name, filename, prefixes):
+        yield format_node_record(record)
+
+def file_signature(st):
+    """파일이 바뀌었는지 비교하는 (inode, mtime, 크기)"""
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+class SourceLineIndex:
+    """파일의 줄 시작 오프셋 표를 한 번 만들고, mmap 버퍼를 잘라 줄을 상수 시간에 반환
+
+    signature 는 만들 때의 파일 상태이며, 파일이 바뀌면 get_source_index 가 다시 만든다.
+    """
+
+    def __init__(self, filepath):
+        self.f = open(filepath, 'rb')
+        st = os.fstat(self.f.fileno())
+        self.signature = file_signature(st)
+        self.size = st.st_size
+        self.buf = mmap.mmap(self.f.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b''
+
+        offsets = array('Q', [0])
+        pos = self.buf.find(b'\n')
+        while pos != -1:
+            offsets.append(pos + 1)
+            pos = self.buf.find(b'\n', pos + 1)
+        # 파일이 줄바꿈으로 끝나면 마지막 오프셋은 줄이 아님 (readlines 와 동일)
+        if len(offsets) > 1 and offsets[-1] == self.size:
+            offsets.pop()
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.offsets) if self.size else 0
+
+    def line(self, line):
+        """1 부터 시작하는 줄 번호의 내용 (앞뒤 공백 제거, 범위 밖이면 None)"""
+        if not 0 < line <= len(self):
+            return None
+        start = self.offsets[line - 1]
+        end = self.offsets[line] if line < len(self.offsets) else self.size
+        # 확인 뒤에 파일이 잘렸으면 mmap 의 사라진 영역을 읽지 않음 (SIGBUS)
+        if end > os.fstat(self.f.fileno()).st_size:
+            return None
+        return self.buf[start:end].decode('utf-8').strip()
+
+    def close(self):
+        if self.size:
+            self.buf.close()
+        self.f.close()
+
+
+MAX_OPEN_SOURCES = 64
+_source_indexes = OrderedDict()
+
+
+def get_source_index(filepath):
+    """파일별 SourceLineIndex 를 크기 제한 LRU 로 재사용
+
+    조회마다 stat 해서 (inode, mtime, 크기) 가 달라졌으면 닫고 다시 만든다.
+    """
+    signature = file_signature(os.stat(filepath))
+    index = _source_indexes.get(filepath)
+    if index is not None:
+        if index.signature == signature:
+            _source_indexes.move_to_end(filepath)
+            return index
+        del _source_indexes[filepath]
+        index.close()
+
+    index = SourceLineIndex(filepath)
+    _source_indexes[filepath] = index
+    if len(_source_indexes) > MAX_OPEN_SOURCES:
+        _, oldest = _source_indexes.popitem(last=False)
+        oldest.close()
+    return index
+
+
+def clear_source_cache():
+    """열어 둔 소스 파일 인덱스를 모두 닫음 (파일이 바뀐 뒤 호출)"""
+    while _source_indexes:
+        _, index = _source_indexes.popitem()
+        index.close()
 
-    for child in getattr(stmt, 'i_children', []):
-        print(f"child:{child.keyword}/{child.arg}")
-        entries.extend(extract_node_info(child, current_path, module_name, filename))
 
-    return entries
-    
 def get_source_code(filepath, line):
     """YANG 파일에서 특정 라인의 소스 코드 추출"""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-            return lines[line-1].strip() if 0 < line <= len(lines) else "N/A"
+        text = get_source_index(filepath).line(line)
+        return text if text is not None else "N/A"
     except Exception:
         return "N/A"
 
-def extract_rpc_info(module, filename):
-    entries = []
-    for stmt in module.i_children:
-        if stmt.keyword == 'rpc':
-            description = stmt.search_one('description').arg if stmt.search_one('description') else ''
-            feature = stmt.search_one('if-feature').arg if stmt.search_one('if-feature') else ''
-            entry = [
-                f"1.Name: {stmt.arg}",
-                f"2.Type: RPC",
-                f"3.Module: {module.arg}",
-                f"4.File: {filename}",
-                f"5.Description: {description or 'N/A'}"
-            ]
-
-            idx=6
-            if feature:
-                entry.append(f"{idx}.if-feature: {feature}")
-                idx+=1
-
-            # input 블록
-            input_stmt = stmt.search_one('input')
-            if input_stmt:
-                input_fields = format_stmt_children(input_stmt, indent='  ')
-                entry.append(f"{idx}.Input:")
-                idx+=1
-                if input_fields:
-                    entry.extend(input_fields)
-                else:
-                    entry.append("  - (no input fields)")
-
-            # output 블록
-            output_stmt = stmt.search_one('output')
-            if output_stmt:
-                output_fields = format_stmt_children(output_stmt, indent='  ')
-                entry.append(f"{idx}.Output:")
-                idx+=1
-                if output_fields:
-                    entry.extend(output_fields)
-                else:
-                    entry.append("  - (no output fields)")
 
-            
+def get_source_lines(locations):
+    """(파일 경로, 줄 번호) 목록의 소스 코드를 한 번에 추출"""
+    return [get_source_code(filepath, line) for filepath, line in locations]
 
-            entries.append('\n'.join(entry))
-
-    return entries
+def _operations(module, keyword, prefixes=None):
+    """모듈의 rpc/notification 문장 (prefixes 가 있으면 그 keypath 에 걸리는 것만)"""
+    match = keypath_filter(prefixes)
+    for stmt in module.i_children:
+        if stmt.keyword == keyword:
+            if match is None or match(f"{module.arg}/{stmt.arg}")[1]:
+                yield stmt
+
+
+def format_rpc_entry(stmt, module, filename, parts=None):
+    """RPC 하나의 엔트리 문자열
+
+    parts 는 순회 중에 미리 만든 {'input'/'output': 필드 줄 목록} 이며, 없으면 직접 만든다.
+    """
+    if parts is None:
+        index = substmt_index(stmt)
+        parts = {part: format_stmt_children(index[part], indent='  ')
+                 for part in ('input', 'output') if index.get(part)}
+    description = substmt_arg(stmt, 'description', '')
+    feature = substmt_arg(stmt, 'if-feature', '')
+    entry = [
+        f"1.Name: {stmt.arg}",
+        f"2.Type: RPC",
+        f"3.Module: {module.arg}",
+        f"4.File: {filename}",
+        f"5.Description: {description or 'N/A'}"
+    ]
+
+    idx=6
+    if feature:
+        entry.append(f"{idx}.if-feature: {feature}")
+        idx+=1
+
+    # input 블록
+    if 'input' in parts:
+        input_fields = parts['input']
+        entry.append(f"{idx}.Input:")
+        idx+=1
+        if input_fields:
+            entry.extend(input_fields)
+        else:
+            entry.append("  - (no input fields)")
+
+    # output 블록
+    if 'output' in parts:
+        output_fields = parts['output']
+        entry.append(f"{idx}.Output:")
+        idx+=1
+        if output_fields:
+            entry.extend(output_fields)
+        else:
+            entry.append("  - (no output fields)")
+
+    return '\n'.join(entry)
+
+
+def extract_rpc_info(module, filename, prefixes=None):
+    for stmt in _operations(module, 'rpc', prefixes):
+        yield format_rpc_entry(stmt, module, filename)
 
 def extract_section_from_description(description, keywords):
     if not description:
@@ -264,13 +632,41 @@ def extract_section_from_description(description, keywords):
     return '\n'.join(result_lines) if result_lines else None
 
 
+def field_line(child, indent='  '):
+    """RPC/Notification 하위 필드 (leaf/container/list/leaf-list) 한 줄"""
+    description = substmt_arg(child, 'description', '')
+    if child.keyword == 'leaf':
+        leaf_type = substmt_arg(child, 'type', '')
+        type_stmt = substmt_index(child).get('type')
+        leaf_range = substmt_arg(type_stmt, 'range', '') if type_stmt else ''
+
+        line = f"{indent}- {child.arg} (type: {leaf_type}"
+
+        if leaf_range:
+            line += f", range:{leaf_range})"
+        else:
+            line += ")"
+
+        if description:
+            line += f" — {description}"
+        return line
+
+    if child.keyword == 'container':
+        return f"{indent}- container {child.arg}: {description}"
+
+    key = substmt_arg(child, 'key', '')
+    if key:
+        return f"{indent}- {child.keyword} {child.arg} (key: {key}) — {description}"
+    return f"{indent}- {child.keyword} {child.arg} — {description}"
+
+
 def format_stmt_children(stmt, indent='  '):
     lines = []
     for child in getattr(stmt, 'i_children', []):
 
         if stmt.keyword == 'type' and stmt.arg == 'enumeration':
-            leaf_type = child.search_one('type').arg if child.search_one('type') else ''
-            description = child.search_one('description').arg if child.search_one('description') else ''
+            leaf_type = substmt_arg(child, 'type', '')
+            description = substmt_arg(child, 'description', '')
             line = f"{indent}- {child.arg} (type: {leaf_type})"
             
             ######### 잘안됨
@@ -300,137 +696,1670 @@ def format_stmt_children(stmt, indent='  '):
                 line += f" — {description}"
             lines.append(line)
 
-        elif child.keyword == 'leaf':
-            leaf_type = child.search_one('type').arg if child.search_one('type') else ''
-            type_stmt = child.search_one('type')
-            if type_stmt:
-                leaf_range = type_stmt.search_one('range').arg if type_stmt.search_one('range') else ''
-            description = child.search_one('description').arg if child.search_one('description') else ''
-            
-            line = f"{indent}- {child.arg} (type: {leaf_type}"
+        elif child.keyword in NODE_KINDS:
+            lines.append(field_line(child, indent))
+            if child.keyword != 'leaf':
+                lines.extend(format_stmt_children(child, indent + '  '))
+
+        elif child.keyword == 'uses':
+            grouping = getattr(child, 'i_grouping', None)
+            if grouping:
+                lines.append(f"{indent}- uses {child.arg} (expands to:)")
+                lines.extend(format_stmt_children(grouping, indent + '  '))
 
+    return lines
+
+
+def format_notification_entry(stmt, module, filename, fields=None):
+    """Notification 하나의 엔트리 문자열 (fields 는 순회 중에 미리 만든 필드 줄 목록)"""
+    description = substmt_arg(stmt, 'description', '')
+    feature = substmt_arg(stmt, 'if-feature', '')
+
+    #example = extract_section_from_description(description, ['example', '예:', '예제'])
+    #format_info = extract_section_from_description(description, ['format', '형식'])
+
+    entry = [
+        f"1.Name: {stmt.arg}",
+        f"2.Type: Notification",
+        f"3.Module: {module.arg}",
+        f"4.File: {filename}",
+        f"5.Description: {description or 'N/A'}"
+    ]
+    idx = 6
+    if feature:
+        entry.append(f"{idx}.if-feature: {feature}")
+        idx+=1
+
+    #if format_info:
+    #    entry.append("Format:")
+    #    entry.append(format_info)
+
+    #if example:
+    #    entry.append("Example:")
+    #    entry.append(example)
+
+    # 하위 필드 정보 (uses 포함)
+    if fields is None:
+        fields = format_stmt_children(stmt, indent='  ')
+    if fields:
+        entry.append(f"{idx}.Fields:")
+        entry.extend(fields)
+
+    return '\n'.join(entry)
+
+
+def extract_notification_info(module, filename, prefixes=None):
+    for stmt in _operations(module, 'notification', prefixes):
+        yield format_notification_entry(stmt, module, filename)
+
+
+def field_record(child):
+    """RPC/Notification 하위 필드 하나의 record (children 제외)"""
+    record = {'name': child.arg, 'kind': child.keyword}
+    description = substmt_arg(child, 'description')
+    if description:
+        record['description'] = description
+
+    if child.keyword == 'leaf':
+        type_stmt = substmt_index(child).get('type')
+        if type_stmt:
+            record['type'] = type_stmt.arg
+            leaf_range = substmt_arg(type_stmt, 'range')
             if leaf_range:
-                line += f", range:{leaf_range})"
-            else:
-                line += ")"
+                record['range'] = leaf_range
+    else:
+        key = substmt_arg(child, 'key')
+        if key:
+            record['key'] = key
+    return record
 
-            if description:
-                line += f" — {description}"
 
-            lines.append(line)
+def children_records(stmt):
+    """format_stmt_children 과 같은 하위 필드를 구조화된 목록으로 반환"""
+    records = []
+    for child in getattr(stmt, 'i_children', []):
+        if child.keyword not in NODE_KINDS:
+            continue
 
-        elif child.keyword == 'container':
-            description = child.search_one('description').arg if child.search_one('description') else ''
-            lines.append(f"{indent}- container {child.arg}: {description}")
-            lines.extend(format_stmt_children(child, indent + '  '))
+        record = field_record(child)
+        if child.keyword in ('container', 'list'):
+            record['children'] = children_records(child)
+        records.append(record)
+    return records
 
-        elif child.keyword == 'list':
-            key = child.search_one('key').arg if child.search_one('key') else ''
-            description = child.search_one('description').arg if child.search_one('description') else ''
-            if key:
-                lines.append(f"{indent}- list {child.arg} (key: {key}) — {description}")
-            else:
-                lines.append(f"{indent}- list {child.arg} — {description}")
-            lines.extend(format_stmt_children(child, indent + '  '))
 
-        elif child.keyword == 'leaf-list':
-            key = child.search_one('key').arg if child.search_one('key') else ''
-            description = child.search_one('description').arg if child.search_one('description') else ''
-            if key:
-                lines.append(f"{indent}- leaf-list {child.arg} (key: {key}) — {description}")
-            else:
-                lines.append(f"{indent}- leaf-list {child.arg} — {description}")
-            lines.extend(format_stmt_children(child, indent + '  '))
+def _rpc_or_notification_record(stmt, kind, module, filename):
+    record = {'record': kind, 'name': stmt.arg, 'module': module.arg, 'file': filename}
+    description = substmt_arg(stmt, 'description')
+    if description:
+        record['description'] = description
+    feature = substmt_arg(stmt, 'if-feature')
+    if feature:
+        record['if-feature'] = feature
+    return record
 
-        elif child.keyword == 'uses':
-            grouping = getattr(child, 'i_grouping', None)
-            if grouping:
-                lines.append(f"{indent}- uses {child.arg} (expands to:)")
-                lines.extend(format_stmt_children(grouping, indent + '  '))
 
-    return lines
+def rpc_record(stmt, module, filename, parts=None):
+    """RPC 하나의 구조화된 record (input/output 은 없으면 생략, parts 는 미리 만든 하위 필드)"""
+    record = _rpc_or_notification_record(stmt, 'rpc', module, filename)
+    if parts is None:
+        index = substmt_index(stmt)
+        parts = {part: children_records(index[part])
+                 for part in ('input', 'output') if index.get(part)}
+    for part in ('input', 'output'):
+        if part in parts:
+            record[part] = parts[part]
+    return record
 
-def extract_notification_info(module, filename):
-    entries = []
-    for stmt in module.i_children:
-        if stmt.keyword == 'notification':
-            description = stmt.search_one('description').arg if stmt.search_one('description') else ''
-            feature = stmt.search_one('if-feature').arg if stmt.search_one('if-feature') else ''
-            
-            #example = extract_section_from_description(description, ['example', '예:', '예제'])
-            #format_info = extract_section_from_description(description, ['format', '형식'])
 
-            entry = [
-                f"1.Name: {stmt.arg}",
-                f"2.Type: Notification",                
-                f"3.Module: {module.arg}",
-                f"4.File: {filename}",
-                f"5.Description: {description or 'N/A'}"
-            ]
-            idx = 6
-            if feature:
-                entry.append(f"{idx}.if-feature: {feature}")
-                idx+=1
+def notification_record(stmt, module, filename, fields=None):
+    """Notification 하나의 구조화된 record"""
+    record = _rpc_or_notification_record(stmt, 'notification', module, filename)
+    record['fields'] = children_records(stmt) if fields is None else fields
+    return record
 
-            #if format_info:
-            #    entry.append("Format:")
-            #    entry.append(format_info)
 
-            #if example:
-            #    entry.append("Example:")
-            #    entry.append(example)
+def extract_rpc_records(module, filename, prefixes=None):
+    """extract_rpc_info 와 같은 정보를 구조화된 record 로 생성"""
+    for stmt in _operations(module, 'rpc', prefixes):
+        yield rpc_record(stmt, module, filename)
 
-            # 하위 필드 정보 (uses 포함)
-            fields = format_stmt_children(stmt, indent='  ')
-            if fields:
-                entry.append(f"{idx}.Fields:")
-                entry.extend(fields)
 
-            entries.append('\n'.join(entry))
+def extract_notification_records(module, filename, prefixes=None):
+    """extract_notification_info 와 같은 정보를 구조화된 record 로 생성"""
+    for stmt in _operations(module, 'notification', prefixes):
+        yield notification_record(stmt, module, filename)
 
-    return entries
 
+def _to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return value
+
+
+def typed_node_record(record):
+    """JSONL 용 노드 record: config/mandatory 는 bool, 숫자 인자는 int 로 변환"""
+    typed = {'record': 'node'}
+    for key in ('keypath', 'kind', 'module', 'file'):
+        typed[key] = record[key]
+    for key, value in record.items():
+        if key in typed:
+            continue
+        if key in ('config', 'mandatory'):
+            value = value == 'true'
+        elif key == 'fraction-digits':
+            value = _to_int(value)
+        elif key == 'enum':
+            value = [dict(enum, value=_to_int(enum['value'])) if 'value' in enum else enum
+                     for enum in value]
+        elif key == 'range/length':
+            key = 'range'
+        typed[key] = value
+    return typed
+
+
+def dump_json_record(record):
+    return json.dumps(record, ensure_ascii=False)
+
+
+WALK_STATS = {'modules': 0, 'visits': 0}
+
+
+class Extractor:
+    """walk_module 에 등록하는 추출기
+
+    keywords 의 문장을 만날 때마다 visit(stmt, keypath, state, keep) 가 호출되고,
+    반환값이 그 문장 자식들의 state 가 된다. nested_keywords 의 문장은 state 가
+    None 이 아닐 때 (부모가 state 를 넘겼을 때) 만 visit 이 호출된다. visit 이 호출되지
+    않은 문장의 자식에게는 None 이 넘어간다. keep 은 prefixes 범위 안이면 참이며, state 가 None 이 아닌
+    서브트리는 범위 밖이어도 끝까지 순회한다 (RPC 처럼 통째로 내보내는 경우).
+    augment/deviation 처럼 모듈 최상위 문장은 begin 에서 module 로 직접 다룬다.
+    """
+
+    keywords = ()
+    nested_keywords = ()
+
+    def begin(self, module, filename):
+        """모듈 순회 시작 (반환값이 모듈 최상위 자식들의 state)"""
+        return None
 
-def process_yang_directory(directory,
-                           output_node='yang_output.txt',
-                           output_rpc='yang_rpc.txt',
-                           output_notif='yang_notification.txt'):
-    repos = repository.FileRepository(directory)
-    ctx = context.Context(repos)
+    def visit(self, stmt, keypath, state, keep):
+        return None
+
+    def end(self, module, filename):
+        """모듈 순회 끝"""
+
+
+class NodeExtractor(Extractor):
+    """leaf/list/leaf-list/container 의 node_record (extract_node_records 와 같은 순서)
+
+    config 이면 sink 를 (record, effective_config) 두 인자로 호출한다.
+    """
 
-    node_entries = []
-    rpc_entries = []
-    notif_entries = []
+    keywords = NODE_KINDS
 
-    for filename in os.listdir(directory):
-        if filename.endswith('.yang'):
-            file_path = os.path.join(directory, filename)
-            print(f"{file_path}")
-            with open(file_path, 'r', encoding='utf-8') as f:
-                text = f.read()
+    def __init__(self, sink=None, config=False):
+        self.records = []
+        self.sink = sink or self.records.append
+        self.config = config
 
+    def begin(self, module, filename):
+        self.module_name = module.arg
+        self.filename = filename
+
+    def visit(self, stmt, keypath, state, keep):
+        if keep:
+            record = node_record(stmt, keypath, self.module_name, self.filename)
+            if self.config:
+                self.sink(record, effective_config(stmt))
+            else:
+                self.sink(record)
+
+
+class KeywordExtractor(Extractor):
+    """keywords 문장의 (keypath, 문장) 목록 (top_level 이면 모듈 바로 아래 것만)
+
+    action 처럼 트리 안의 문장을 모으거나 RPC/Notification 문장만 골라 둘 때 쓴다.
+    """
+
+    def __init__(self, keywords, top_level=False):
+        self.keywords = tuple(keywords)
+        self.top_level = top_level
+        self.found = []
+
+    def visit(self, stmt, keypath, state, keep):
+        if not self.top_level or keypath.count('/') == 1:
+            self.found.append((keypath, stmt))
+
+
+class OperationExtractor(Extractor):
+    """최상위 rpc/notification 엔트리를 순회하면서 만듦
+
+    하위 필드 줄 (text) 이나 record (jsonl) 를 방문할 때 바로 붙이므로
+    format_stmt_children / children_records 로 서브트리를 다시 순회하지 않는다.
+    input/output 은 rpc 에 명시된 경우에만 내보낸다 (format_rpc_entry 와 같음).
+    """
+
+    def __init__(self, keyword, output_format='text'):
+        self.keyword = keyword
+        self.output_format = output_format
+        self.keywords = (keyword,)
+        self.nested_keywords = ('input', 'output') + NODE_KINDS
+        self.entries = []
+        self.pending = []
+
+    def begin(self, module, filename):
+        self.module = module
+        self.filename = filename
+
+    def visit(self, stmt, keypath, state, keep):
+        if stmt.keyword == self.keyword:
+            if keypath.count('/') != 1:
+                return None
+            if self.keyword == 'notification':
+                fields = []
+                self.pending.append((stmt, fields))
+                return ('  ', fields)
+            parts = {}
+            self.pending.append((stmt, parts))
+            return (substmt_index(stmt), parts)
+
+        if stmt.keyword in ('input', 'output'):
+            # rpc 바로 아래에서만 (index, parts) state 가 넘어옴
+            if not isinstance(state[0], dict) or not state[0].get(stmt.keyword):
+                return None
+            fields = state[1][stmt.keyword] = []
+            return ('  ', fields)
+
+        if isinstance(state[0], dict):
+            return None
+        indent, fields = state
+        if self.output_format == 'jsonl':
+            record = field_record(stmt)
+            fields.append(record)
+            if stmt.keyword in ('container', 'list'):
+                record['children'] = []
+                return (indent, record['children'])
+            return None
+        fields.append(field_line(stmt, indent))
+        return None if stmt.keyword == 'leaf' else (indent + '  ', fields)
+
+    def end(self, module, filename):
+        for stmt, fields in self.pending:
+            if self.output_format == 'jsonl':
+                if self.keyword == 'rpc':
+                    record = rpc_record(stmt, module, filename, fields)
+                else:
+                    record = notification_record(stmt, module, filename, fields)
+                self.entries.append(dump_json_record(record))
+            elif self.keyword == 'rpc':
+                self.entries.append(format_rpc_entry(stmt, module, filename, fields))
+            else:
+                self.entries.append(format_notification_entry(stmt, module, filename, fields))
+        self.pending = []
+
+
+def walk_module(module, extractors, filename='', prefixes=None):
+    """모듈 스키마 트리를 한 번만 전위 순회하며 keyword 별로 추출기에 분배
+
+    i_children 의 각 문장은 정확히 한 번 방문하고, 방문 수 (모듈 자신 포함) 를 반환하며
+    WALK_STATS 에 누적한다. prefixes 가 주어지면 범위 밖 서브트리는 내려가지 않는다.
+    """
+    # keyword -> [(추출기 번호, nested 여부)]
+    dispatch = defaultdict(list)
+    for i, extractor in enumerate(extractors):
+        for keyword in extractor.keywords:
+            dispatch[keyword].append((i, False))
+        for keyword in extractor.nested_keywords:
+            dispatch[keyword].append((i, True))
+    # 모든 state 가 None 인 경우는 같은 tuple 을 공유해 비교/생성 비용을 줄임
+    empty = (None,) * len(extractors)
+    match = keypath_filter(prefixes)
+
+    states = tuple(extractor.begin(module, filename) for extractor in extractors)
+    if states == empty:
+        states = empty
+    visits = 1
+    stack = []
+    if match is None or match(module.arg)[1] or states is not empty:
+        stack.extend((child, module.arg, states) for child in reversed(module.i_children))
+    while stack:
+        stmt, path, states = stack.pop()
+        keypath = f"{path}/{stmt.arg}"
+        keep = True
+        if match is not None:
+            keep, descend = match(keypath)
+            if not descend and states is empty:
+                continue
+        visits += 1
+
+        child_states = empty
+        for i, nested in dispatch.get(stmt.keyword, ()):
+            state = states[i]
+            if nested and state is None:
+                continue
+            state = extractors[i].visit(stmt, keypath, state, keep)
+            if state is not None:
+                if child_states is empty:
+                    child_states = list(empty)
+                child_states[i] = state
+        if child_states is not empty:
+            child_states = tuple(child_states)
+
+        children = getattr(stmt, 'i_children', None)
+        if children:
+            stack.extend((child, keypath, child_states) for child in reversed(children))
+
+    for extractor in extractors:
+        extractor.end(module, filename)
+    WALK_STATS['modules'] += 1
+    WALK_STATS['visits'] += visits
+    return visits
+
+
+def walk_stats():
+    """walk_module 누적 통계 (모듈 수, 문장 방문 수)"""
+    return dict(WALK_STATS)
+
+
+OUTPUT_FORMATS = ('text', 'jsonl')
+
+
+def module_entries(module, filename, output_format='text', prefixes=None):
+    """모듈 하나의 (노드, RPC, Notification) 엔트리 문자열 생성기
+
+    text 는 기존 번호 매긴 형식, jsonl 은 record 하나당 JSON 한 줄이다.
+    prefixes 가 주어지면 해당 keypath 아래만 추출한다.
+    세 종류 모두 walk_module 한 번의 순회로 만든다 (노드 엔트리 포맷은 기록할 때).
+    """
+    nodes = NodeExtractor()
+    rpcs = OperationExtractor('rpc', output_format)
+    notifications = OperationExtractor('notification', output_format)
+    walk_module(module, (nodes, rpcs, notifications), filename, prefixes)
+
+    if output_format == 'jsonl':
+        node_entries = (dump_json_record(typed_node_record(record)) for record in nodes.records)
+    else:
+        node_entries = map(format_node_record, nodes.records)
+    return node_entries, iter(rpcs.entries), iter(notifications.entries)
+
+
+# 이 길이 이하의 필드 값 (type, config, status 등) 은 intern 해서 노드끼리 공유
+INTERN_MAX_LENGTH = 64
+
+
+class NodeTable:
+    """노드 record 를 열 배열로 보관하는 압축 저장소
+
+    keypath 는 (부모 경로 번호, 마지막 segment) 의 경로 trie 로 저장하고,
+    module/file 이름은 문자열 표의 번호로, 선택 필드는 필드 이름 tuple (shape)
+    번호와 값 tuple 로 저장한다. 엔트리 문자열은 entries() 로 기록할 때만 만든다.
+    config 열은 record 에 없는 상속된 config (effective_config) 이다.
+    """
+
+    __slots__ = ('segments', 'parents', 'strings', 'shapes', 'path', 'kind', 'module', 'file',
+                 'shape', 'values', 'config', '_chain', '_string_ids', '_shape_ids')
+
+    def __init__(self):
+        self.segments = []           # 경로 trie 노드의 마지막 segment
+        self.parents = array('i')    # 경로 trie 노드의 부모 (-1 이면 모듈)
+        self.strings = []            # module/file 이름
+        self.shapes = []             # 선택 필드 이름 tuple
+        self.path = array('I')
+        self.kind = array('B')
+        self.module = array('I')
+        self.file = array('I')
+        self.shape = array('I')
+        self.values = []
+        self.config = array('B')
+        self._chain = []
+        self._string_ids = {}
+        self._shape_ids = {}
+
+    def __len__(self):
+        return len(self.path)
+
+    def _string_id(self, value):
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            string_id = self._string_ids[value] = len(self.strings)
+            self.strings.append(sys.intern(value))
+        return string_id
+
+    def _path_id(self, keypath):
+        # 전위 순회 순서로 추가되므로 직전 keypath 의 조상 경로만 들고 있으면 부모를 찾을 수 있음
+        chain = self._chain
+        segments = keypath.split('/')
+        depth = 0
+        while depth < len(chain) and depth < len(segments) and chain[depth][0] == segments[depth]:
+            depth += 1
+        del chain[depth:]
+        parent = chain[-1][1] if chain else -1
+        for segment in segments[depth:]:
+            path_id = len(self.segments)
+            self.segments.append(sys.intern(segment))
+            self.parents.append(parent)
+            chain.append((segment, path_id))
+            parent = path_id
+        return parent
+
+    def add(self, record, config=None):
+        """node_record 하나와 그 유효 config 를 추가하고 행 번호를 반환"""
+        fields = tuple(key for key in record if key not in ('keypath', 'kind', 'module', 'file'))
+        shape_id = self._shape_ids.get(fields)
+        if shape_id is None:
+            shape_id = self._shape_ids[fields] = len(self.shapes)
+            self.shapes.append(fields)
+
+        self.path.append(self._path_id(record['keypath']))
+        self.kind.append(NODE_KINDS.index(record['kind']))
+        self.module.append(self._string_id(record['module']))
+        self.file.append(self._string_id(record['file']))
+        self.shape.append(shape_id)
+        self.config.append(CONFIG_VALUES.index(config))
+        self.values.append(tuple(sys.intern(value)
+                                 if isinstance(value, str) and len(value) <= INTERN_MAX_LENGTH
+                                 else value
+                                 for value in map(record.get, fields)))
+        return len(self.path) - 1
+
+    def keypath(self, row):
+        segments = []
+        path_id = self.path[row]
+        while path_id != -1:
+            segments.append(self.segments[path_id])
+            path_id = self.parents[path_id]
+        return '/'.join(reversed(segments))
+
+    def effective_config(self, row):
+        return CONFIG_VALUES[self.config[row]]
+
+    def record(self, row):
+        """행을 node_record 와 같은 dict (같은 키 순서) 로 복원"""
+        record = dict(zip(self.shapes[self.shape[row]], self.values[row]))
+        record['keypath'] = self.keypath(row)
+        record['kind'] = NODE_KINDS[self.kind[row]]
+        record['module'] = self.strings[self.module[row]]
+        record['file'] = self.strings[self.file[row]]
+        return record
+
+    def rows(self, files=None, prefixes=None):
+        """files (파일 이름) 와 prefixes (keypath) 에 걸리는 행 번호 (없으면 전체)"""
+        if files is None and not prefixes:
+            return range(len(self))
+        match = keypath_filter(prefixes)
+        file_ids = None if files is None else {self._string_ids.get(filename) for filename in files}
+        return (row for row in range(len(self))
+                if (file_ids is None or self.file[row] in file_ids)
+                and (match is None or match(self.keypath(row))[0]))
+
+    def records(self, rows=None):
+        return map(self.record, range(len(self)) if rows is None else rows)
+
+    def entries(self, output_format='text', rows=None):
+        """기록용 엔트리 문자열 생성기 (module_entries 의 노드 엔트리와 같음)"""
+        if output_format == 'jsonl':
+            return (dump_json_record(typed_node_record(record)) for record in self.records(rows))
+        return map(format_node_record, self.records(rows))
+
+
+class OperationRecord:
+    """RPC/Notification 하나 (문장을 참조만 하고 엔트리는 기록할 때 포맷)"""
+
+    __slots__ = ('kind', 'stmt', 'module', 'filename')
+
+    def __init__(self, kind, stmt, module, filename):
+        self.kind = kind
+        self.stmt = stmt
+        self.module = module
+        self.filename = sys.intern(filename)
+
+    @property
+    def name(self):
+        return self.stmt.arg
+
+    @property
+    def module_name(self):
+        return self.module.arg
+
+    def record(self):
+        if self.kind == 'rpc':
+            return rpc_record(self.stmt, self.module, self.filename)
+        return notification_record(self.stmt, self.module, self.filename)
+
+    def entry(self, output_format='text'):
+        if output_format == 'jsonl':
+            return dump_json_record(self.record())
+        if self.kind == 'rpc':
+            return format_rpc_entry(self.stmt, self.module, self.filename)
+        return format_notification_entry(self.stmt, self.module, self.filename)
+
+    def __reduce__(self):
+        # pyang 문장 트리는 저장하지 않고 두 형식의 내용만 남김
+        return (StoredOperation, (self.kind, self.name, self.module_name, self.filename,
+                                  self.entry('text'), self.record()))
+
+
+class StoredOperation:
+    """스냅샷에서 읽은 RPC/Notification (OperationRecord 와 같은 인터페이스)"""
+
+    __slots__ = ('kind', 'name', 'module_name', 'filename', 'text', '_record')
+
+    def __init__(self, kind, name, module_name, filename, text, record):
+        self.kind = kind
+        self.name = name
+        self.module_name = module_name
+        self.filename = filename
+        self.text = text
+        self._record = record
+
+    def record(self):
+        return self._record
+
+    def entry(self, output_format='text'):
+        return dump_json_record(self._record) if output_format == 'jsonl' else self.text
+
+    def __reduce__(self):
+        return (StoredOperation, (self.kind, self.name, self.module_name, self.filename,
+                                  self.text, self._record))
+
+
+class ExtractedModel:
+    """여러 모듈의 노드 표와 RPC/Notification 목록"""
+
+    __slots__ = ('nodes', 'rpcs', 'notifications')
+
+    def __init__(self):
+        self.nodes = NodeTable()
+        self.rpcs = []
+        self.notifications = []
+
+    def add_module(self, module, filename, prefixes=None):
+        nodes = NodeExtractor(self.nodes.add, config=True)
+        operations = KeywordExtractor(('rpc', 'notification'), top_level=True)
+        walk_module(module, (nodes, operations), filename, prefixes)
+        for _, stmt in operations.found:
+            records = self.rpcs if stmt.keyword == 'rpc' else self.notifications
+            records.append(OperationRecord(stmt.keyword, stmt, module, filename))
+
+    def operations(self, records, files=None, prefixes=None):
+        """files/prefixes 에 걸리는 RPC/Notification (_operations 와 같은 기준)"""
+        match = keypath_filter(prefixes)
+        return [record for record in records
+                if (files is None or record.filename in files)
+                and (match is None or match(f"{record.module_name}/{record.name}")[1])]
+
+    def entries(self, output_format='text', files=None, prefixes=None):
+        """(노드, RPC, Notification) 엔트리 생성기 (EntryWriter 에 그대로 넘김)
+
+        files/prefixes 를 주면 scoped 추출과 같은 범위만 내보낸다.
+        """
+        return (self.nodes.entries(output_format, self.nodes.rows(files, prefixes)),
+                (record.entry(output_format)
+                 for record in self.operations(self.rpcs, files, prefixes)),
+                (record.entry(output_format)
+                 for record in self.operations(self.notifications, files, prefixes)))
+
+
+def extract_model(modules, prefixes=None):
+    """(파일 이름, 모듈) 목록을 ExtractedModel 로 추출
+
+    엔트리 문자열 목록 대신 압축된 표를 메모리에 두고, 텍스트는 entries() 로
+    기록할 때만 만든다.
+    """
+    model = ExtractedModel()
+    for filename, module in modules:
+        model.add_module(module, filename, prefixes)
+    return model
+
+
+def load_jsonl(filepath):
+    """jsonl 출력 파일의 record 를 한 줄씩 지연 로드"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+# (pid, 아카이브 키, mtime, 크기) -> ZipFile. fork 된 워커는 파일 오프셋을 공유하지 않도록 따로 연다.
+_archives = {}
+
+
+def _open_archive(path):
+    stat = os.stat(path)
+    key = (os.getpid(), path, stat.st_mtime_ns, stat.st_size)
+    archive = _archives.get(key)
+    if archive is None:
+        archive = _archives[key] = zipfile.ZipFile(path)
+    return archive
+
+
+class YangSource:
+    """디렉터리, zip 아카이브, 또는 아카이브가 든 디렉터리의 .yang 파일 목록과 내용
+
+    아카이브 멤버 (아카이브 안의 zip 포함) 는 디스크에 풀지 않고 바로 읽는다.
+    디렉터리의 .yang 파일이 먼저 (listdir 순서), 그 다음 아카이브 멤버가 이름순으로 온다.
+    같은 파일 이름이 여러 번 나오면 처음 것을 쓴다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.files = {}
+        self.archives = {}
+        if os.path.isfile(path):
+            self._add_archive(path, _open_archive(path))
+            return
+
+        archives = []
+        for filename in os.listdir(path):
+            file_path = os.path.join(path, filename)
+            if filename.endswith('.yang'):
+                self.files.setdefault(filename, (None, file_path))
+            elif filename.endswith('.zip') and os.path.isfile(file_path):
+                archives.append(file_path)
+        for archive_path in sorted(archives):
+            self._add_archive(archive_path, _open_archive(archive_path))
+
+    def __reduce__(self):
+        # 프로세스 풀로 넘길 때는 경로만 보내고 워커에서 다시 연다
+        return (YangSource, (self.path,))
+
+    def _add_archive(self, key, archive):
+        self.archives[key] = archive
+        for member in archive.namelist():
+            if member.endswith('.yang'):
+                self.files.setdefault(os.path.basename(member), (key, member))
+            elif member.endswith('.zip'):
+                nested = zipfile.ZipFile(io.BytesIO(archive.read(member)))
+                self._add_archive(f"{key}/{member}", nested)
+
+    def filenames(self):
+        return list(self.files)
+
+    def display_path(self, filename):
+        key, member = self.files[filename]
+        return member if key is None else f"{key}/{member}"
+
+    def read_bytes(self, filename):
+        key, member = self.files[filename]
+        if key is None:
+            with open(member, 'rb') as f:
+                return f.read()
+        return self.archives[key].read(member)
+
+    def read_text(self, filename):
+        return self.read_bytes(filename).decode('utf-8')
+
+    def repository(self):
+        """import/include 를 해석할 pyang repository"""
+        if not self.archives:
+            return repository.FileRepository(self.path)
+        fallback = self.path if os.path.isdir(self.path) else ''
+        return ArchiveRepository(self, repository.FileRepository(fallback))
+
+
+class ArchiveRepository(repository.Repository):
+    """YangSource 의 파일 (아카이브 멤버 포함) 을 먼저, 나머지는 FileRepository 로 찾는 repository"""
+
+    def __init__(self, source, fallback):
+        repository.Repository.__init__(self)
+        self.source = source
+        self.fallback = fallback
+        self.modules = None
+
+    def get_modules_and_revisions(self, ctx):
+        if self.modules is None:
+            self.modules = []
+            for filename in self.source.filenames():
+                match = syntax.re_filename.search(filename)
+                if match is not None:
+                    name, rev, in_format = match.groups()
+                    self.modules.append((name, rev, ('source', filename, in_format)))
+            for name, rev, handle in self.fallback.get_modules_and_revisions(ctx):
+                self.modules.append((name, rev, ('fallback', handle)))
+        return self.modules
+
+    def get_module_from_handle(self, handle):
+        if handle[0] == 'fallback':
+            return self.fallback.get_module_from_handle(handle[1])
+        _, filename, in_format = handle
+        try:
+            text = self.source.read_text(filename)
+        except (OSError, KeyError, UnicodeDecodeError) as e:
+            raise self.ReadError(f"{self.source.display_path(filename)}: {e}")
+        return self.source.display_path(filename), in_format or 'yang', text
+
+
+def yang_source(path):
+    """경로 (디렉터리 / zip / 아카이브 디렉터리) 또는 이미 만든 YangSource 를 YangSource 로"""
+    if isinstance(path, YangSource):
+        return path
+    return YangSource(path)
+
+
+def load_yang_files(ctx, directory, instrumentation=None, only=None, quiet=False):
+    """디렉터리 (또는 아카이브) 의 .yang 파일을 모두 컨텍스트에 추가 (검증은 호출자가 한 번만 수행)
+
+    instrumentation 이 주어지면 파일별 파싱 시간을 기록한다.
+    only 가 주어지면 그 파일들만 추가한다.
+    quiet 이면 파일 경로를 출력하지 않고 에러는 stderr 로 보낸다 (stdout 이 결과인 도구용).
+    """
+    source = yang_source(directory)
+    modules = []
+    for filename in source.filenames():
+        if only is not None and filename not in only:
+            continue
+        if not quiet:
+            print(f"{source.display_path(filename)}")
+        text = source.read_text(filename)
+
+        start = time.perf_counter() if instrumentation is not None else 0.0
+        try:
+            module = ctx.add_module(filename, text)
+            if module is None:
+                raise ValueError("모듈 파싱 실패")
+            modules.append((filename, module))
+        except Exception as e:
+            print(f"에러 발생: {filename} - {e}", file=sys.stderr if quiet else sys.stdout)
+        if instrumentation is not None:
+            instrumentation.add(filename, 'parse', time.perf_counter() - start)
+
+    return modules
+
+
+def validate_context(ctx, directory, quiet=False):
+    """컨텍스트를 한 번 검증 (예외는 에러로 출력, quiet 이면 stderr 로)"""
+    try:
+        ctx.validate()
+    except Exception as e:
+        print(f"에러 발생: {directory} - {e}", file=sys.stderr if quiet else sys.stdout)
+
+
+def load_validated_modules(directory, quiet=False):
+    """디렉터리를 batch 로드/검증하고 [(파일명, 모듈), ...] 을 반환
+
+    quiet 이면 진행 출력 없이 에러만 stderr 로 보낸다.
+    """
+    source = yang_source(directory)
+    ctx = context.Context(source.repository())
+    modules = load_yang_files(ctx, source, quiet=quiet)
+    validate_context(ctx, directory, quiet)
+    return modules
+
+
+HEADER_RE = re.compile(r'^\s*(module|submodule)\s+([A-Za-z_][\w.-]*)\s*\{', re.M)
+IMPORT_RE = re.compile(r'^\s*import\s+([A-Za-z_][\w.-]*)\s*[{;]', re.M)
+INCLUDE_RE = re.compile(r'^\s*include\s+([A-Za-z_][\w.-]*)\s*[{;]', re.M)
+BELONGS_TO_RE = re.compile(r'^\s*belongs-to\s+([A-Za-z_][\w.-]*)\s*[{;]', re.M)
+IMPORT_PREFIX_RE = re.compile(r'^\s*import\s+([A-Za-z_][\w.-]*)\s*\{[^}]*?\bprefix\s+["\']?([\w.-]+)', re.M)
+AUGMENT_RE = re.compile(r'^\s*(?:augment|deviation)\s+["\']?(/?)([\w.-]+:)?', re.M)
+IDENTITY_BASE_RE = re.compile(r'^\s*identity\s+[\w.-]+\s*\{[^}]*?\bbase\s+["\']?([\w.-]+):', re.M)
+
+
+def scan_yang_header(text):
+    """전체 파싱 없이 module 이름, import/include/belongs-to, augment 대상 모듈,
+    identity base 를 가져오는 모듈 추출"""
+    header = HEADER_RE.search(text)
+    belongs_to = BELONGS_TO_RE.search(text)
+    imports = IMPORT_RE.findall(text)
+
+    # 최상위 augment/deviation 경로의 첫 prefix 로 대상 모듈을 추정하고,
+    # prefix 를 import 에서 찾지 못하면 import 한 모듈 전체를 대상으로 본다.
+    # uses 안의 상대 경로 augment 는 자기 모듈 안에서만 적용되므로 제외한다.
+    prefixes = {prefix: name for name, prefix in IMPORT_PREFIX_RE.findall(text)}
+    augment_targets = set()
+    for absolute, prefix in AUGMENT_RE.findall(text):
+        if not absolute:
+            continue
+        target = prefixes.get(prefix[:-1])
+        if target is not None:
+            augment_targets.add(target)
+        else:
+            augment_targets.update(imports)
+
+    # 다른 모듈의 identity 에서 파생하는 경우 (identityref 해석 결과에 영향)
+    identity_bases = {prefixes[prefix] for prefix in IDENTITY_BASE_RE.findall(text)
+                      if prefix in prefixes}
+
+    return {
+        'keyword': header.group(1) if header else None,
+        'name': header.group(2) if header else None,
+        'imports': imports,
+        'includes': INCLUDE_RE.findall(text),
+        'belongs-to': belongs_to.group(1) if belongs_to else None,
+        'augment-targets': sorted(augment_targets),
+        'identity-bases': sorted(identity_bases),
+    }
+
+
+def scan_yang_file(directory, filename):
+    """.yang 파일 하나의 헤더와 내용 해시"""
+    source = yang_source(directory)
+    print(f"{source.display_path(filename)}")
+    data = source.read_bytes(filename)
+    header = scan_yang_header(data.decode('utf-8'))
+    header['sha256'] = hashlib.sha256(data).hexdigest()
+    return header
+
+
+def scan_yang_directory(directory):
+    """디렉터리의 .yang 파일 헤더와 내용 해시 수집 (전체 파싱 없음)"""
+    source = yang_source(directory)
+    headers = {}
+    for filename in source.filenames():
+        headers[filename] = scan_yang_file(source, filename)
+    return headers
+
+
+def module_closures(headers):
+    """모듈별로 컨텍스트에 명시적으로 추가해야 하는 파일 집합
+
+    import/include 대상은 pyang 이 repository 에서 직접 불러오므로,
+    명시적으로 추가해야 하는 파일은 모듈 자신과, 그 모듈을 include 하거나
+    augment/deviation 대상으로 삼는 디렉터리 내 모듈들뿐이다.
+    """
+    dependents = defaultdict(set)
+    derivers = defaultdict(set)
+    for filename, header in headers.items():
+        for dep in header['augment-targets']:
+            dependents[dep].add(filename)
+        for dep in header['includes']:
+            dependents[dep].add(filename)
+        for dep in header.get('identity-bases', ()):
+            derivers[dep].add(filename)
+
+    by_name = {header['name']: filename for filename, header in headers.items() if header['name']}
+    closures = {}
+    for filename, header in headers.items():
+        needed = {filename} | dependents[header['name']]
+        parent = header['belongs-to']
+        if parent in by_name:
+            needed |= {by_name[parent]} | dependents[parent]
+        if derivers:
+            needed |= _identity_derivers(header, headers, derivers)
+        closures[filename] = frozenset(needed)
+    return closures
+
+
+def _identity_derivers(header, headers, derivers):
+    """모듈과 그 import 대상의 identity 에서 (간접적으로) 파생하는 디렉터리 내 모듈
+
+    identityref 는 컨텍스트에 있는 파생 identity 로 펼쳐지므로, 이 모듈들이
+    함께 로드되어야 batch 실행과 같은 결과가 나온다.
+    """
+    needed = set()
+    pending = [header['name']] + list(header['imports'])
+    seen = set(pending)
+    while pending:
+        for filename in derivers.get(pending.pop(), ()):
+            needed.add(filename)
+            name = headers[filename]['name']
+            if name not in seen:
+                seen.add(name)
+                pending.append(name)
+    return needed
+
+
+def scoped_files(headers, roots=None, prefixes=None):
+    """루트 모듈 / keypath prefix 로 범위를 좁힐 때 추출할 파일과 로드할 파일
+
+    전체 파싱 없이 헤더 스캔으로 만든 closure 만 사용한다.
+    반환값: (추출 대상 파일 집합, 컨텍스트에 추가할 파일 집합), 범위 제한이 없으면 None
+    """
+    names = set(roots or ())
+    if prefixes:
+        modules = prefix_modules(prefixes)
+        if modules is None and not names:
+            # '/' 로 시작하는 prefix 만 있으면 모든 모듈을 봐야 함
+            return None
+        names |= modules or set()
+    if not names:
+        return None
+
+    by_name = {header['name']: filename for filename, header in headers.items() if header['name']}
+    missing = sorted(name for name in names if name not in by_name and name not in headers)
+    if missing:
+        raise ValueError(f"모듈을 찾을 수 없음: {', '.join(missing)}")
+
+    owned = {by_name.get(name, name) for name in names}
+    closures = module_closures(headers)
+    needed = set()
+    for filename in owned:
+        needed |= closures[filename]
+    return owned, needed
+
+
+def group_modules_by_closure(directory, headers=None, only=None):
+    """같은 파일 집합이 필요한 모듈끼리 묶음
+
+    반환값: [(추가할 파일 목록, 추출 대상 파일 목록), ...]
+    only 가 주어지면 해당 파일들만 추출 대상으로 삼는다.
+    """
+    if headers is None:
+        headers = scan_yang_directory(directory)
+
+    groups = defaultdict(list)
+    for filename, needed in module_closures(headers).items():
+        if only is None or filename in only:
+            groups[needed].append(filename)
+
+    return sorted((sorted(needed), sorted(owned)) for needed, owned in groups.items())
+
+
+def _entry_name(entry, output_format='text'):
+    """엔트리에서 keypath/이름 추출 (정렬용)"""
+    if output_format == 'jsonl':
+        record = json.loads(entry)
+        return record.get('keypath', record.get('name'))
+    # '1.Keypath: ...' / '1.Name: ...' 첫 줄
+    return entry.split('\n', 1)[0].split(': ', 1)[1]
+
+
+def _extract_group(directory, filenames, owned, output_format='text', prefixes=None, timed=False):
+    """작업 단위: 필요한 파일만으로 컨텍스트를 재구성하고 owned 모듈을 추출
+
+    반환값: ({파일명: {'node': [...], 'rpc': [...], 'notif': [...]}}, 에러 목록, 모듈별 계측)
+    각 레코드는 (모듈 이름, keypath/이름, 엔트리 문자열) 이다.
+    timed 이면 Instrumentation 과 같은 모듈별 항목 (parse/validate/extract 시간, 건수,
+    트리 통계) 을 {파일명: 항목} 으로 함께 반환하고, 아니면 빈 dict 이다.
+    """
+    source = yang_source(directory)
+    ctx = context.Context(source.repository())
+    modules = {}
+    errors = []
+    timings = defaultdict(dict)
+
+    # augment 로 붙는 자식 순서가 batch 실행과 같도록 load_yang_files 와 같은 순서로 추가
+    order = {filename: i for i, filename in enumerate(source.filenames())}
+    for filename in sorted(filenames, key=lambda filename: order.get(filename, len(order))):
+        text = source.read_text(filename)
+        start = time.perf_counter()
+        try:
+            module = ctx.add_module(filename, text)
+            if module is None:
+                raise ValueError("모듈 파싱 실패")
+            modules[filename] = module
+        except Exception as e:
+            if filename in owned:
+                errors.append((filename, str(e)))
+        if timed:
+            timings[filename]['parse'] = time.perf_counter() - start
+
+    if timed:
+        # Instrumentation.validate 와 같이 추가한 순서대로 하나씩 검증해 모듈별 시간을 잼
+        # (순서가 다르면 augment 자식 순서가 달라짐)
+        for filename, module in modules.items():
+            start = time.perf_counter()
             try:
-                module = ctx.add_module(filename, text)
-                ctx.validate()
-                module_name = module.arg
+                statements.validate_module(ctx, module)
+            except Exception as e:
+                if filename in owned:
+                    errors.append((filename, str(e)))
+            timings[filename]['validate'] = time.perf_counter() - start
+    try:
+        ctx.validate()
+    except Exception as e:
+        errors.append((directory, str(e)))
+
+    results = {}
+    for filename in owned:
+        module = modules.get(filename)
+        if module is None:
+            continue
+        try:
+            start = time.perf_counter()
+            visits = WALK_STATS['visits']
+            module_name = module.arg
+            results[filename] = {
+                kind: [(module_name, _entry_name(entry, output_format), entry) for entry in entries]
+                for kind, entries in zip(('node', 'rpc', 'notif'),
+                                         module_entries(module, filename, output_format, prefixes))
+            }
+            if timed:
+                entry = timings[filename]
+                entry['extract'] = time.perf_counter() - start
+                entry['module'] = module_name
+                entry['visits'] = WALK_STATS['visits'] - visits
+                entry['nodes'], entry['rpcs'], entry['notifications'] = (
+                    len(results[filename][kind]) for kind in ('node', 'rpc', 'notif'))
+                entry['max_depth'], entry['grouping_expansions'] = tree_stats(module)
+        except Exception as e:
+            errors.append((filename, str(e)))
+
+    return results, errors, dict(timings)
+
+
+def pack_groups(groups, workers):
+    """그룹을 workers 개의 작업으로 묶음
+
+    작업마다 컨텍스트를 새로 만들어야 하므로, 추가되는 파일 합집합이 가장 적게
+    늘어나는 작업에 큰 그룹부터 배정해 중복 파싱을 줄이고 부하를 맞춘다.
+    """
+    bins = [(set(), []) for _ in range(min(workers, len(groups)))]
+    for filenames, owned in sorted(groups, key=lambda group: len(group[0]), reverse=True):
+        needed, bin_owned = min(bins, key=lambda b: len(b[0] | set(filenames)))
+        needed.update(filenames)
+        bin_owned.extend(owned)
+    return [(sorted(needed), sorted(owned)) for needed, owned in bins if owned]
+
+
+def run_groups(directory, tasks, workers=None, output_format='text', prefixes=None,
+               instrumentation=None):
+    """작업 목록을 실행 (workers 가 있으면 프로세스 풀) 하고 에러를 출력
+
+    instrumentation 이 주어지면 작업마다 잰 모듈별 계측을 합친다.
+    """
+    timed = instrumentation is not None
+    results = {}
+    errors = []
+    if workers:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_extract_group, directory, filenames, owned, output_format, prefixes,
+                                   timed)
+                       for filenames, owned in tasks]
+            outcomes = [future.result() for future in futures]
+    else:
+        outcomes = (_extract_group(directory, filenames, owned, output_format, prefixes, timed)
+                    for filenames, owned in tasks)
+    for res, errs, timings in outcomes:
+        results.update(res)
+        errors.extend(errs)
+        for filename, entry in timings.items():
+            instrumentation.merge(filename, entry)
+
+    for filename, message in sorted(errors):
+        print(f"에러 발생: {filename} - {message}")
+
+    return results
+
+
+def collect_entries(results, filenames, ordered=False):
+    """파일별 결과를 노드/RPC/Notification 엔트리 목록으로 합침
+
+    ordered 이면 (모듈, keypath) 순으로 정렬한다. 같은 keypath 가 여러 augment 로
+    생길 수 있으므로 엔트리 전체를 마지막 키로 써서 순서를 고정한다.
+    """
+    collected = []
+    for kind in ('node', 'rpc', 'notif'):
+        records = [record for filename in filenames if filename in results
+                   for record in results[filename][kind]]
+        if ordered:
+            records = sorted(tuple(record) for record in records)
+        collected.append([entry for _, _, entry in records])
+    return collected
+
+
+def extract_parallel(directory, workers, output_format='text', only=None, prefixes=None,
+                     instrumentation=None):
+    """모듈 그룹 단위로 프로세스 풀에서 추출하고 (모듈, keypath) 순으로 정렬해 반환"""
+    tasks = pack_groups(group_modules_by_closure(directory, only=only), workers)
+    results = run_groups(directory, tasks, workers, output_format, prefixes, instrumentation)
+    return collect_entries(results, sorted(results), ordered=True)
+
+
+def _code_hash():
+    """추출 코드가 바뀌면 캐시가 무효화되도록 이 파일의 해시를 키에 포함"""
+    with open(__file__, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def module_dependency_files(headers, closures):
+    """모듈별로 추출 결과에 영향을 주는 디렉터리 내 파일 집합
+
+    컨텍스트에 추가하는 파일 (module_closures) 과 그 파일들이
+    import/include/belongs-to 로 끌어오는 파일까지 모두 포함한다.
+    """
+    by_name = {header['name']: filename for filename, header in headers.items() if header['name']}
+    dependencies = {}
+    for filename, needed in closures.items():
+        seen = set()
+        stack = list(needed)
+        while stack:
+            current = stack.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            header = headers[current]
+            for dep in header['imports'] + header['includes'] + [header['belongs-to']]:
+                if dep in by_name:
+                    stack.append(by_name[dep])
+        dependencies[filename] = seen
+    return dependencies
+
+
+def module_cache_keys(headers, closures, output_format='text', prefixes=None):
+    """모듈별 캐시 키: 추출 결과에 영향을 주는 파일들의 내용 해시"""
+    code_hash = f"{_code_hash()}:{output_format}"
+    if prefixes:
+        code_hash += ':' + json.dumps(sorted(prefixes))
+    keys = {}
+    for filename, seen in module_dependency_files(headers, closures).items():
+        digest = hashlib.sha256(f"{code_hash}:{filename}\n".encode('utf-8'))
+        for dep_file in sorted(seen):
+            digest.update(f"{dep_file}:{headers[dep_file]['sha256']}\n".encode('utf-8'))
+        keys[filename] = digest.hexdigest()
+    return keys
+
+
+class ExtractionCache:
+    """모듈 추출 결과를 내용 해시 키로 저장하는 디스크 캐시
+
+    파일 하나에 모듈 하나의 결과를 JSON 으로 저장하고, 전체 크기가 max_bytes 를
+    넘으면 가장 오래 사용하지 않은(mtime 기준) 항목부터 지운다.
+    """
+
+    def __init__(self, cache_dir='.yang_cache', max_bytes=256 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                record = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return record
+
+    def put(self, key, record):
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(record, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def clear(self):
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.json'):
+                os.remove(os.path.join(self.cache_dir, name))
+
+    def evict(self):
+        """크기 제한을 넘으면 오래된 항목부터 제거"""
+        entries = []
+        total = 0
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.json'):
+                stat = os.stat(os.path.join(self.cache_dir, name))
+                entries.append((stat.st_mtime, stat.st_size, name))
+                total += stat.st_size
+
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.remove(os.path.join(self.cache_dir, name))
+            total -= size
+
+
+def extract_cached(directory, cache, workers=None, output_format='text', only=None, prefixes=None,
+                   headers=None, instrumentation=None):
+    """캐시에 있는 모듈은 파싱/검증 없이 재사용하고 나머지만 추출
+
+    only 가 주어지면 그 파일들만 추출 대상으로 삼는다. instrumentation 에는 추출한
+    모듈의 계측을 합치고, 캐시에서 가져온 모듈은 'cached' 로 표시한다.
+    """
+    if headers is None:
+        headers = scan_yang_directory(directory)
+    closures = module_closures(headers)
+    keys = module_cache_keys(headers, closures, output_format, prefixes)
+
+    results = {}
+    for filename, key in keys.items():
+        if only is not None and filename not in only:
+            continue
+        record = cache.get(key)
+        if record is not None:
+            results[filename] = record
+            if instrumentation is not None:
+                instrumentation.merge(filename, {'module': headers[filename]['name'], 'cached': True})
+
+    missed = {filename for filename in headers
+              if filename not in results and (only is None or filename in only)}
+    if missed:
+        tasks = pack_groups(group_modules_by_closure(directory, headers, only=missed), workers or 1)
+        fresh = run_groups(directory, tasks, workers, output_format, prefixes, instrumentation)
+        for filename, record in fresh.items():
+            cache.put(keys[filename], record)
+        results.update(fresh)
+
+    cache.evict()
+    if workers:
+        return collect_entries(results, sorted(results), ordered=True)
+    return collect_entries(results, list(headers))
+
+
+SNAPSHOT_VERSION = 2
+
+
+def source_hashes(directory):
+    """소스의 .yang 파일별 내용 SHA-256"""
+    source = yang_source(directory)
+    return {filename: hashlib.sha256(source.read_bytes(filename)).hexdigest()
+            for filename in source.filenames()}
+
+
+def save_snapshot(filepath, model, hashes):
+    """추출한 모델을 pickle 로 저장 (임시 파일 후 교체)
+
+    헤더 (버전, 코드 해시, 소스 해시) 를 별도의 첫 pickle 로 쓰고 모델은 그 뒤에 쓴다.
+    """
+    header = {'version': SNAPSHOT_VERSION, 'code': _code_hash(), 'hashes': hashes}
+    tmp_path = f"{filepath}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.dump(model, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, filepath)
+
+
+def load_snapshot(filepath, hashes):
+    """스냅샷의 버전/코드/소스 해시가 모두 같으면 모델을, 아니면 None 을 반환
+
+    헤더를 먼저 읽어 비교하므로 다른 코드로 만든 모델은 풀지 않는다. 모델을 푸는 중의
+    어떤 예외도 (클래스 정의가 바뀐 경우 등) 스냅샷 없음으로 보고 다시 만든다.
+    pickle 이므로 직접 만든 스냅샷만 읽어야 한다.
+    """
+    try:
+        with open(filepath, 'rb') as f:
+            header = pickle.load(f)
+            if (not isinstance(header, dict) or header.get('version') != SNAPSHOT_VERSION
+                    or header.get('code') != _code_hash() or header.get('hashes') != hashes):
+                return None
+            return pickle.load(f)
+    except Exception:
+        return None
 
-                node_entries.extend(extract_node_info(module, module_name=module_name, filename=filename))
-                rpc_entries.extend(extract_rpc_info(module, filename))
-                notif_entries.extend(extract_notification_info(module, filename))
 
+def load_model(directory, snapshot=None, rebuild=False):
+    """스냅샷이 유효하면 바로 읽고, 아니면 파싱/검증/추출 후 스냅샷을 다시 저장
+
+    파일이 하나라도 추가/삭제/수정되면 해시가 달라져 자동으로 다시 만든다.
+    """
+    hashes = source_hashes(directory)
+    if snapshot and not rebuild:
+        model = load_snapshot(snapshot, hashes)
+        if model is not None:
+            return model
+
+    model = extract_model(load_validated_modules(directory))
+    if snapshot:
+        save_snapshot(snapshot, model, hashes)
+        print(f"스냅샷 저장 완료: {snapshot}")
+    return model
+
+
+def tree_stats(module):
+    """모듈 스키마 트리의 최대 깊이와 펼쳐진 uses (grouping 확장) 수
+
+    pyang 은 grouping 에서 복사한 노드에 i_uses 를 남기므로, 첫 번째 uses 문장의
+    개수가 그 모듈 트리에서 실제로 펼쳐진 grouping 수다.
+    """
+    max_depth = 0
+    uses = set()
+    stack = [(child, 1) for child in getattr(module, 'i_children', [])]
+    while stack:
+        stmt, depth = stack.pop()
+        if depth > max_depth:
+            max_depth = depth
+        stmt_uses = getattr(stmt, 'i_uses', None)
+        if stmt_uses:
+            uses.add(id(stmt_uses[0]))
+        stack.extend((child, depth + 1) for child in getattr(stmt, 'i_children', []))
+    return max_depth, len(uses)
+
+
+class Instrumentation:
+    """process_yang_directory 의 단계별/모듈별 계측 (요청했을 때만 생성)
+
+    꺼져 있을 때는 호출 경로에 None 검사만 남으므로 추가 비용이 없다.
+    """
+
+    MODULE_FIELDS = ('parse', 'validate', 'extract', 'write')
+
+    def __init__(self, directory, mode):
+        self.directory = directory
+        self.mode = mode
+        self.modules = {}
+        self.phases = defaultdict(float)
+        self.started = time.perf_counter()
+        self.total = None
+
+    def module(self, filename):
+        entry = self.modules.get(filename)
+        if entry is None:
+            entry = self.modules[filename] = {'file': filename, 'module': None}
+            for field in self.MODULE_FIELDS:
+                entry[field] = 0.0
+        return entry
+
+    def add(self, filename, field, elapsed):
+        self.module(filename)[field] += elapsed
+        self.phases[field] += elapsed
+
+    def merge(self, filename, stats):
+        """다른 프로세스/작업에서 잰 모듈별 항목을 합침 (시간은 누적, 나머지는 덮어씀)
+
+        캐시/병렬 경로는 단계 시간을 벽시계로 따로 재므로 phases 에는 더하지 않는다.
+        """
+        entry = self.module(filename)
+        for field, value in stats.items():
+            if field in self.MODULE_FIELDS:
+                entry[field] += value
+            else:
+                entry[field] = value
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] += time.perf_counter() - start
+
+    def validate(self, ctx, modules):
+        """모듈을 하나씩 검증해 모듈별 시간을 기록
+
+        pyang 은 검증된 모듈을 건너뛰므로, import 한 모듈의 검증 시간은 그 모듈을
+        처음 참조한 모듈에 포함된다. 나머지 컨텍스트 검사는 'validate' 단계에만 더한다.
+        """
+        for filename, module in modules:
+            start = time.perf_counter()
+            try:
+                statements.validate_module(ctx, module)
             except Exception as e:
                 print(f"에러 발생: {filename} - {e}")
-
-    def write_entries(filepath, entries, label):
+            self.add(filename, 'validate', time.perf_counter() - start)
+        with self.phase('validate'):
+            validate_context(ctx, self.directory)
+
+    def extract(self, filename, module, output_format='text', prefixes=None):
+        """모듈 추출 시간, 건수, 트리 통계를 기록하고 (노드, RPC, Notification) 목록을 반환"""
+        start = time.perf_counter()
+        visits = WALK_STATS['visits']
+        entries = [list(kind_entries)
+                   for kind_entries in module_entries(module, filename, output_format, prefixes)]
+        self.add(filename, 'extract', time.perf_counter() - start)
+
+        entry = self.module(filename)
+        entry['module'] = module.arg
+        entry['visits'] = WALK_STATS['visits'] - visits
+        entry['nodes'], entry['rpcs'], entry['notifications'] = map(len, entries)
+        entry['max_depth'], entry['grouping_expansions'] = tree_stats(module)
+        return entries
+
+    def finish(self):
+        self.total = time.perf_counter() - self.started
+
+    def report(self):
+        modules = []
+        for entry in self.modules.values():
+            entry = dict(entry)
+            entry['total'] = sum(entry[field] for field in self.MODULE_FIELDS)
+            modules.append(entry)
+        modules.sort(key=lambda entry: entry['total'], reverse=True)
+        return {'directory': self.directory,
+                'mode': self.mode,
+                'total': self.total,
+                'phases': dict(self.phases),
+                'visits': sum(entry.get('visits', 0) for entry in modules),
+                'modules': modules}
+
+    def save(self, filepath):
         with open(filepath, 'w', encoding='utf-8') as f:
-            for entry in entries:
-                f.write(entry + '\n---\n')
-        print(f"{label} {len(entries)}개 저장 완료: {filepath}")
+            json.dump(self.report(), f, ensure_ascii=False, indent=2)
+        print(f"계측 리포트 저장 완료: {filepath}")
+
+
+@contextlib.contextmanager
+def profiled(filepath, top=20):
+    """cProfile 로 블록을 프로파일링해 filepath 에 저장하고 누적 시간 상위 함수를 출력"""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        profiler.dump_stats(filepath)
+        print(f"프로파일 저장 완료: {filepath}")
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(top)
 
-    write_entries(output_node, node_entries, '노드 정보')
-    write_entries(output_rpc, rpc_entries, 'RPC')
-    write_entries(output_notif, notif_entries, 'Notification')
 
+ENTRY_SEPARATORS = {'text': '\n---\n', 'jsonl': '\n'}
 
-# 사용 예시
-process_yang_directory('./oru')
\ No newline at end of file
+
+class EntryWriter:
+    """엔트리를 생성되는 대로 파일에 기록 (버퍼 쓰기, 모듈 단위 flush)"""
+
+    def __init__(self, filepath, label, buffering=1024 * 1024, output_format='text'):
+        self.filepath = filepath
+        self.label = label
+        self.count = 0
+        self.separator = ENTRY_SEPARATORS[output_format]
+        self.f = open(filepath, 'w', encoding='utf-8', buffering=buffering)
+
+    def write(self, entries):
+        separator = self.separator
+        for entry in entries:
+            self.f.write(entry + separator)
+            self.count += 1
+
+    def flush(self):
+        self.f.flush()
+
+    def close(self):
+        self.f.close()
+        print(f"{self.label} {self.count}개 저장 완료: {self.filepath}")
+
+
+def process_yang_directory(directory,
+                           output_node='yang_output.txt',
+                           output_rpc='yang_rpc.txt',
+                           output_notif='yang_notification.txt',
+                           batch=True,
+                           workers=None,
+                           cache_dir=None,
+                           rebuild_cache=False,
+                           cache_max_bytes=256 * 1024 * 1024,
+                           output_format='text',
+                           report=None,
+                           profile=None,
+                           roots=None,
+                           prefixes=None,
+                           snapshot=None,
+                           rebuild_snapshot=False):
+    """디렉터리의 YANG 모듈에서 노드/RPC/Notification 정보를 추출해 세 파일로 저장
+
+    directory 는 .yang 디렉터리, zip 아카이브, 또는 아카이브가 든 디렉터리이며
+    아카이브는 풀지 않고 멤버를 바로 읽는다.
+
+    output_format 은 'text' (번호 매긴 엔트리, '---' 구분) 또는
+    'jsonl' (record 하나당 JSON 한 줄, load_jsonl 로 읽음) 이다.
+    report 경로를 주면 단계별/모듈별 계측 결과를 JSON 으로 저장하고
+    (캐시/병렬 경로는 작업마다 잰 모듈별 항목을 합치며 캐시에서 가져온 모듈은
+    'cached' 로 표시, 스냅샷 경로는 단계만 기록), profile 경로를 주면
+    cProfile 결과를 저장한다.
+    roots (모듈 이름) 나 prefixes (keypath) 를 주면 헤더 스캔으로 구한 closure 만
+    로드/검증하고 해당 모듈, 해당 keypath 아래만 추출한다.
+    snapshot 경로를 주면 소스 해시가 같을 때 파싱/검증 없이 저장된 모델을 기록하고,
+    다르거나 없으면 전체를 추출해 스냅샷을 다시 만든다 (캐시/병렬 옵션보다 우선).
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"지원하지 않는 출력 형식: {output_format}")
+
+    source = yang_source(directory)
+    ctx = context.Context(source.repository())
+    prefixes = tuple(prefixes) if prefixes else None
+
+    headers = None
+    owned = needed = None
+    if roots or prefixes:
+        headers = scan_yang_directory(source)
+        scope = scoped_files(headers, roots, prefixes)
+        if scope is not None:
+            owned, needed = scope
+
+    cache = None
+    if cache_dir and batch and not snapshot:
+        cache = ExtractionCache(cache_dir, cache_max_bytes)
+        if rebuild_cache:
+            cache.clear()
+
+    instrumentation = None
+    if report:
+        if snapshot:
+            mode = 'snapshot'
+        elif cache is not None:
+            mode = 'cache'
+        elif workers:
+            mode = 'parallel'
+        else:
+            mode = 'batch' if batch else 'per-file'
+        instrumentation = Instrumentation(directory, mode)
+
+    writers = [EntryWriter(output_node, '노드 정보', output_format=output_format),
+               EntryWriter(output_rpc, 'RPC', output_format=output_format),
+               EntryWriter(output_notif, 'Notification', output_format=output_format)]
+    node_out, rpc_out, notif_out = writers
+
+    def write_module(module, filename):
+        if instrumentation is not None:
+            entries = instrumentation.extract(filename, module, output_format, prefixes)
+            start = time.perf_counter()
+            for writer, kind_entries in zip(writers, entries):
+                writer.write(kind_entries)
+                writer.flush()
+            instrumentation.add(filename, 'write', time.perf_counter() - start)
+            return
+
+        # 추출과 동시에 기록하고, 모듈이 끝나면 flush 해서 실행 중에도 tail 가능
+        for writer, entries in zip(writers, module_entries(module, filename, output_format, prefixes)):
+            writer.write(entries)
+        for writer in writers:
+            writer.flush()
+
+    with profiled(profile) if profile else contextlib.nullcontext():
+        try:
+            if snapshot:
+                with instrumentation.phase('load') if instrumentation else contextlib.nullcontext():
+                    model = load_model(source, snapshot, rebuild_snapshot)
+                with instrumentation.phase('write') if instrumentation else contextlib.nullcontext():
+                    for writer, kind_entries in zip(writers, model.entries(output_format, owned, prefixes)):
+                        writer.write(kind_entries)
+            elif cache is not None or workers:
+                # 캐시/병렬 경로는 모듈 단위 결과를 모아 정렬한 뒤 기록
+                with instrumentation.phase('extract') if instrumentation else contextlib.nullcontext():
+                    if cache is not None:
+                        # 바뀌지 않은 모듈은 캐시에서 바로 가져옴
+                        entries = extract_cached(directory, cache, workers, output_format,
+                                                 owned, prefixes, headers, instrumentation)
+                    else:
+                        # 프로세스 풀 병렬 추출 (출력은 모듈, keypath 순으로 정렬)
+                        entries = extract_parallel(directory, workers, output_format, owned, prefixes,
+                                                   instrumentation)
+                with instrumentation.phase('write') if instrumentation else contextlib.nullcontext():
+                    for writer, kind_entries in zip(writers, entries):
+                        writer.write(kind_entries)
+            elif batch:
+                # 모든 파일을 먼저 추가하고 컨텍스트는 한 번만 검증
+                modules = load_yang_files(ctx, source, instrumentation, only=needed)
+                if instrumentation is not None:
+                    instrumentation.validate(ctx, modules)
+                else:
+                    validate_context(ctx, directory)
+
+                for filename, module in modules:
+                    if owned is not None and filename not in owned:
+                        continue
+                    try:
+                        write_module(module, filename)
+                    except Exception as e:
+                        print(f"에러 발생: {filename} - {e}")
+            else:
+                # 파일마다 검증하는 기존 방식 (비교용)
+                for filename in source.filenames():
+                    if needed is not None and filename not in needed:
+                        continue
+                    print(f"{source.display_path(filename)}")
+                    text = source.read_text(filename)
+
+                    try:
+                        start = time.perf_counter()
+                        module = ctx.add_module(filename, text)
+                        if instrumentation is not None:
+                            instrumentation.add(filename, 'parse', time.perf_counter() - start)
+                            start = time.perf_counter()
+                        ctx.validate()
+                        if instrumentation is not None:
+                            instrumentation.add(filename, 'validate', time.perf_counter() - start)
+                        if owned is None or filename in owned:
+                            write_module(module, filename)
+                    except Exception as e:
+                        print(f"에러 발생: {filename} - {e}")
+        finally:
+            for writer in writers:
+                writer.close()
+
+    if cache is not None:
+        print(f"캐시 hit {cache.hits} / miss {cache.misses}: {cache.cache_dir}")
+    if instrumentation is not None:
+        instrumentation.finish()
+        instrumentation.save(report)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='YANG 모델에서 노드/RPC/Notification 정보 추출')
+    parser.add_argument('directory', nargs='?', default='./oru',
+                        help='YANG 파일 디렉터리, zip 아카이브 또는 아카이브 디렉터리')
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default='text', help='출력 형식')
+    parser.add_argument('--output-node', help='노드 출력 파일 (기본 yang_output.txt/.jsonl)')
+    parser.add_argument('--output-rpc', help='RPC 출력 파일 (기본 yang_rpc.txt/.jsonl)')
+    parser.add_argument('--output-notif', help='Notification 출력 파일 (기본 yang_notification.txt/.jsonl)')
+    parser.add_argument('--workers', type=int, default=None, help='병렬 추출 프로세스 수')
+    parser.add_argument('--per-file', action='store_true', help='파일마다 검증하는 기존 방식 (캐시 미사용)')
+    parser.add_argument('--cache-dir', default='.yang_cache', help='추출 결과 캐시 디렉터리')
+    parser.add_argument('--cache-max-mb', type=int, default=256, help='캐시 최대 크기 (MB)')
+    parser.add_argument('--no-cache', action='store_true', help='캐시를 사용하지 않음')
+    parser.add_argument('--rebuild-cache', action='store_true', help='캐시를 비우고 다시 생성')
+    parser.add_argument('-v', '--verbose', action='store_true', help='순회 진단 로그 출력 (DEBUG)')
+    parser.add_argument('--root', action='append', help='이 모듈과 그 closure 만 로드/추출 (반복 가능)')
+    parser.add_argument('--prefix', action='append',
+                        help="이 keypath 아래만 추출 ('/' 로 시작하면 모든 모듈, 반복 가능)")
+    parser.add_argument('--report', help='단계별/모듈별 계측 리포트 JSON 경로')
+    parser.add_argument('--profile', help='cProfile 결과 저장 경로 (pstats 형식)')
+    parser.add_argument('--snapshot', help='검증/추출한 모델 스냅샷 경로 (소스가 바뀌면 자동 재생성)')
+    parser.add_argument('--rebuild-snapshot', action='store_true', help='스냅샷을 무시하고 다시 생성')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING,
+                        format='%(message)s')
+
+    ext = 'jsonl' if args.format == 'jsonl' else 'txt'
+    process_yang_directory(args.directory,
+                           args.output_node or f'yang_output.{ext}',
+                           args.output_rpc or f'yang_rpc.{ext}',
+                           args.output_notif or f'yang_notification.{ext}',
+                           batch=not args.per_file,
+                           workers=args.workers,
+                           cache_dir=None if args.no_cache else args.cache_dir,
+                           rebuild_cache=args.rebuild_cache,
+                           cache_max_bytes=args.cache_max_mb * 1024 * 1024,
+                           output_format=args.format,
+                           report=args.report,
+                           profile=args.profile,
+                           roots=args.root,
+                           prefixes=args.prefix,
+                           snapshot=args.snapshot,
+                           rebuild_snapshot=args.rebuild_snapshot)
+
+
+# 사용 예시: python3 yang_parsor.py ./oru
+if __name__ == '__main__':
+    main()
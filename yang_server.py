@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+YANG 모델 조회 데몬
+
+디렉터리를 한 번만 로드/검증/추출해 (load_model, --snapshot 이 있으면 스냅샷) 메모리에
+두고, Unix 소켓 또는 localhost TCP 로 keypath / prefix / RPC / Notification 조회에 답한다.
+
+프로토콜은 줄 단위 JSON 이다. 요청 한 줄에 응답 한 줄을 같은 순서로 돌려주므로
+응답을 기다리지 않고 여러 요청을 이어 보낼 수 있고 (파이프라이닝), op 'batch' 로
+요청 여러 개를 한 줄에 묶을 수도 있다. 연결은 asyncio 이벤트 루프에서 동시에 처리한다.
+
+    {"id": 1, "op": "keypath", "keypath": "ietf-interfaces/interfaces/interface/name"}
+    {"id": 2, "op": "prefix", "prefix": "/interfaces", "type": "string", "limit": 10}
+    {"id": 3, "op": "rpc", "name": "restart", "module": "ietf-system"}
+    {"id": 4, "op": "batch", "requests": [{"op": "keypath", "keypath": "..."}, ...]}
+
+사용법:
+    python3 yang_server.py serve ./oru --socket /tmp/yang.sock [--snapshot oru.snapshot]
+    python3 yang_server.py serve ./oru --port 8765
+    python3 yang_server.py query --socket /tmp/yang.sock '{"op": "stats"}'
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import socket
+import sys
+import time
+from collections import defaultdict
+
+import yang_index
+import yang_parsor
+
+# prefix 조회에서 거르는 필드 (요청 키 -> KeypathIndex.query 인자)
+QUERY_FILTERS = {'kind': 'kind', 'type': 'type', 'base-type': 'base_type', 'module': 'module',
+                 'config': 'config', 'mandatory': 'mandatory', 'if-feature': 'if_feature'}
+
+# 문자열이어야 하는 요청 항목
+STRING_FIELDS = ('keypath', 'prefix', 'name', 'module')
+
+
+def check_request(request):
+    """요청 항목의 타입 확인 (잘못되면 TypeError / ValueError)"""
+    for key in STRING_FIELDS:
+        value = request.get(key)
+        if value is not None and not isinstance(value, str):
+            raise TypeError(f"{key} 는 문자열이어야 함")
+    limit = request.get('limit')
+    if limit is not None and (not isinstance(limit, int) or isinstance(limit, bool) or limit < 0):
+        raise ValueError("limit 은 0 이상의 정수여야 함")
+
+
+class QueryHandler:
+    """요청 dict 하나를 처리해 응답 dict 를 반환 (소켓과 무관)"""
+
+    def __init__(self, model):
+        self.index = yang_index.KeypathIndex.from_model(model)
+        self.operations = {}
+        for kind, records in (('rpc', model.rpcs), ('notification', model.notifications)):
+            by_name = defaultdict(list)
+            for record in records:
+                by_name[record.name].append(record)
+            self.operations[kind] = by_name
+        self.requests = 0
+
+    def keypath(self, request):
+        return {'records': self.index.lookup(request['keypath'])}
+
+    def prefix(self, request):
+        filters = {arg: request.get(key) for key, arg in QUERY_FILTERS.items()}
+        records = self.index.query(request['prefix'], **filters)
+        limit = request.get('limit')
+        total = len(records)
+        if limit is not None:
+            records = records[:limit]
+        return {'records': records, 'total': total}
+
+    def operation(self, request):
+        module = request.get('module')
+        records = [record.record() for record in self.operations[request['op']].get(request['name'], ())
+                   if module is None or record.module_name == module]
+        return {'records': records}
+
+    def stats(self, request):
+        return {'nodes': len(self.index.records),
+                'rpcs': sum(map(len, self.operations['rpc'].values())),
+                'notifications': sum(map(len, self.operations['notification'].values())),
+                'requests': self.requests}
+
+    def batch(self, request):
+        return {'results': [self.handle(item) for item in request['requests']]}
+
+    def handle(self, request):
+        self.requests += 1
+        handlers = {'keypath': self.keypath, 'prefix': self.prefix, 'rpc': self.operation,
+                    'notification': self.operation, 'stats': self.stats, 'batch': self.batch}
+        if not isinstance(request, dict):
+            return {'id': None, 'error': '요청은 JSON 객체여야 함'}
+        response = {'id': request.get('id')}
+        try:
+            handler = handlers.get(request.get('op'))
+            if handler is None:
+                raise ValueError(f"알 수 없는 op: {request.get('op')}")
+            check_request(request)
+            response.update(handler(request))
+        except KeyError as e:
+            response['error'] = f"필수 항목 없음: {e.args[0]}"
+        except (TypeError, ValueError) as e:
+            response['error'] = str(e)
+        except Exception as e:
+            # 요청 하나의 오류로 연결 (뒤에 이어 보낸 요청들) 이 끊기지 않도록 응답으로 돌려줌
+            response['error'] = f"요청 처리 실패: {type(e).__name__}: {e}"
+        return response
+
+    def respond(self, line):
+        """요청 한 줄 (bytes) -> 응답 한 줄 (bytes)"""
+        try:
+            response = self.handle(json.loads(line))
+        except ValueError as e:
+            response = {'id': None, 'error': f"JSON 형식 오류: {e}"}
+        return (json.dumps(response, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+class QueryServer:
+    """QueryHandler 를 Unix 소켓 / localhost TCP 로 제공하는 asyncio 서버"""
+
+    def __init__(self, handler, socket_path=None, host='127.0.0.1', port=None):
+        self.handler = handler
+        self.socket_path = socket_path
+        self.host = host
+        self.port = port
+        self.connections = 0
+
+    async def _client(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if line.strip():
+                    writer.write(self.handler.respond(line))
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    async def serve(self):
+        # 요청 한 줄이 큰 batch 일 수 있으므로 읽기 한도를 넉넉히 둠
+        limit = 64 * 1024 * 1024
+        if self.socket_path:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self.socket_path)
+            server = await asyncio.start_unix_server(self._client, self.socket_path, limit=limit)
+            address = self.socket_path
+        else:
+            server = await asyncio.start_server(self._client, self.host, self.port, limit=limit)
+            address = f"{self.host}:{self.port}"
+        print(f"조회 대기 중: {address} (Ctrl+C 로 종료)", flush=True)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if self.socket_path:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(self.socket_path)
+
+
+class QueryClient:
+    """줄 단위 JSON 동기 클라이언트 (연결 하나, 파이프라이닝 지원)"""
+
+    def __init__(self, socket_path=None, host='127.0.0.1', port=None, timeout=30):
+        if socket_path:
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.settimeout(timeout)
+            self.sock.connect(socket_path)
+        else:
+            self.sock = socket.create_connection((host, port), timeout=timeout)
+        self.reader = self.sock.makefile('rb')
+
+    def pipeline(self, requests):
+        """요청들을 한 번에 보내고 같은 순서의 응답 목록을 반환"""
+        payload = b''.join((json.dumps(request, ensure_ascii=False) + '\n').encode('utf-8')
+                           for request in requests)
+        self.sock.sendall(payload)
+        return [json.loads(self.reader.readline()) for _ in requests]
+
+    def request(self, request):
+        return self.pipeline([request])[0]
+
+    def batch(self, requests):
+        return self.request({'op': 'batch', 'requests': list(requests)})['results']
+
+    def close(self):
+        self.reader.close()
+        self.sock.close()
+
+
+def wait_for_server(socket_path=None, host='127.0.0.1', port=None, timeout=60):
+    """서버가 연결을 받을 때까지 기다림 (시간 초과면 TimeoutError)"""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            QueryClient(socket_path, host, port, timeout=1).close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"서버 응답 없음: {socket_path or f'{host}:{port}'}")
+            time.sleep(0.05)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='YANG 모델 조회 데몬')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    serve = sub.add_parser('serve', help='모델을 로드하고 조회 요청 대기')
+    serve.add_argument('directory', nargs='?', default='./oru',
+                       help='YANG 파일 디렉터리, zip 아카이브 또는 아카이브 디렉터리')
+    serve.add_argument('--snapshot', help='모델 스냅샷 경로 (소스가 바뀌면 자동 재생성)')
+    serve.add_argument('--socket', help='Unix 소켓 경로')
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8765, help='--socket 이 없을 때 TCP 포트')
+
+    query = sub.add_parser('query', help='요청 JSON 을 보내고 응답을 출력')
+    query.add_argument('requests', nargs='+', help='요청 JSON (여러 개면 파이프라이닝)')
+    query.add_argument('--socket')
+    query.add_argument('--host', default='127.0.0.1')
+    query.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+
+    if args.command == 'query':
+        client = QueryClient(args.socket, args.host, args.port)
+        try:
+            for response in client.pipeline([json.loads(request) for request in args.requests]):
+                print(json.dumps(response, ensure_ascii=False))
+        finally:
+            client.close()
+        return
+
+    start = time.perf_counter()
+    model = yang_parsor.load_model(args.directory, args.snapshot)
+    handler = QueryHandler(model)
+    print(f"모델 로드 완료 ({time.perf_counter() - start:.2f}s): 노드 {len(model.nodes)}개, "
+          f"RPC {len(model.rpcs)}개, Notification {len(model.notifications)}개", file=sys.stderr)
+
+    server = QueryServer(handler, args.socket, args.host, args.port)
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(server.serve())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+벤치마크용 합성 YANG 코퍼스 생성기
+
+synth-types.yang 에 typedef 체인, enum typedef, 공용 grouping 을 두고
+synth-N.yang 모듈들이 이를 import 해서 container/list 트리, RPC, Notification 을 만든다.
+
+사용법:
+    python3 yang_synth.py ./synth --modules 4 --depth 3 --fanout 4 --leaves 5
+"""
+
+import argparse
+import os
+
+TYPES_MODULE = 'synth-types'
+
+
+def _types_module(enum_size, typedef_chain, grouping_leaves):
+    lines = [
+        f"module {TYPES_MODULE} {{",
+        "  yang-version 1.1;",
+        f'  namespace "urn:synth:{TYPES_MODULE}";',
+        "  prefix st;",
+        "",
+        "  typedef chain-0 {",
+        "    type uint32 {",
+        '      range "0..4000000";',
+        "    }",
+        "  }",
+    ]
+    for i in range(1, max(typedef_chain, 1)):
+        lines += [
+            f"  typedef chain-{i} {{",
+            f"    type chain-{i - 1} {{",
+            f'      range "0..{4000000 - i}";',
+            "    }",
+            "  }",
+        ]
+
+    lines += ["  typedef mode {", "    type enumeration {"]
+    for i in range(max(enum_size, 1)):
+        lines += [
+            f"      enum mode-{i} {{",
+            f"        value {i};",
+            f'        description "mode {i}";',
+            "      }",
+        ]
+    lines += ["    }", "  }", ""]
+
+    lines += ["  grouping common {"]
+    for i in range(grouping_leaves):
+        leaf_type = 'mode' if i % 2 else f"chain-{max(typedef_chain, 1) - 1}"
+        lines += [
+            f"    leaf g-leaf-{i} {{",
+            f"      type {leaf_type};",
+            f'      description "grouping leaf {i}";',
+            "    }",
+        ]
+    if not grouping_leaves:
+        lines += ["    leaf g-leaf-0 {", "      type string;", "    }"]
+    lines += ["  }", "}", ""]
+    return '\n'.join(lines)
+
+
+def _container_tree(lines, indent, depth, fanout, leaves, grouping_uses, path_id):
+    pad = '  ' * indent
+    for i in range(leaves):
+        leaf_type = 'st:mode' if i % 3 == 2 else ('st:chain-0' if i % 3 == 1 else 'string')
+        lines += [
+            f"{pad}leaf leaf-{i} {{",
+            f"{pad}  type {leaf_type};",
+            f'{pad}  description "leaf {path_id}/{i}";',
+            f"{pad}}}",
+        ]
+    if grouping_uses:
+        lines.append(f"{pad}uses st:common;")
+    if depth == 0:
+        return
+
+    for i in range(fanout):
+        child_id = f"{path_id}-{i}"
+        if depth % 2 == 0:
+            lines += [f"{pad}list item-{i} {{", f'{pad}  key "name";',
+                      f"{pad}  leaf name {{", f"{pad}    type string;", f"{pad}  }}"]
+        else:
+            lines.append(f"{pad}container node-{i} {{")
+        lines.append(f'{pad}  description "node {child_id}";')
+        _container_tree(lines, indent + 1, depth - 1, fanout, leaves, grouping_uses, child_id)
+        lines.append(f"{pad}}}")
+
+
+def _data_module(index, depth, fanout, leaves, grouping_uses, rpcs, notifications):
+    name = f"synth-{index}"
+    lines = [
+        f"module {name} {{",
+        "  yang-version 1.1;",
+        f'  namespace "urn:synth:{name}";',
+        f"  prefix s{index};",
+        "",
+        f"  import {TYPES_MODULE} {{",
+        "    prefix st;",
+        "  }",
+        "",
+        "  container root {",
+        f'    description "root of {name}";',
+    ]
+    _container_tree(lines, 2, depth, fanout, leaves, grouping_uses, str(index))
+    lines.append("  }")
+
+    for i in range(rpcs):
+        lines += [
+            f"  rpc do-{i} {{",
+            f'    description "rpc {i}";',
+            "    input {",
+            "      uses st:common;",
+            "      leaf target {",
+            "        type string;",
+            "      }",
+            "    }",
+            "    output {",
+            "      leaf result {",
+            "        type st:mode;",
+            "      }",
+            "    }",
+            "  }",
+        ]
+    for i in range(notifications):
+        lines += [
+            f"  notification event-{i} {{",
+            f'    description "notification {i}";',
+            "    uses st:common;",
+            "  }",
+        ]
+    lines += ["}", ""]
+    return '\n'.join(lines)
+
+
+def estimate_nodes(modules=1, depth=3, fanout=4, leaves=5, grouping_leaves=4, grouping_uses=True,
+                   rpcs=2, notifications=2, **_):
+    """extract_node_records 가 내보낼 노드(container/list/leaf) 수 추정"""
+    group = max(grouping_leaves, 1)
+    containers = sum(fanout ** d for d in range(1, depth + 1))
+    per_container = 1 + leaves + (group if grouping_uses else 0)
+    # list 는 key leaf 가 하나 더 있음
+    lists = sum(fanout ** d for d in range(1, depth + 1) if (depth - d + 1) % 2 == 0)
+    root = 1 + leaves + (group if grouping_uses else 0)
+    # rpc input/output 과 notification 안의 leaf 도 포함됨
+    operations = rpcs * (group + 2) + notifications * group
+    return modules * (containers * per_container + lists + root + operations)
+
+
+def write_corpus(directory, modules=1, depth=3, fanout=4, leaves=5, grouping_leaves=4,
+                 grouping_uses=True, enum_size=8, typedef_chain=3, rpcs=2, notifications=2):
+    """합성 코퍼스를 directory 에 작성하고 파일 목록을 반환"""
+    os.makedirs(directory, exist_ok=True)
+    files = {f"{TYPES_MODULE}.yang": _types_module(enum_size, typedef_chain, grouping_leaves)}
+    for index in range(modules):
+        files[f"synth-{index}.yang"] = _data_module(index, depth, fanout, leaves,
+                                                     grouping_uses, rpcs, notifications)
+    for filename, text in files.items():
+        with open(os.path.join(directory, filename), 'w', encoding='utf-8') as f:
+            f.write(text)
+    return sorted(files)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='합성 YANG 코퍼스 생성')
+    parser.add_argument('directory')
+    parser.add_argument('--modules', type=int, default=1)
+    parser.add_argument('--depth', type=int, default=3)
+    parser.add_argument('--fanout', type=int, default=4)
+    parser.add_argument('--leaves', type=int, default=5)
+    parser.add_argument('--grouping-leaves', type=int, default=4)
+    parser.add_argument('--no-grouping-uses', action='store_true')
+    parser.add_argument('--enum-size', type=int, default=8)
+    parser.add_argument('--typedef-chain', type=int, default=3)
+    parser.add_argument('--rpcs', type=int, default=2)
+    parser.add_argument('--notifications', type=int, default=2)
+    args = parser.parse_args()
+
+    params = dict(modules=args.modules, depth=args.depth, fanout=args.fanout,
+                  leaves=args.leaves, grouping_leaves=args.grouping_leaves,
+                  grouping_uses=not args.no_grouping_uses, enum_size=args.enum_size,
+                  typedef_chain=args.typedef_chain, rpcs=args.rpcs,
+                  notifications=args.notifications)
+    files = write_corpus(args.directory, **params)
+    print(f"{len(files)}개 파일 생성 (노드 약 {estimate_nodes(**params)}개): {args.directory}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,540 @@
+#!/usr/bin/env python3
+"""
+YANG 인스턴스 문서 오프라인 검증기
+
+extra_node_info 가 뽑는 제약 (enum, range/length, fraction-digits, pattern, mandatory,
+config, list key) 을 keypath 별 검사 객체로 한 번 컴파일해 두고, NETCONF edit-config 전에
+XML/JSON (RFC 7951) 인스턴스 문서를 검사한다. XML 은 iterparse 로 스트리밍하므로 큰 문서도
+메모리에 다 올리지 않으며, 여러 문서는 프로세스 풀로 나눠 검사한다.
+
+choice/case 는 인스턴스 경로에 나타나지 않으므로 keypath 에서 빼고, choice 안의
+mandatory leaf 와 leafref/must/when 등 다른 노드를 참조하는 제약은 검사하지 않는다.
+
+사용법:
+    python3 yang_validate.py ./oru config.xml more/*.json [--config] [--workers 4]
+"""
+
+import argparse
+import json
+import re
+import sys
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+
+import yang_parsor
+
+INTEGER_BOUNDS = {
+    'int8': (-2 ** 7, 2 ** 7 - 1),
+    'int16': (-2 ** 15, 2 ** 15 - 1),
+    'int32': (-2 ** 31, 2 ** 31 - 1),
+    'int64': (-2 ** 63, 2 ** 63 - 1),
+    'uint8': (0, 2 ** 8 - 1),
+    'uint16': (0, 2 ** 16 - 1),
+    'uint32': (0, 2 ** 32 - 1),
+    'uint64': (0, 2 ** 64 - 1),
+}
+
+# 검사하는 built-in 타입 (그 외 leafref, bits, binary 등은 값을 검사하지 않음)
+CHECKED_TYPES = frozenset(INTEGER_BOUNDS) | {'decimal64', 'string', 'boolean', 'enumeration',
+                                              'identityref', 'union'}
+
+# 인스턴스 값의 어휘 형식 (RFC 7950 9.2.1, 9.3.1: 부호는 선택, 공백/밑줄/지수 표기 없음)
+INTEGER_VALUE = re.compile(r'[+-]?[0-9]+')
+DECIMAL_VALUE = re.compile(r'[+-]?[0-9]+(\.[0-9]+)?')
+
+# NETCONF/RESTCONF 문서를 감싸는 최상위 요소
+WRAPPERS = ('config', 'data')
+
+
+def parse_ranges(expr, convert, lower, upper):
+    """'1..10 | 20 | 30..max' 를 ((lo, hi), ...) 로 변환 (해석할 수 없으면 None)"""
+    bounds = {'min': lower, 'max': upper}
+    ranges = []
+    try:
+        for part in expr.split('|'):
+            values = [value.strip() for value in part.split('..')]
+            lo, hi = values[0], values[-1]
+            ranges.append((bounds[lo] if lo in bounds else convert(lo),
+                           bounds[hi] if hi in bounds else convert(hi)))
+    except (ValueError, ArithmeticError):
+        return None
+    return tuple(ranges)
+
+
+def in_ranges(value, ranges):
+    for lo, hi in ranges:
+        if lo <= value <= hi:
+            return True
+    return False
+
+
+def compile_patterns(patterns, inverted=()):
+    """YANG (XSD) pattern 을 fullmatch 용 (정규식, invert-match 여부) 로 컴파일
+
+    파이썬 re 로 컴파일되지 않는 pattern 은 제외한다.
+    """
+    compiled = []
+    for sources, invert in ((patterns, False), (inverted, True)):
+        for pattern in sources:
+            try:
+                compiled.append((re.compile(pattern), invert))
+            except re.error:
+                continue
+    return tuple(compiled)
+
+
+class LeafCheck:
+    """leaf/leaf-list 값 검사 (범위/enum/pattern 은 컴파일 시 한 번만 해석)"""
+
+    __slots__ = ('base', 'restriction', 'ranges', 'fraction_digits', 'patterns', 'enums',
+                 'identities', 'members')
+
+    def __init__(self, base, restriction=None, fraction_digits=None, patterns=(), enums=(),
+                 identities=(), members=(), inverted_patterns=()):
+        self.base = base
+        self.restriction = restriction
+        self.fraction_digits = int(fraction_digits) if fraction_digits else None
+        self.patterns = compile_patterns(patterns, inverted_patterns)
+        self.enums = frozenset(enums)
+        # 인스턴스 값의 prefix 는 모듈 이름이 아닐 수 있으므로 이름만으로도 찾음
+        self.identities = frozenset(identities) | frozenset(name.split(':')[-1] for name in identities)
+        self.members = tuple(members)
+
+        self.ranges = None
+        if restriction:
+            if base in INTEGER_BOUNDS:
+                self.ranges = parse_ranges(restriction, int, *INTEGER_BOUNDS[base])
+            elif base == 'decimal64':
+                self.ranges = parse_ranges(restriction, Decimal, Decimal('-Infinity'), Decimal('Infinity'))
+            elif base == 'string':
+                self.ranges = parse_ranges(restriction, int, 0, float('inf'))
+
+    @classmethod
+    def from_info(cls, info, members=()):
+        """extra_node_info 결과로 만듦 (검사할 수 없는 타입이면 None)
+
+        union 이면 members 는 resolve_type 이 멤버별로 풀어낸 결과이며, 멤버마다
+        자신의 range/length, pattern, fraction-digits 로 검사한다.
+        """
+        base = info.get('base-type') or info.get('type')
+        if base not in CHECKED_TYPES:
+            return None
+        member_checks = ()
+        if base == 'union':
+            member_checks = [cls.from_resolved(member) for member in members]
+            if not member_checks or None in member_checks:
+                return None
+        return cls(base, info.get('range/length'), info.get('fraction-digits'),
+                   info.get('pattern', ()), [enum['name'] for enum in info.get('enum', ())],
+                   info.get('identities', ()), member_checks, info.get('invert-pattern', ()))
+
+    @classmethod
+    def from_resolved(cls, resolved):
+        """resolve_type 결과 (union 멤버 하나) 로 만듦 (검사할 수 없는 타입이면 None)"""
+        base = resolved['base-type']
+        if base not in CHECKED_TYPES or base == 'union':
+            return None
+        patterns = resolved.get('pattern', ())
+        return cls(base, resolved.get('range/length'), resolved.get('fraction-digits'),
+                   [pattern for pattern, inverted in patterns if not inverted],
+                   [enum['name'] for enum in resolved.get('enum', ())],
+                   resolved.get('identities', ()),
+                   inverted_patterns=[pattern for pattern, inverted in patterns if inverted])
+
+    def check(self, value):
+        """값이 맞으면 None, 아니면 오류 메시지"""
+        base = self.base
+        if base in INTEGER_BOUNDS:
+            if INTEGER_VALUE.fullmatch(value) is None:
+                return f"{base} 가 아님: {value!r}"
+            number = int(value)
+            lo, hi = INTEGER_BOUNDS[base]
+            if not lo <= number <= hi:
+                return f"{base} 범위 밖: {value}"
+            if self.ranges and not in_ranges(number, self.ranges):
+                return f"range {self.restriction} 밖: {value}"
+        elif base == 'decimal64':
+            if DECIMAL_VALUE.fullmatch(value) is None:
+                return f"decimal64 가 아님: {value!r}"
+            number = Decimal(value)
+            if self.fraction_digits is not None and -number.as_tuple().exponent > self.fraction_digits:
+                return f"fraction-digits {self.fraction_digits} 초과: {value}"
+            if self.ranges and not in_ranges(number, self.ranges):
+                return f"range {self.restriction} 밖: {value}"
+        elif base == 'string':
+            if self.ranges and not in_ranges(len(value), self.ranges):
+                return f"length {self.restriction} 밖: {len(value)}"
+            for pattern, inverted in self.patterns:
+                if (pattern.fullmatch(value) is None) != inverted:
+                    if inverted:
+                        return f"invert-match pattern 일치 {pattern.pattern!r}: {value!r}"
+                    return f"pattern 불일치 {pattern.pattern!r}: {value!r}"
+        elif base == 'boolean':
+            if value not in ('true', 'false'):
+                return f"boolean 이 아님: {value!r}"
+        elif base == 'enumeration':
+            if value not in self.enums:
+                return f"enum 에 없는 값: {value!r}"
+        elif base == 'identityref':
+            if self.identities and value not in self.identities \
+                    and value.split(':')[-1] not in self.identities:
+                return f"identity 에 없는 값: {value!r}"
+        elif base == 'union':
+            if all(member.check(value) is not None for member in self.members):
+                return f"union 멤버 타입에 맞지 않음: {value!r}"
+        return None
+
+
+class NodeSpec:
+    """스키마 노드 하나의 컴파일된 제약 (자식은 이름으로 찾음)"""
+
+    __slots__ = ('name', 'kind', 'keypath', 'config', 'check', 'keys', 'mandatory', 'children')
+
+    def __init__(self, name, kind, keypath, config=True, check=None, keys=()):
+        self.name = name
+        self.kind = kind
+        self.keypath = keypath
+        self.config = config
+        self.check = check
+        self.keys = keys
+        self.mandatory = ()
+        self.children = {}
+
+
+class _SpecCompiler(yang_parsor.Extractor):
+    """walk_module 한 번으로 모듈의 데이터 트리를 NodeSpec 트리로 컴파일
+
+    state 는 (부모 NodeSpec, choice 안인지, 상속된 config) 이며, rpc/notification/action
+    아래는 state 가 끊겨 컴파일하지 않는다.
+    """
+
+    nested_keywords = yang_parsor.NODE_KINDS + ('choice', 'case')
+
+    def __init__(self, validator):
+        self.validator = validator
+
+    def begin(self, module, filename):
+        name = getattr(module, 'i_modulename', module.arg)
+        root = self.validator.roots.get(name)
+        if root is None:
+            root = self.validator.roots[name] = NodeSpec(name, 'module', name)
+        namespace = module.search_one('namespace')
+        if namespace is not None:
+            self.validator.namespaces[namespace.arg] = name
+        return (root, False, True)
+
+    def visit(self, stmt, keypath, state, keep):
+        parent, in_choice, config = state
+        if stmt.keyword in ('choice', 'case'):
+            return (parent, True, config)
+
+        index = yang_parsor.substmt_index(stmt)
+        config = config and yang_parsor.substmt_arg(stmt, 'config') != 'false'
+        check = None
+        if stmt.keyword in ('leaf', 'leaf-list'):
+            type_stmt = index.get('type')
+            members = yang_parsor.resolve_type(type_stmt).get('members', ()) if type_stmt is not None else ()
+            check = LeafCheck.from_info(yang_parsor.extra_node_info(stmt), members)
+        keys = tuple(yang_parsor.substmt_arg(stmt, 'key', '').split()) if stmt.keyword == 'list' else ()
+
+        spec = NodeSpec(stmt.arg, stmt.keyword, f"{parent.keypath}/{stmt.arg}", config, check, keys)
+        parent.children[stmt.arg] = spec
+        self.validator.nodes[spec.keypath] = spec
+        mandatory = index.get('mandatory')
+        if stmt.keyword == 'leaf' and mandatory is not None and mandatory.arg == 'true' and not in_choice:
+            parent.mandatory += (stmt.arg,)
+        if stmt.keyword in ('container', 'list'):
+            return (spec, False, config)
+        return None
+
+
+class _Frame:
+    """문서를 내려가며 쌓는 container/list 인스턴스 (본 자식, key leaf 값, 자식 list 의 key 집합)
+
+    leaf/leaf-list 는 프레임 없이 NodeSpec 을 그대로 스택에 쌓는다.
+    """
+
+    __slots__ = ('spec', 'elem', 'seen', 'values', 'entries')
+
+    def __init__(self, spec, elem=None):
+        self.spec = spec
+        self.elem = elem
+        self.seen = set()
+        self.values = {}
+        self.entries = {}
+
+
+_DOCUMENT = NodeSpec('', 'document', '')
+_LEAF_KINDS = ('leaf', 'leaf-list')
+
+
+def _json_scalar(value):
+    """RFC 7951 값을 XML 텍스트와 같은 문자열로 ([null] 은 empty 타입)"""
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if value is None or value == [None]:
+        return ''
+    return str(value)
+
+
+class SchemaValidator:
+    """keypath 별로 컴파일한 제약으로 인스턴스 문서를 검사
+
+    오류는 (keypath, 메시지) 목록으로 반환한다. keypath 는 choice/case 를 뺀
+    'module/container/leaf' 형식이라 인스턴스 경로와 같고, nodes 로 NodeSpec 을 찾을 수 있다.
+    """
+
+    def __init__(self):
+        self.roots = {}
+        self.namespaces = {}
+        self.nodes = {}
+
+    @classmethod
+    def from_modules(cls, modules):
+        validator = cls()
+        compiler = _SpecCompiler(validator)
+        for filename, module in modules:
+            yang_parsor.walk_module(module, (compiler,), filename)
+        return validator
+
+    @classmethod
+    def from_directory(cls, directory):
+        return cls.from_modules(yang_parsor.load_validated_modules(directory, quiet=True))
+
+    def _top_spec(self, module, local):
+        root = self.roots.get(module)
+        return root.children.get(local) if root is not None else None
+
+    def _enter(self, frame, spec, path, config, errors):
+        """자식 노드에 들어갈 때 seen 에 기록 (검사를 계속할 수 없으면 False)
+
+        path 는 오류 메시지에만 쓰므로 스키마에 없는 노드일 때만 만든다.
+        """
+        if spec is None:
+            errors.append((path(), "스키마에 없는 노드"))
+            return False
+        if config and not spec.config:
+            errors.append((spec.keypath, "config false 노드는 설정 문서에 올 수 없음"))
+            return False
+        frame.seen.add(spec.name)
+        return True
+
+    def _leave(self, node, parent, config, errors):
+        """container/list 를 나올 때 mandatory leaf, list key 누락/중복 검사
+
+        설정 문서 (config) 에서는 config false 인 mandatory leaf 는 요구하지 않는다.
+        """
+        spec = node.spec
+        if spec.mandatory:
+            missing = [name for name in spec.mandatory
+                       if name not in node.seen and not (config and not spec.children[name].config)]
+            if missing:
+                errors.append((spec.keypath, f"mandatory leaf 누락: {', '.join(missing)}"))
+        if spec.keys:
+            key = tuple(node.values.get(name) for name in spec.keys)
+            if None in key:
+                errors.append((spec.keypath, f"list key 누락: {' '.join(spec.keys)}"))
+                return
+            seen = parent.entries.get(spec.name)
+            if seen is None:
+                seen = parent.entries[spec.name] = set()
+            if key in seen:
+                errors.append((spec.keypath, f"list key 중복: {' '.join(key)}"))
+            seen.add(key)
+
+    @staticmethod
+    def _leaf(spec, parent, value, errors):
+        check = spec.check
+        if check is not None:
+            error = check.check(value)
+            if error is not None:
+                errors.append((spec.keypath, error))
+        if spec.name in parent.spec.keys:
+            parent.values[spec.name] = value
+
+    def validate_xml(self, source, config=False):
+        """XML 문서 (경로 또는 파일 객체) 를 iterparse 로 스트리밍하며 검사
+
+        최상위가 <config>/<data> 면 그 자식들을 최상위 노드로 본다. container/list 가
+        끝나면 부모 요소 (감싸는 요소 포함) 를 비워, 문서 크기와 무관하게 현재 경로의
+        요소만 메모리에 둔다.
+        """
+        errors = []
+        document = _Frame(_DOCUMENT)
+        stack = [document]
+        # 요소 이름 -> (namespace, 로컬 이름)
+        tags = {}
+        # 검사를 건너뛰는 서브트리 깊이 (스키마에 없는 노드 아래)
+        skipped = 0
+        try:
+            for event, elem in ET.iterparse(source, events=('start', 'end')):
+                if event == 'start':
+                    if skipped:
+                        skipped += 1
+                        continue
+                    tag = elem.tag
+                    split = tags.get(tag)
+                    if split is None:
+                        namespace, _, local = tag[1:].rpartition('}') if tag[0] == '{' else ('', '', tag)
+                        split = tags[tag] = (namespace, local)
+                    namespace, local = split
+                    frame = stack[-1]
+                    if frame.__class__ is NodeSpec:
+                        # leaf 아래 요소
+                        errors.append((f"{frame.keypath}/{local}", "스키마에 없는 노드"))
+                        skipped = 1
+                        continue
+                    if frame.spec is _DOCUMENT:
+                        module = self.namespaces.get(namespace, namespace)
+                        spec = self._top_spec(module, local)
+                        if spec is None and frame is document and local in WRAPPERS \
+                                and len(stack) == 1 and not document.seen:
+                            stack.append(_Frame(_DOCUMENT, elem))
+                            continue
+                        path = lambda: f"{module}/{local}" if module else local
+                    else:
+                        spec = frame.spec.children.get(local)
+                        path = lambda: f"{frame.spec.keypath}/{local}"
+                    if not self._enter(frame, spec, path, config, errors):
+                        skipped = 1
+                    elif spec.kind in _LEAF_KINDS:
+                        stack.append(spec)
+                    else:
+                        stack.append(_Frame(spec, elem))
+                    continue
+
+                if skipped:
+                    skipped -= 1
+                    continue
+                if len(stack) == 1:
+                    continue
+                node = stack.pop()
+                parent = stack[-1]
+                if node.__class__ is NodeSpec:
+                    text = elem.text
+                    self._leaf(node, parent, text.strip() if text else '', errors)
+                    # leaf 는 부모가 끝날 때 함께 비우고, 감싸는 요소 바로 아래면 지금 뺌
+                    if parent.spec is _DOCUMENT and parent.elem is not None:
+                        parent.elem.clear()
+                elif node.spec is not _DOCUMENT:
+                    self._leave(node, parent, config, errors)
+                    elem.clear()
+                    if parent.elem is not None:
+                        parent.elem.clear()
+        except ET.ParseError as e:
+            errors.append(('', f"XML 파싱 오류: {e}"))
+        return errors
+
+    def validate_json(self, document, config=False):
+        """RFC 7951 JSON 문서 (dict) 검사 ('module:name' 최상위, 다른 모듈 자식은 prefix 무시)"""
+        errors = []
+        if len(document) == 1:
+            (name, value), = document.items()
+            if name.split(':')[-1] in WRAPPERS and isinstance(value, dict):
+                document = value
+
+        top = _Frame(_DOCUMENT)
+        for name, value in document.items():
+            module, _, local = name.rpartition(':')
+            self._json_node(top, self._top_spec(module, local), lambda: f"{module}/{local}",
+                            value, config, errors)
+        return errors
+
+    def _json_node(self, frame, spec, path, value, config, errors):
+        if not self._enter(frame, spec, path, config, errors):
+            return
+        kind = spec.kind
+        if kind == 'leaf':
+            self._leaf(spec, frame, _json_scalar(value), errors)
+        elif kind == 'leaf-list':
+            if not isinstance(value, list):
+                errors.append((spec.keypath, "leaf-list 는 배열이어야 함"))
+                return
+            for item in value:
+                self._leaf(spec, frame, _json_scalar(item), errors)
+        elif kind == 'container':
+            self._json_children(_Frame(spec), frame, value, config, errors)
+        elif isinstance(value, list):
+            for entry in value:
+                self._json_children(_Frame(spec), frame, entry, config, errors)
+        else:
+            errors.append((spec.keypath, "list 는 배열이어야 함"))
+
+    def _json_children(self, node, parent, value, config, errors):
+        spec = node.spec
+        if not isinstance(value, dict):
+            errors.append((spec.keypath, f"{spec.kind} 는 객체여야 함"))
+            return
+        children = spec.children
+        for name, child in value.items():
+            local = name.rpartition(':')[2]
+            self._json_node(node, children.get(local), lambda: f"{spec.keypath}/{local}", child,
+                            config, errors)
+        self._leave(node, parent, config, errors)
+
+    def validate_file(self, filepath, config=False):
+        """.json 은 RFC 7951 JSON, 그 외는 XML 로 검사"""
+        if filepath.endswith('.json'):
+            try:
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    document = json.load(f)
+            except ValueError as e:
+                return [('', f"JSON 파싱 오류: {e}")]
+            if not isinstance(document, dict):
+                return [('', "최상위는 JSON 객체여야 함")]
+            return self.validate_json(document, config)
+        return self.validate_xml(filepath, config)
+
+
+_worker_validator = None
+
+
+def _init_worker(validator):
+    global _worker_validator
+    _worker_validator = validator
+
+
+def _validate_in_worker(task):
+    filepath, config = task
+    return filepath, _worker_validator.validate_file(filepath, config)
+
+
+def validate_files(validator, filepaths, workers=None, config=False):
+    """여러 문서를 검사해 [(경로, 오류 목록)] 을 입력 순서로 반환
+
+    workers 가 있으면 컴파일된 검증기를 워커마다 한 번만 넘기고 문서를 나눠 검사한다.
+    """
+    if not workers:
+        return [(filepath, validator.validate_file(filepath, config)) for filepath in filepaths]
+    tasks = [(filepath, config) for filepath in filepaths]
+    chunksize = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(validator,)) as pool:
+        return list(pool.map(_validate_in_worker, tasks, chunksize=chunksize))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='YANG 스키마로 XML/JSON 인스턴스 문서 검사')
+    parser.add_argument('directory', help='YANG 파일 디렉터리, zip 아카이브 또는 아카이브 디렉터리')
+    parser.add_argument('documents', nargs='+', help='검사할 문서 (.json 은 RFC 7951, 그 외 XML)')
+    parser.add_argument('--config', action='store_true',
+                        help='설정 문서로 검사 (config false 노드가 있으면 오류)')
+    parser.add_argument('--workers', type=int, default=None, help='검사 프로세스 수')
+    args = parser.parse_args()
+
+    validator = SchemaValidator.from_directory(args.directory)
+    print(f"제약 {len(validator.nodes)}개 컴파일 완료", file=sys.stderr)
+
+    failed = 0
+    for filepath, errors in validate_files(validator, args.documents, args.workers, args.config):
+        if errors:
+            failed += 1
+        for keypath, message in errors:
+            print(f"{filepath}: {keypath or '-'}: {message}")
+    print(f"{len(args.documents)}개 문서 중 {failed}개 오류", file=sys.stderr)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+YANG 디렉터리 watch 모드
+
+처음 한 번 전체를 추출한 뒤, 파일이 바뀌면 그 파일에 의존하는 모듈만 다시
+파싱/검증/추출하고 세 출력 파일을 갱신한다.
+
+pyang 은 검증된 컨텍스트에서 augment 를 되돌릴 수 없으므로, 메모리에 유지하는 것은
+모듈 헤더로 만든 의존성 그래프와 모듈별 추출 결과이며, 바뀐 모듈 그룹의
+컨텍스트만 새로 만든다.
+
+사용법:
+    python3 yang_watch.py ./oru [--interval 0.5]
+"""
+
+import argparse
+import os
+import time
+
+import yang_parsor
+
+
+class YangWatcher:
+    """디렉터리 변경을 감지해 영향받는 모듈만 다시 추출"""
+
+    def __init__(self, directory,
+                 output_node='yang_output.txt',
+                 output_rpc='yang_rpc.txt',
+                 output_notif='yang_notification.txt',
+                 output_format='text'):
+        self.directory = directory
+        self.outputs = (output_node, output_rpc, output_notif)
+        self.output_format = output_format
+        self.headers = {}
+        self.results = {}
+        self.snapshot = {}
+
+    def _snapshot(self):
+        snapshot = {}
+        for filename in os.listdir(self.directory):
+            if filename.endswith('.yang'):
+                stat = os.stat(os.path.join(self.directory, filename))
+                snapshot[filename] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def _extract(self, only=None):
+        groups = yang_parsor.group_modules_by_closure(self.directory, self.headers, only=only)
+        tasks = yang_parsor.pack_groups(groups, 1)
+        return yang_parsor.run_groups(self.directory, tasks, output_format=self.output_format)
+
+    def _dependencies(self):
+        closures = yang_parsor.module_closures(self.headers)
+        return yang_parsor.module_dependency_files(self.headers, closures)
+
+    def build(self):
+        """전체 추출 후 출력 파일 작성"""
+        self.snapshot = self._snapshot()
+        self.headers = yang_parsor.scan_yang_directory(self.directory)
+        self.results = self._extract()
+        self.write()
+
+    def update(self, changed):
+        """바뀐 파일 목록을 반영하고 다시 추출한 모듈 집합을 반환"""
+        old_dependencies = self._dependencies()
+        for filename in changed:
+            if os.path.exists(os.path.join(self.directory, filename)):
+                self.headers[filename] = yang_parsor.scan_yang_file(self.directory, filename)
+            else:
+                self.headers.pop(filename, None)
+                self.results.pop(filename, None)
+        new_dependencies = self._dependencies()
+
+        # 변경 전후 어느 쪽 의존성 그래프에서든 바뀐 파일에 닿는 모듈
+        affected = set()
+        for dependencies in (old_dependencies, new_dependencies):
+            for filename, files in dependencies.items():
+                if filename in self.headers and files & changed:
+                    affected.add(filename)
+
+        for filename in affected:
+            self.results.pop(filename, None)
+        if affected:
+            self.results.update(self._extract(only=affected))
+        self.write()
+        return affected
+
+    def poll(self):
+        """mtime/크기가 바뀐 파일이 있으면 update 하고 다시 추출한 모듈 집합을 반환"""
+        snapshot = self._snapshot()
+        changed = {filename for filename in set(snapshot) | set(self.snapshot)
+                   if snapshot.get(filename) != self.snapshot.get(filename)}
+        self.snapshot = snapshot
+        return self.update(changed) if changed else set()
+
+    def write(self):
+        entries = yang_parsor.collect_entries(self.results, list(self.headers))
+        labels = ('노드 정보', 'RPC', 'Notification')
+        for filepath, label, kind_entries in zip(self.outputs, labels, entries):
+            writer = yang_parsor.EntryWriter(filepath, label, output_format=self.output_format)
+            try:
+                writer.write(kind_entries)
+            finally:
+                writer.close()
+
+    def run(self, interval=0.5):
+        self.build()
+        print(f"감시 중: {self.directory} (Ctrl+C 로 종료)")
+        try:
+            while True:
+                time.sleep(interval)
+                start = time.perf_counter()
+                affected = self.poll()
+                if affected:
+                    elapsed = time.perf_counter() - start
+                    print(f"재추출 {len(affected)}개 모듈 ({elapsed:.3f}s): {', '.join(sorted(affected))}")
+        except KeyboardInterrupt:
+            pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description='YANG 디렉터리 변경 감시 및 증분 추출')
+    parser.add_argument('directory', nargs='?', default='./oru')
+    parser.add_argument('--format', choices=yang_parsor.OUTPUT_FORMATS, default='text')
+    parser.add_argument('--interval', type=float, default=0.5, help='변경 확인 주기 (초)')
+    args = parser.parse_args()
+
+    ext = 'jsonl' if args.format == 'jsonl' else 'txt'
+    watcher = YangWatcher(args.directory,
+                          f'yang_output.{ext}',
+                          f'yang_rpc.{ext}',
+                          f'yang_notification.{ext}',
+                          output_format=args.format)
+    watcher.run(args.interval)
+
+
+if __name__ == "__main__":
+    main()